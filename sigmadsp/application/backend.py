@@ -7,11 +7,15 @@ Commands from Sigma Studio are received, and translated to SPI read/write reques
 """
 import argparse
 import logging
+import math
+import queue
 import sched
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Set, Union
 
 import grpc
 from retry import retry
@@ -23,19 +27,43 @@ from sigmadsp.communication.base import (
     SafeloadRequest,
     WriteRequest,
 )
+from sigmadsp.communication.sigma_asyncio_server import SigmaStudioAsyncServer
 from sigmadsp.communication.sigma_tcp_server import SigmaStudioInterface
 from sigmadsp.generated.backend_service.control_pb2 import (
     ControlParameterRequest,
     ControlRequest,
     ControlResponse,
 )
+from sigmadsp.generated.backend_service.control_pb2 import Curve as RampCurve
+from sigmadsp.generated.backend_service.control_pb2 import (
+    MeterReadings,
+    MetersRequest,
+    MeterValue,
+    MetricsRequest,
+    MetricsResponse,
+)
 from sigmadsp.generated.backend_service.control_pb2_grpc import (
     BackendServicer,
     add_BackendServicer_to_server,
 )
 from sigmadsp.hardware.adau14xx import Adau14xx
 from sigmadsp.hardware.adau1701 import Adau1701
-from sigmadsp.hardware.dsp import ConfigurationError, Dsp, SafetyCheckException
+from sigmadsp.hardware.base_protocol import BaseProtocol, Priority
+from sigmadsp.hardware.dsp import (
+    ConfigurationError,
+    Dsp,
+    HandlerKey,
+    InputPin,
+    Pin,
+    SafetyCheckException,
+)
+from sigmadsp.hardware.gpio_events import GpioEventBus, PinEvent
+from sigmadsp.hardware.polling import MeterPoller
+from sigmadsp.hardware.ramp import Curve, RampEngine
+from sigmadsp.hardware.snapshot import Snapshot, SnapshotError
+from sigmadsp.helper.conversion import clamp, db_to_linear
+from sigmadsp.helper.export import ExportError, parse_export
+from sigmadsp.helper.parser import Cell
 from sigmadsp.helper.settings import SigmadspSettings
 
 # A logger for this module
@@ -48,8 +76,37 @@ class BackendService(BackendServicer):
     This service also reacts to rpyc remote procedure calls, for performing actions with the DSP over SPI.
     """
 
+    # The primary DSP, which the parameter file and control requests refer to
     dsp: Dsp
 
+    # All DSPs, by the chip address that SigmaStudio uses for them
+    dsps: Dict[int, Dsp]
+
+    # The chip address of DSPs, whose definition does not specify one
+    DEFAULT_CHIP_ADDRESS = 1
+
+    # The time in seconds that the scheduler thread waits, when no events are scheduled
+    SCHEDULER_IDLE_S = 0.01
+
+    # The largest number of SigmaStudio writes that the worker submits, before waiting for the oldest one
+    MAX_PENDING_WRITES = 64
+
+    # The implementations of the SigmaStudio server, selected by "host.server"
+    SERVER_TYPES = ("threaded", "asyncio")
+
+    # The duration of volume ramps for muting and unmuting, in seconds, which avoids clicks
+    MUTE_RAMP_S = 0.02
+
+    # The actions that input pins can trigger, where "restore_snapshot" takes the snapshot path as an argument
+    PIN_ACTIONS = ("mute", "unmute", "soft_reset", "hard_reset", "restore_snapshot")
+
+    # The ramp curves by their identifier in control requests
+    RAMP_CURVES = {
+        RampCurve.LINEAR: Curve.LINEAR,
+        RampCurve.DB_LINEAR: Curve.DB_LINEAR,
+        RampCurve.S_CURVE: Curve.S_CURVE,
+    }
+
     def __init__(self, settings: SigmadspSettings):
         """Initialize service and start all relevant threads (TCP, SPI).
 
@@ -64,41 +121,106 @@ class BackendService(BackendServicer):
         self.settings = settings
 
         config = self.settings.config
-        dsp_type = config["dsp"]["type"]
-        dsp_protocol = config["dsp"].get("protocol", "spi")
 
-        # Create a SigmaTCPServer, along with its various threads
-        self.sigma_tcp_server = SigmaStudioInterface(
-            config["host"]["ip"],
-            config["host"]["port"],
-            dsp_type,
-        )
-        logger.info("Sigma TCP server started on [%s]:%d.", config["host"]["ip"], config["host"]["port"])
+        # The DSP configuration is either a single DSP definition, or a list of them.
+        dsp_definitions: List[dict] = config["dsp"] if isinstance(config["dsp"], list) else [config["dsp"]]
+        dsp_type = dsp_definitions[0]["type"]
 
-        # Create a scheduler for recurring tasks
-        self.scheduler = sched.scheduler(time.time, time.sleep)
+        if any(dsp_definition["type"] != dsp_type for dsp_definition in dsp_definitions):
+            logger.error("All DSPs must be of the same type! Aborting.")
+            sys.exit(1)
 
-        # Create the worker thread for the handler itself
-        worker_thread = threading.Thread(target=self.worker, name="Backend service worker thread")
-        worker_thread.daemon = True
-        worker_thread.start()
+        # The threaded server relays requests through pipes to the worker thread, while the asyncio server submits them
+        # to the DSPs directly.
+        server_type = config["host"].get("server", "threaded")
 
-        logger.info("Specified DSP type is '%s', using the '%s' protocol.", dsp_type, dsp_protocol)
+        if server_type not in BackendService.SERVER_TYPES:
+            logger.error("Server type '%s' is not known! Aborting.", server_type)
+            sys.exit(1)
 
-        try:
-            if dsp_type == "adau14xx":
-                self.dsp = Adau14xx(self.settings.config)
+        # The DSPs are created first, such that no thread can submit requests to them, before they exist.
+        self.dsps = {}
 
-            elif dsp_type == "adau1701":
-                self.dsp = Adau1701(self.settings.config)
+        # DSPs share protocol handlers on the same protocol, bus and device, and pins with the same number.
+        shared_handlers: Dict[HandlerKey, BaseProtocol] = {}
+        shared_pins: Dict[int, Pin] = {}
 
-            else:
-                logger.error("DSP type '%s' is not known! Aborting.", dsp_type)
+        for dsp_definition in dsp_definitions:
+            chip_address = int(dsp_definition.get("chip_address", BackendService.DEFAULT_CHIP_ADDRESS))
+
+            if chip_address in self.dsps:
+                logger.error("Chip address %d is used by more than one DSP! Aborting.", chip_address)
                 sys.exit(1)
 
-        except ConfigurationError:
-            logger.error("DSP configuration is broken! Aborting")
-            sys.exit(1)
+            try:
+                dsp = self.create_dsp({**config, "dsp": dsp_definition}, shared_handlers, shared_pins)
+
+            except ConfigurationError:
+                logger.error("DSP configuration is broken! Aborting")
+                sys.exit(1)
+
+            logger.info(
+                "Specified DSP type is '%s' with chip address %d, using the '%s' protocol on bus %d, device %d.",
+                dsp.type,
+                chip_address,
+                dsp.protocol,
+                dsp.bus,
+                dsp.address,
+            )
+            self.dsps[chip_address] = dsp
+
+        self.dsp = next(iter(self.dsps.values()))
+
+        # Create a scheduler for recurring tasks, and the thread that runs it
+        self.scheduler = sched.scheduler(time.time, time.sleep)
+
+        scheduler_thread = threading.Thread(target=self.run_scheduler, name="Backend scheduler thread")
+        scheduler_thread.daemon = True
+        scheduler_thread.start()
+
+        if "threaded" == server_type:
+            # Create a SigmaTCPServer, along with its various threads
+            self.sigma_tcp_server = SigmaStudioInterface(
+                config["host"]["ip"],
+                config["host"]["port"],
+                dsp_type,
+            )
+            logger.info("Sigma TCP server started on [%s]:%d.", config["host"]["ip"], config["host"]["port"])
+
+            # Create the worker thread for the handler itself
+            worker_thread = threading.Thread(target=self.worker, name="Backend service worker thread")
+            worker_thread.daemon = True
+            worker_thread.start()
+
+        elif "asyncio" == server_type:
+            self.sigma_async_server = SigmaStudioAsyncServer(
+                config["host"]["ip"], config["host"]["port"], dsp_type, self.submit_request
+            )
+            logger.info("Sigma asyncio server started on [%s]:%d.", config["host"]["ip"], config["host"]["port"])
+
+        # Parameter ramps and meter polls run on the scheduler. Ramps are per DSP, meters apply to the primary DSP.
+        self.ramp_engines: Dict[Dsp, RampEngine] = {dsp: RampEngine(dsp, self.scheduler) for dsp in self.dsps.values()}
+
+        self.meter_poller: Optional[MeterPoller] = None
+        self.create_meter_poller()
+
+        # Volumes by parameter address from before muting, for every muted DSP
+        self.muted_volumes: Dict[Dsp, Dict[int, float]] = {}
+
+        # Input pins trigger actions through the event bus.
+        self.gpio_event_bus = GpioEventBus()
+
+        # Shared pins are attached once, and trigger the actions of every DSP that defines them.
+        attached_pins: Set[int] = set()
+
+        for dsp in self.dsps.values():
+            for pin in dsp.pins:
+                if isinstance(pin, InputPin) and (pin.on_active or pin.on_inactive):
+                    if pin.number not in attached_pins:
+                        attached_pins.add(pin.number)
+                        self.gpio_event_bus.attach(pin)
+
+                    self.gpio_event_bus.subscribe(pin.name, self.pin_event_handler(dsp, pin))
 
         try:
             logger.info("Run startup safety check.")
@@ -107,6 +229,126 @@ class BackendService(BackendServicer):
         except SafetyCheckException:
             logger.warning("Startup safety check failed.")
 
+    @staticmethod
+    def create_dsp(
+        config: dict,
+        shared_handlers: Optional[Dict[HandlerKey, BaseProtocol]] = None,
+        shared_pins: Optional[Dict[int, Pin]] = None,
+    ) -> Dsp:
+        """Create a DSP object from a configuration, which contains a single DSP definition.
+
+        Args:
+            config (dict): The configuration.
+            shared_handlers (Optional[Dict[HandlerKey, BaseProtocol]], optional): Protocol handlers that the DSP may
+                share with others. Defaults to None.
+            shared_pins (Optional[Dict[int, Pin]], optional): Pins by number that the DSP may share with others.
+                Defaults to None.
+
+        Returns:
+            Dsp: The DSP object.
+        """
+        dsp_type = config["dsp"]["type"]
+
+        if dsp_type == "adau14xx":
+            return Adau14xx(config, shared_handlers, shared_pins)
+
+        if dsp_type == "adau1701":
+            return Adau1701(config, shared_handlers, shared_pins)
+
+        logger.error("DSP type '%s' is not known! Aborting.", dsp_type)
+        sys.exit(1)
+
+    def route(self, chip_address: int) -> Union[Dsp, None]:
+        """Find the DSP that SigmaStudio addresses with a chip address.
+
+        With a single DSP, all requests are routed to it, regardless of the chip address.
+
+        Args:
+            chip_address (int): The chip address.
+
+        Returns:
+            Union[Dsp, None]: The DSP, or None, if no DSP has this chip address.
+        """
+        if len(self.dsps) == 1:
+            return self.dsp
+
+        return self.dsps.get(chip_address)
+
+    def create_meter_poller(self):
+        """Create the poller for the meter cells of the parameter file, if there are any."""
+        self.meter_poller = None
+
+        if not self.settings.parameter_parser or not self.settings.parameter_parser.meter_cells:
+            return
+
+        meter_rate_hz = float(self.settings.config["backend"].get("meter_rate_hz", MeterPoller.RATE_HZ))
+        self.meter_poller = MeterPoller(
+            self.dsp, self.scheduler, self.settings.parameter_parser.meter_cells, rate_hz=meter_rate_hz
+        )
+
+    def pin_event_handler(self, dsp: Dsp, pin: InputPin) -> Callable[[PinEvent], None]:
+        """Create a handler that runs the configured actions of an input pin.
+
+        Args:
+            dsp (Dsp): The DSP that the pin belongs to.
+            pin (InputPin): The pin.
+
+        Returns:
+            Callable[[PinEvent], None]: The handler for the events of the pin.
+        """
+        for action in (pin.on_active, pin.on_inactive):
+            if action and action.split(":", 1)[0] not in BackendService.PIN_ACTIONS:
+                logger.error("Unknown action '%s' for input pin '%s'.", action, pin.name)
+
+        def handle(event: PinEvent):
+            """Run the action for the edge, if any."""
+            action = pin.on_active if event.active else pin.on_inactive
+
+            if action:
+                logger.info("Input pin '%s' became %s.", pin.name, "active" if event.active else "inactive")
+                self.run_pin_action(dsp, action)
+
+        return handle
+
+    def run_pin_action(self, dsp: Dsp, action: str):
+        """Run an action that was triggered by an input pin.
+
+        Args:
+            dsp (Dsp): The DSP that the pin belongs to.
+            action (str): The action, see `PIN_ACTIONS`.
+        """
+        name, _, argument = action.partition(":")
+
+        if "soft_reset" == name:
+            dsp.soft_reset()
+
+        elif "hard_reset" == name:
+            dsp.hard_reset()
+
+        elif "restore_snapshot" == name:
+            dsp.restore(Snapshot.load(argument))
+
+        elif name in ("mute", "unmute"):
+            if not self.settings.parameter_parser or not self.configuration_unlocked:
+                logger.warning("Configuration locked, cannot %s.", name)
+                return
+
+            if "mute" == name and dsp not in self.muted_volumes:
+                muted_volumes: Dict[int, float] = {}
+
+                for volume_cell in self.settings.parameter_parser.volume_cells:
+                    volume = dsp.get_parameter_value(volume_cell.parameter_address, "float", cached=True)
+                    muted_volumes[volume_cell.parameter_address] = float(volume or 0.0)
+
+                self.muted_volumes[dsp] = muted_volumes
+                self.ramp_engines[dsp].ramp({address: 0.0 for address in muted_volumes}, BackendService.MUTE_RAMP_S)
+
+            elif "unmute" == name and dsp in self.muted_volumes:
+                self.ramp_engines[dsp].ramp(self.muted_volumes.pop(dsp), BackendService.MUTE_RAMP_S)
+
+        else:
+            logger.warning("Unknown action '%s'.", action)
+
     @retry(SafetyCheckException, 5, 5)
     def startup_safety_check(self) -> None:
         """Perform startup safety check, retrying a few times.
@@ -132,7 +374,7 @@ class BackendService(BackendServicer):
             self.configuration_unlocked = False
 
         else:
-            dsp_hash = self.dsp.get_parameter_value(safety_hash_cell.parameter_address, data_format="int")
+            dsp_hash = self.dsp.get_parameter_value(safety_hash_cell.parameter_address, data_format="int", cached=True)
             logger.info("Safety hash address: 0x%04x.", safety_hash_cell.parameter_address)
 
             if safety_hash_cell.parameter_value != dsp_hash:
@@ -148,26 +390,91 @@ class BackendService(BackendServicer):
                 logger.info("Safety check successful. Configuration unlocked.")
                 self.configuration_unlocked = True
 
+    def run_scheduler(self):
+        """Run the events of the scheduler, and wait for new ones, whenever none are scheduled."""
+        while True:
+            self.scheduler.run()
+            time.sleep(BackendService.SCHEDULER_IDLE_S)
+
     def worker(self):
         """Main worker functionality.
 
-        Gets requests from the TCP server component and forwards them to the SPI handler.
+        Gets requests from the TCP server component and forwards them to the SPI handler of the addressed DSP.
+        SigmaStudio requests are queued behind control requests, such that those stay responsive during downloads.
+        Writes to DSPs on different buses proceed in parallel, since each DSP has its own protocol handler thread.
+        At most `MAX_PENDING_WRITES` writes are pending, such that downloads are throttled to the speed of the bus.
         """
+        pending_writes: Deque[Future] = deque()
+
         while True:
             request = self.sigma_tcp_server.pipe_end_user.recv()
 
-            if isinstance(request, WriteRequest):
-                self.dsp.write(request.address, request.data)
+            try:
+                future = self.submit_request(request)
 
-            elif isinstance(request, SafeloadRequest):
-                self.dsp.safeload(request.address, request.data)
+                if isinstance(request, ReadRequest):
+                    self.sigma_tcp_server.pipe_end_user.send(ReadResponse(future.result()))
 
-            elif isinstance(request, ReadRequest):
-                payload = self.dsp.read(request.address, request.length)
+                else:
+                    pending_writes.append(future)
 
-                self.sigma_tcp_server.pipe_end_user.send(ReadResponse(payload))
-            else:
-                raise TypeError(f"Unknown command type {type(request)}.")
+                while len(pending_writes) > BackendService.MAX_PENDING_WRITES:
+                    # Failed writes were logged by the protocol handler already.
+                    pending_writes.popleft().exception()
+
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("SigmaStudio request failed: %s", e)
+
+                # The connection waits for a response to every read request, even if it failed.
+                if isinstance(request, ReadRequest):
+                    self.sigma_tcp_server.pipe_end_user.send(ReadResponse(b"", success=False))
+
+    def submit_request(self, request: Union[WriteRequest, ReadRequest]) -> Future:
+        """Submit a request from SigmaStudio to the addressed DSP, without waiting for it to complete.
+
+        Args:
+            request (Union[WriteRequest, ReadRequest]): The request.
+
+        Raises:
+            TypeError: If the request type is unknown.
+
+        Returns:
+            Future: The future of the request, which resolves to the data that was read for read requests.
+        """
+        dsp = self.route(request.chip_address)
+        future: Optional[Future] = None
+
+        if dsp is None:
+            logger.warning("No DSP has the chip address %d, ignoring request.", request.chip_address)
+
+            if isinstance(request, ReadRequest):
+                future = Future()
+                future.set_result(bytes(request.length))
+
+                return future
+
+        else:
+            with dsp.priority(Priority.SIGMASTUDIO):
+                # Safeload requests are write requests as well, so they have to be checked first.
+                if isinstance(request, SafeloadRequest):
+                    future = dsp.safeload(request.address, request.data)
+
+                elif isinstance(request, WriteRequest):
+                    # Consecutive plain writes from SigmaStudio may be merged into larger bus transfers.
+                    future = dsp.write(request.address, request.data, coalesce=True)
+
+                elif isinstance(request, ReadRequest):
+                    return dsp.read_async(request.address, request.length)
+
+                else:
+                    raise TypeError(f"Unknown command type {type(request)}.")
+
+        if future is None:
+            # Nothing was written, e.g. an empty safeload.
+            future = Future()
+            future.set_result(None)
+
+        return future
 
     def control_parameter(self, request: ControlParameterRequest, context):
         """Main backend entry point for control messages that change or read parameters.
@@ -224,6 +531,33 @@ class BackendService(BackendServicer):
 
                 response.message = f"Set volume of cell '{volume_cell.full_name}' to {new_volume_db:.2f} dB."
 
+        elif "ramp_volume" == command:
+            duration_s = request.ramp_volume.duration_s
+
+            if not math.isfinite(duration_s) or duration_s < 0:
+                response.message = f"Invalid ramp duration {duration_s} s."
+                return response
+
+            targets: Dict[int, float] = {}
+
+            for target in request.ramp_volume.targets:
+                volume_cells_to_ramp = self.settings.parameter_parser.get_matching_cells_by_name_tokens(
+                    self.settings.parameter_parser.volume_cells, list(target.name_tokens)
+                )
+
+                if not volume_cells_to_ramp:
+                    response.message = f"No volume cell identified by {target.name_tokens} was found."
+                    return response
+
+                for volume_cell in volume_cells_to_ramp:
+                    # Clamp volume to safe levels
+                    targets[volume_cell.parameter_address] = clamp(db_to_linear(target.value_db), 0, 1)
+
+            curve = BackendService.RAMP_CURVES.get(request.ramp_volume.curve, Curve.LINEAR)
+            self.ramp_engines[self.dsp].ramp(targets, duration_s, curve)
+
+            response.message = f"Ramping {len(targets)} volume cell(s) over {duration_s:.2f} s ({curve.value})."
+
         response.success = True
         return response
 
@@ -243,17 +577,22 @@ class BackendService(BackendServicer):
         command = request.WhichOneof("command")
 
         if "reset_dsp" == command:
-            self.dsp.soft_reset()
+            for dsp in self.dsps.values():
+                dsp.soft_reset()
+
             response.message = "Soft-reset DSP."
             response.success = True
 
         elif "hard_reset_dsp" == command:
-            self.dsp.hard_reset()
+            for dsp in self.dsps.values():
+                dsp.hard_reset()
+
             response.message = "Hard-reset DSP."
             response.success = True
 
         elif "load_parameters" == command:
             self.settings.store_parameters(list(request.load_parameters.content))
+            self.create_meter_poller()
 
             # Repeat safety check after loading a new set of parameters
             try:
@@ -270,8 +609,156 @@ class BackendService(BackendServicer):
                 response.message = "Safety check failed, parameters cannot be adjusted."
                 response.success = False
 
+        elif "deploy_program" == command:
+            deploy_program = request.deploy_program
+            dsp = self.dsp if not deploy_program.chip_address else self.route(deploy_program.chip_address)
+
+            if dsp is None:
+                response.message = f"No DSP has the chip address {deploy_program.chip_address}."
+                response.success = False
+                return response
+
+            try:
+                writes = parse_export(deploy_program.tx_buffer, deploy_program.num_bytes)
+
+            except ExportError as e:
+                response.message = f"Cannot deploy the program: {e}"
+                response.success = False
+                return response
+
+            try:
+                written_regions = dsp.deploy(writes, deploy_program.force)
+
+            except OSError as e:
+                response.message = f"Cannot deploy the program: {e}"
+                response.success = False
+                return response
+
+            # Repeat safety check with the new program
+            try:
+                self.safety_check()
+
+            except SafetyCheckException:
+                pass
+
+            response.message = f"Deployed program, written regions: {', '.join(written_regions) or 'none'}."
+            response.success = True
+
+        elif "save_snapshot" == command:
+            try:
+                self.dsp.snapshot().save(request.save_snapshot)
+
+            except OSError as e:
+                response.message = f"Cannot save the snapshot: {e}"
+                response.success = False
+                return response
+
+            response.message = f"Saved snapshot to {request.save_snapshot}."
+            response.success = True
+
+        elif "restore_snapshot" == command:
+            try:
+                self.dsp.restore(Snapshot.load(request.restore_snapshot))
+
+            except (OSError, SnapshotError) as e:
+                response.message = f"Cannot restore the snapshot: {e}"
+                response.success = False
+                return response
+
+            # Repeat safety check with the restored program
+            try:
+                self.safety_check()
+
+            except SafetyCheckException:
+                pass
+
+            response.message = f"Restored snapshot from {request.restore_snapshot}."
+            response.success = True
+
         return response
 
+    def metrics(self, request: MetricsRequest, context) -> MetricsResponse:
+        """Backend entry point for querying the bus metrics of all DSPs.
+
+        Args:
+            request (MetricsRequest): The request that the backend shall handle (unused).
+            context (Any): The context within which to handle the request (unused).
+
+        Returns:
+            MetricsResponse: The metrics, one entry per DSP.
+        """
+        response = MetricsResponse()
+
+        for chip_address, dsp in self.dsps.items():
+            snapshot = dsp.protocol_handler.metrics.snapshot()
+
+            dsp_metrics = response.dsps.add()
+            dsp_metrics.chip_address = chip_address
+            dsp_metrics.utilization = snapshot.utilization
+
+            for name, summary in snapshot.latencies.items():
+                dsp_metrics.latencies.add(
+                    name=name,
+                    count=summary.count,
+                    mean_us=summary.mean_us,
+                    p50_us=summary.p50_us,
+                    p90_us=summary.p90_us,
+                    p99_us=summary.p99_us,
+                    max_us=summary.max_us,
+                )
+
+            for name, value in snapshot.counters.items():
+                dsp_metrics.counters.add(name=name, value=value)
+
+        return response
+
+    def meters(self, request: MetersRequest, context) -> Iterator[MeterReadings]:
+        """Backend entry point for streaming the values of all meter cells, once per poll.
+
+        Polls are skipped for clients that do not keep up.
+
+        Args:
+            request (MetersRequest): The request that the backend shall handle (unused).
+            context (Any): The context of the stream, which ends when the client disconnects.
+
+        Yields:
+            Iterator[MeterReadings]: The values of all meter cells, per poll.
+        """
+        meter_poller = self.meter_poller
+
+        if meter_poller is None:
+            return
+
+        readings: "queue.Queue[Dict[Cell, float]]" = queue.Queue(maxsize=1)
+
+        def receive(values: Dict[Cell, float]):
+            """Keep the values for sending, unless the previous ones were not sent yet."""
+            try:
+                readings.put_nowait(values)
+
+            except queue.Full:
+                pass
+
+        meter_poller.subscribe(receive)
+
+        try:
+            while context.is_active():
+                try:
+                    values = readings.get(timeout=1)
+
+                except queue.Empty:
+                    continue
+
+                yield MeterReadings(
+                    values=[
+                        MeterValue(name=cell.full_name, address=cell.parameter_address, value=value)
+                        for cell, value in values.items()
+                    ]
+                )
+
+        finally:
+            meter_poller.unsubscribe(receive)
+
 
 def launch(settings: SigmadspSettings):
     """Launch the backend application.
@@ -4,6 +4,7 @@ It can control the backend via the command line.
 """
 import argparse
 import logging
+import os
 from typing import Union
 
 import grpc
@@ -12,6 +13,9 @@ from sigmadsp.generated.backend_service.control_pb2 import (
     ControlParameterRequest,
     ControlRequest,
     ControlResponse,
+    Curve,
+    MetersRequest,
+    MetricsRequest,
 )
 from sigmadsp.generated.backend_service.control_pb2_grpc import BackendStub
 
@@ -54,6 +58,30 @@ def main():
         help="Sets the volume to a certain value in dB (zero or lower).",
     )
 
+    argument_parser.add_argument(
+        "-rv",
+        "--ramp_volume",
+        required=False,
+        type=float,
+        help="Ramps the volume smoothly to a certain value in dB (zero or lower).",
+    )
+
+    argument_parser.add_argument(
+        "--ramp_time",
+        required=False,
+        type=float,
+        default=1.0,
+        help="The duration of a volume ramp in seconds.",
+    )
+
+    argument_parser.add_argument(
+        "--ramp_curve",
+        required=False,
+        choices=["linear", "db_linear", "s_curve"],
+        default="db_linear",
+        help="The shape of a volume ramp.",
+    )
+
     argument_parser.add_argument(
         "-r",
         "--reset",
@@ -77,6 +105,53 @@ def main():
         help="Load new parameter file",
     )
 
+    argument_parser.add_argument(
+        "-d",
+        "--deploy",
+        required=False,
+        help="Deploy a program from SigmaStudio's exported byte buffer file (e.g. TxBuffer_IC_1.dat).",
+    )
+
+    argument_parser.add_argument(
+        "--num_bytes",
+        required=False,
+        help="The exported write length file (e.g. NumBytes_IC_1.dat), if it is not next to the byte buffer file.",
+    )
+
+    argument_parser.add_argument(
+        "--force",
+        required=False,
+        help="Deploy all memory regions, even if they are unchanged.",
+        action="store_true",
+    )
+
+    argument_parser.add_argument(
+        "--save_snapshot",
+        required=False,
+        help="Save the runtime state of the DSP (memories and registers) to a snapshot file on the backend host.",
+    )
+
+    argument_parser.add_argument(
+        "--restore_snapshot",
+        required=False,
+        help="Restore the runtime state of the DSP from a snapshot file on the backend host.",
+    )
+
+    argument_parser.add_argument(
+        "-m",
+        "--metrics",
+        required=False,
+        help="Show bus metrics of the DSPs.",
+        action="store_true",
+    )
+
+    argument_parser.add_argument(
+        "--meters",
+        required=False,
+        help="Show the values of all meter cells, until interrupted.",
+        action="store_true",
+    )
+
     arguments = argument_parser.parse_args()
 
     backend_port = 50051
@@ -109,12 +184,48 @@ def main():
 
             response = stub.control_parameter(control_parameter_request)
 
+        if arguments.ramp_volume is not None:
+            target = control_parameter_request.ramp_volume.targets.add()
+            target.name_tokens[:] = ["main"]
+            target.value_db = arguments.ramp_volume
+            control_parameter_request.ramp_volume.duration_s = arguments.ramp_time
+            control_parameter_request.ramp_volume.curve = Curve.Value(arguments.ramp_curve.upper())
+
+            response = stub.control_parameter(control_parameter_request)
+
         if arguments.load_parameters is not None:
             with open(arguments.load_parameters, "r", encoding="utf8") as parameter_file:
                 control_request.load_parameters.content[:] = parameter_file.readlines()
 
             response = stub.control(control_request)
 
+        if arguments.deploy is not None:
+            num_bytes_path = arguments.num_bytes
+
+            if num_bytes_path is None:
+                directory, file_name = os.path.split(arguments.deploy)
+                num_bytes_path = os.path.join(directory, file_name.replace("TxBuffer", "NumBytes"))
+
+            with open(arguments.deploy, "r", encoding="utf8") as tx_buffer_file:
+                control_request.deploy_program.tx_buffer = tx_buffer_file.read()
+
+            with open(num_bytes_path, "r", encoding="utf8") as num_bytes_file:
+                control_request.deploy_program.num_bytes = num_bytes_file.read()
+
+            control_request.deploy_program.force = arguments.force
+
+            response = stub.control(control_request)
+
+        if arguments.save_snapshot is not None:
+            control_request.save_snapshot = os.path.abspath(arguments.save_snapshot)
+
+            response = stub.control(control_request)
+
+        if arguments.restore_snapshot is not None:
+            control_request.restore_snapshot = os.path.abspath(arguments.restore_snapshot)
+
+            response = stub.control(control_request)
+
         if arguments.reset is True:
             control_request.reset_dsp = True
 
@@ -125,6 +236,35 @@ def main():
 
             response = stub.control(control_request)
 
+        if arguments.metrics is True:
+            metrics_response = stub.metrics(MetricsRequest())
+
+            for dsp_metrics in metrics_response.dsps:
+                logging.info("DSP %d: bus utilization %.1f %%", dsp_metrics.chip_address, dsp_metrics.utilization * 100)
+
+                for counter in dsp_metrics.counters:
+                    logging.info("  %s: %d", counter.name, counter.value)
+
+                for latency in dsp_metrics.latencies:
+                    logging.info(
+                        "  %s latency: n=%d, mean=%.0f us, p50=%d us, p90=%d us, p99=%d us, max=%d us",
+                        latency.name,
+                        latency.count,
+                        latency.mean_us,
+                        latency.p50_us,
+                        latency.p90_us,
+                        latency.p99_us,
+                        latency.max_us,
+                    )
+
+        if arguments.meters is True:
+            try:
+                for meter_readings in stub.meters(MetersRequest()):
+                    logging.info(", ".join(f"{value.name}: {value.value:.4f}" for value in meter_readings.values))
+
+            except KeyboardInterrupt:
+                pass
+
         logging.info(response and response.message)
 
 
@@ -1,4 +1,5 @@
 """This module contains the base classes for SigmaStudio protocol handling."""
+import socket
 import socketserver
 from dataclasses import dataclass
 from multiprocessing import Pipe
@@ -11,6 +12,9 @@ class WriteRequest:
     address: int
     data: bytes
 
+    # The address of the DSP, for systems with several DSPs
+    chip_address: int = 0
+
 
 class SafeloadRequest(WriteRequest):
     """SigmaStudio requests to write data to the DSP using safeload."""
@@ -23,6 +27,9 @@ class ReadRequest:
     address: int
     length: int
 
+    # The address of the DSP, for systems with several DSPs
+    chip_address: int = 0
+
 
 @dataclass(frozen=True)
 class ReadResponse:
@@ -30,6 +37,9 @@ class ReadResponse:
 
     data: bytes
 
+    # False, if the data could not be read from the DSP
+    success: bool = True
+
 
 class ThreadedTCPServer(socketserver.ThreadingTCPServer):
     """The threaded TCP server that is used for communicating with SigmaStudio.
@@ -44,3 +54,82 @@ class ThreadedTCPServer(socketserver.ThreadingTCPServer):
         self.pipe_end_owner, self.pipe_end_user = Pipe()
 
         super().__init__(*args, **kwargs)
+
+
+class ReceiveBuffer:
+    """A receive buffer for a connection, which is filled in large chunks, and read without copying.
+
+    Reads return views into the buffer. Data that was handed out is never overwritten: when the buffer runs full, the
+    unread rest is moved to a new buffer, while views keep the old one alive.
+    """
+
+    # The default size of the buffer in bytes, which is enough for many small packets per receive call
+    SIZE = 1 << 16
+
+    def __init__(self, connection: socket.socket, size: int = SIZE):
+        """Initialize an empty receive buffer.
+
+        Args:
+            connection (socket.socket): The connection to receive from.
+            size (int, optional): The size of the buffer in bytes. Defaults to `ReceiveBuffer.SIZE`.
+        """
+        self.connection = connection
+        self.size = size
+
+        self._view = memoryview(bytearray(size))
+
+        # The unread data is between start and end.
+        self._start = 0
+        self._end = 0
+
+    def _fill(self, amount: int):
+        """Receive data, until at least a certain amount is unread.
+
+        Args:
+            amount (int): The number of bytes that shall be available.
+
+        Raises:
+            ConnectionError: If the connection was closed.
+        """
+        if self._start + amount > len(self._view):
+            # Move the unread rest to a new buffer, which can hold the requested amount.
+            unread = self._view[self._start : self._end]
+            self._view = memoryview(bytearray(max(self.size, amount)))
+            self._view[: len(unread)] = unread
+            self._start, self._end = 0, len(unread)
+
+        while self._end - self._start < amount:
+            received = self.connection.recv_into(self._view[self._end :])
+
+            if 0 == received:
+                raise ConnectionError("The connection was closed.")
+
+            self._end += received
+
+    def peek(self, amount: int) -> memoryview:
+        """Get data without consuming it.
+
+        Args:
+            amount (int): The number of bytes to get.
+
+        Returns:
+            memoryview: A view of the data, which must not be modified.
+        """
+        if self._end - self._start < amount:
+            self._fill(amount)
+
+        return self._view[self._start : self._start + amount]
+
+    def read(self, amount: int) -> memoryview:
+        """Get and consume data.
+
+        Args:
+            amount (int): The number of bytes to get.
+
+        Returns:
+            memoryview: A view of the data, which must not be modified.
+        """
+        data = self.peek(amount)
+        self._start += amount
+
+        return data
@@ -0,0 +1,181 @@
+"""This module communicates with SigmaStudio, using a single asyncio event loop for all connections.
+
+Packets are read with stream readers, and handed to a request handler as typed requests. The handler submits them to
+the DSP on a thread of its own, as submitting may wait for the bus, and returns their futures. These are queued and
+awaited by a separate task, which sends the read responses in the order of their requests. Meanwhile, further packets
+are received and submitted, until too many requests are pending, which applies backpressure to downloads as well. In
+contrast to `sigma_tcp_server`, requests do not pass through pipes and relay threads.
+"""
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, Union
+
+from sigmadsp.communication.base import ReadRequest, SafeloadRequest, WriteRequest
+from sigmadsp.communication.sigmastudio_protocols import (
+    SigmaProtocolHeader,
+    SigmaProtocolPacket,
+    get_header_class,
+)
+
+# A logger for this module
+logger = logging.getLogger(__name__)
+
+# A function that submits a request to the DSP, and returns its future, which resolves to the data for read requests
+RequestHandler = Callable[[Union[WriteRequest, ReadRequest]], Optional[Future]]
+
+# A pending request: the read request header (None for writes), and the submission, which resolves to the future of the
+# request
+PendingResponse = Tuple[Optional[SigmaProtocolHeader], "asyncio.Future[Optional[Future]]"]
+
+
+class SigmaStudioAsyncServer:
+    """A TCP server for SigmaStudio, which runs an asyncio event loop in a thread of its own."""
+
+    # The largest number of pending requests per connection, before receiving pauses
+    MAX_IN_FLIGHT = 64
+
+    def __init__(self, host: str, port: int, dsp_type: str, request_handler: RequestHandler):
+        """Initialize the server, and start listening.
+
+        Args:
+            host (str): Listening IP address
+            port (int): Port to listen at, or 0 for any free port
+            dsp_type (str): DSP type, used to select the relevant protocol headers
+            request_handler (RequestHandler): The function that submits requests to the DSP.
+        """
+        self.host = host
+        self.port = port
+        self.dsp_type = dsp_type
+        self.request_handler = request_handler
+
+        # Submits the requests of all connections in the order of arrival, without blocking the event loop.
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SigmaStudio submit")
+
+        # Set, once the server listens, after which `port` is the actual port
+        self.listening = threading.Event()
+
+        server_thread = threading.Thread(target=asyncio.run, args=(self.serve(),), name="SigmaStudio server thread")
+        server_thread.daemon = True
+        server_thread.start()
+
+        self.listening.wait()
+
+    async def serve(self):
+        """Accept connections from SigmaStudio, and serve them forever."""
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        self.listening.set()
+
+        async with server:
+            await server.serve_forever()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Handle the packets of a connection in order, until it is closed.
+
+        Args:
+            reader (asyncio.StreamReader): The stream of incoming data.
+            writer (asyncio.StreamWriter): The stream of outgoing data.
+        """
+        pending: "asyncio.Queue[Optional[PendingResponse]]" = asyncio.Queue(self.MAX_IN_FLIGHT)
+        send_task = asyncio.ensure_future(self.send_responses(pending, writer))
+
+        try:
+            while True:
+                await self.handle_packet(reader, pending)
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+        except ValueError as e:
+            logger.error("Invalid packet from SigmaStudio: %s", e)
+
+        finally:
+            await pending.put(None)
+            await send_task
+            writer.close()
+
+    async def send_responses(self, pending: "asyncio.Queue[Optional[PendingResponse]]", writer: asyncio.StreamWriter):
+        """Wait for pending requests, and send read responses in the order of their requests, until None is queued.
+
+        Args:
+            pending (asyncio.Queue[Optional[PendingResponse]]): The pending requests.
+            writer (asyncio.StreamWriter): The stream of outgoing data.
+        """
+        failed = False
+
+        while True:
+            item = await pending.get()
+
+            if item is None:
+                break
+
+            if failed:
+                # Keep taking responses, such that receiving never blocks on a full queue.
+                continue
+
+            header, submission = item
+
+            if header is None:
+                try:
+                    future = await submission
+
+                    if future is not None:
+                        await asyncio.wrap_future(future)
+
+                except Exception as e:  # pylint: disable=broad-except
+                    # SigmaStudio does not expect responses to writes.
+                    logger.error("Write failed: %s", e)
+
+                continue
+
+            try:
+                future = await submission
+
+                if future is None:
+                    raise ValueError("No data for the read request.")
+
+                data = await asyncio.wrap_future(future)
+
+                response_packet = SigmaProtocolPacket(self.dsp_type)
+                response_packet.init_from_payload(SigmaProtocolHeader.READ_RESPONSE, data, header)
+
+                writer.write(response_packet.as_bytes)
+                await writer.drain()
+
+            except Exception as e:  # pylint: disable=broad-except
+                # Stop the connection, as SigmaStudio would wait for this response forever.
+                logger.error("Read response failed: %s", e)
+                failed = True
+                writer.close()
+
+    async def handle_packet(self, reader: asyncio.StreamReader, pending: "asyncio.Queue[Optional[PendingResponse]]"):
+        """Read a single packet, and submit its request.
+
+        Args:
+            reader (asyncio.StreamReader): The stream of incoming data.
+            pending (asyncio.Queue[Optional[PendingResponse]]): The pending requests, to which the request is added.
+        """
+        operation = await reader.readexactly(1)
+        header_class = get_header_class(self.dsp_type, operation[0])
+        header_bytes = operation + await reader.readexactly(header_class.fields.size - 1)
+
+        header = header_class(header_class.fields.codec.unpack(header_bytes))
+        record = header.record
+        loop = asyncio.get_running_loop()
+
+        if header.is_write_request:
+            payload = await reader.readexactly(record.data_length)
+            request_class = SafeloadRequest if header.is_safeload else WriteRequest
+
+            logger.debug("[write] %d bytes to address 0x%04x", len(payload), record.address)
+            write_request = request_class(record.address, payload, record.chip_address)
+
+            await pending.put((None, loop.run_in_executor(self.executor, self.request_handler, write_request)))
+
+        elif header.is_read_request:
+            logger.debug("[read] %d bytes from address 0x%04x", record.data_length, record.address)
+            read_request = ReadRequest(record.address, record.data_length, record.chip_address)
+
+            await pending.put((header, loop.run_in_executor(self.executor, self.request_handler, read_request)))
@@ -1,16 +1,19 @@
 """This module communicates with SigmaStudio.
 
-It can receive read/write requests and return with read response packets.
+It can receive read/write requests and return with read response packets. Each connection receives and decodes packets
+on one thread, while another thread submits them in order, such that network transfers overlap with DSP transfers.
 """
 import logging
+import queue
 import socket
 import socketserver
 import threading
 from multiprocessing import Pipe
-from typing import Type
+from typing import Optional, Type
 
 from sigmadsp.communication.base import (
     ReadRequest,
+    ReceiveBuffer,
     SafeloadRequest,
     ThreadedTCPServer,
     WriteRequest,
@@ -27,36 +30,64 @@ logger = logging.getLogger(__name__)
 class SigmaStudioRequestHandler(socketserver.BaseRequestHandler):
     """Request handler for messages from SigmaStudio."""
 
+    # The largest number of received packets that wait for being submitted, before receiving pauses
+    MAX_IN_FLIGHT = 64
+
     request: socket.socket
     server: ThreadedTCPServer
     dsp_type: str
 
-    def read(self, amount: int) -> bytearray:
-        """Reads the specified amount of data from the socket.
+    receive_buffer: ReceiveBuffer
+
+    # The received packets, in the order of arrival, and None after the last one
+    in_flight: "queue.Queue[Optional[SigmaProtocolPacket]]"
+
+    def setup(self):
+        """Create the receive buffer and the packet queue of the connection."""
+        self.receive_buffer = ReceiveBuffer(self.request)
+        self.in_flight = queue.Queue(self.MAX_IN_FLIGHT)
+
+    def close(self):
+        """Close the connection, if no more data arrives."""
+        try:
+            self.request.shutdown(socket.SHUT_RDWR)
+
+        except OSError:
+            pass
+
+        self.request.close()
+
+    def peek(self, amount: int) -> memoryview:
+        """Get the specified amount of data from the socket, without consuming it.
 
         Args:
             amount (int): The number of bytes to get.
 
         Returns:
-            bytearray: The received data.
+            memoryview: A view of the received data.
         """
-        data = bytearray()
+        try:
+            return self.receive_buffer.peek(amount)
 
-        while amount > len(data):
-            # Wait until the complete TCP payload was received.
-            received = self.request.recv(amount - len(data))
+        except ConnectionError:
+            self.close()
+            raise
 
-            if 0 == len(received):
-                # Give up, if no more data arrives.
-                # Close the socket.
-                self.request.shutdown(socket.SHUT_RDWR)
-                self.request.close()
+    def read(self, amount: int) -> memoryview:
+        """Reads the specified amount of data from the socket.
 
-                raise ConnectionError
+        Args:
+            amount (int): The number of bytes to get.
 
-            data.extend(received)
+        Returns:
+            memoryview: A view of the received data, which is not copied from the receive buffer.
+        """
+        try:
+            return self.receive_buffer.read(amount)
 
-        return data
+        except ConnectionError:
+            self.close()
+            raise
 
     def handle_write_data(self, packet: SigmaProtocolPacket):
         """Handle requests, where SigmaStudio wants to write to the DSP.
@@ -66,12 +97,15 @@ class SigmaStudioRequestHandler(socketserver.BaseRequestHandler):
         """
         request: WriteRequest
 
+        # The payload is a view into the receive buffer, which is copied only once, as the pipe cannot carry views.
+        payload = bytes(packet.payload)
+
         if packet.header.is_safeload:
             logger.info("[safeload] %s bytes to address 0x%04x", packet.header["data_length"], packet.header["address"])
-            request = SafeloadRequest(packet.header["address"], packet.payload)
+            request = SafeloadRequest(packet.header["address"], payload, packet.header["chip_address"])
         else:
             logger.info("[write] %s bytes to address 0x%04x", packet.header["data_length"], packet.header["address"])
-            request = WriteRequest(packet.header["address"], packet.payload)
+            request = WriteRequest(packet.header["address"], payload, packet.header["chip_address"])
 
         self.server.pipe_end_owner.send(request)
 
@@ -80,40 +114,81 @@ class SigmaStudioRequestHandler(socketserver.BaseRequestHandler):
 
         Args:
             packet (SigmaProtocolPacket): The request header object.
+
+        Raises:
+            OSError: If the DSP could not be read.
         """
         logger.info("[read] %s bytes from address 0x%04x", packet.header["data_length"], packet.header["address"])
 
         # Notify application of read request
-        self.server.pipe_end_owner.send(ReadRequest(packet.header["address"], packet.header["data_length"]))
+        self.server.pipe_end_owner.send(
+            ReadRequest(packet.header["address"], packet.header["data_length"], packet.header["chip_address"])
+        )
 
         # Wait for payload data that goes into the read response
         read_response = self.server.pipe_end_owner.recv()
 
-        header_defaults = packet.header.fields
+        if not read_response.success:
+            # Not all protocol headers can report a failed read, so the connection is closed instead.
+            raise OSError("The DSP could not be read.")
 
         response_packet = SigmaProtocolPacket(self.dsp_type)
-        response_packet.init_from_payload(SigmaProtocolHeader.READ_RESPONSE, read_response.data, header_defaults)
-        response_packet.header["success"] = 0
+        response_packet.init_from_payload(SigmaProtocolHeader.READ_RESPONSE, read_response.data, packet.header)
 
         self.request.sendall(response_packet.as_bytes)
 
-    def handle(self):
-        """Call, when the TCP server receives new data for handling.
+    def submit_packets(self):
+        """Submit the received packets one by one, in the order of arrival, until the connection is closed.
 
-        It never stops, except if the connection is reset.
+        Since a read request is answered before the next packet is submitted, read responses are sent in the order of
+        their requests, and no write overtakes an earlier read.
         """
+        failed = False
+
         while True:
-            try:
-                packet: SigmaProtocolPacket = SigmaProtocolPacket(self.dsp_type)
-                packet.init_from_network(self)
+            packet = self.in_flight.get()
+
+            if packet is None:
+                break
+
+            if failed:
+                # Keep taking packets, such that receiving never blocks on a full queue.
+                continue
 
+            try:
                 if packet.header.is_write_request:
                     self.handle_write_data(packet)
                 elif packet.header.is_read_request:
                     self.handle_read_request(packet)
 
-            except ConnectionError:
-                break
+            except OSError:
+                failed = True
+                self.close()
+
+    def handle(self):
+        """Call, when the TCP server receives new data for handling.
+
+        Packets are received and decoded, while earlier packets are submitted by another thread. If too many packets
+        wait for being submitted, receiving pauses, which in turn throttles SigmaStudio. It never stops, except if the
+        connection is reset.
+        """
+        submit_thread = threading.Thread(target=self.submit_packets, name="SigmaStudio submit thread", daemon=True)
+        submit_thread.start()
+
+        try:
+            while True:
+                packet: SigmaProtocolPacket = SigmaProtocolPacket(self.dsp_type)
+                packet.init_from_network(self)
+
+                if packet.header.is_write_request or packet.header.is_read_request:
+                    self.in_flight.put(packet)
+
+        except OSError:
+            pass
+
+        finally:
+            self.in_flight.put(None)
+            submit_thread.join()
 
 
 class Adau14xxRequestHandler(SigmaStudioRequestHandler):
@@ -8,12 +8,22 @@ https://wiki.analog.com/resources/tools-software/sigmastudio/usingsigmastudio/tc
 Protocol headers for ADAU1401/1701 are documented on the Analog Devices forum at
 https://ez.analog.com/dsp/sigmadsp/f/q-a/163849/adau1401-adau1701-tcp-ip-documentation-unonficial-self-made
 """
+import struct
 from abc import ABC
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, Iterator, List, Type, Union
-
-from sigmadsp.helper.conversion import bytes_to_int, int_to_bytes
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 if TYPE_CHECKING:
     # avoid circular import
@@ -33,7 +43,7 @@ class Field:
     # The size of the field in bytes.
     size: int
 
-    # The stored value.
+    # The default value, which new headers start with.
     value: int = 0
 
     def __post_init__(self):
@@ -52,8 +62,96 @@ class Field:
         return hash((self.name, self.offset, self.size))
 
 
+class HeaderCodec:
+    """Encodes and decodes all fields of a header at once, by means of a precompiled `struct.Struct`.
+
+    All fields are big-endian unsigned integers. Fields of 1, 2, 4 or 8 bytes are converted by the struct itself, other
+    sizes are converted from and to byte strings. Decoded headers are immutable records (named tuples) with one
+    attribute per field.
+    """
+
+    # The struct format characters for unsigned integers by size in bytes
+    FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+    def __init__(self, fields: List[Field]):
+        """Compile the codec for a list of fields.
+
+        Args:
+            fields (List[Field]): The fields, sorted by their offset.
+        """
+        layout = ">"
+        end = 0
+
+        # The indices of fields that are converted from and to byte strings
+        self.byte_string_indices: Tuple[int, ...] = tuple(
+            index for index, field in enumerate(fields) if field.size not in HeaderCodec.FORMATS
+        )
+
+        for field in fields:
+            if field.offset > end:
+                # Undefined bytes between fields
+                layout += f"{field.offset - end}x"
+
+            layout += HeaderCodec.FORMATS.get(field.size, f"{field.size}s")
+            end = max(end, field.offset + field.size)
+
+        self.struct = struct.Struct(layout)
+        self.sizes: Tuple[int, ...] = tuple(field.size for field in fields)
+        self.record_type = namedtuple("HeaderRecord", [field.name for field in fields])  # type: ignore
+
+    @property
+    def size(self) -> int:
+        """The total size of the encoded header in bytes."""
+        return self.struct.size
+
+    def unpack(self, data: Union[bytes, bytearray, memoryview], offset: int = 0) -> NamedTuple:
+        """Decode the field values.
+
+        Args:
+            data (Union[bytes, bytearray, memoryview]): The buffer that contains the header.
+            offset (int, optional): The offset of the header in the buffer. Defaults to 0.
+
+        Returns:
+            NamedTuple: The record of field values.
+        """
+        values = self.struct.unpack_from(data, offset)
+
+        if not self.byte_string_indices:
+            return self.record_type._make(values)
+
+        converted = list(values)
+
+        for index in self.byte_string_indices:
+            converted[index] = int.from_bytes(values[index], "big")
+
+        return self.record_type._make(converted)
+
+    def pack_into(self, buffer: Union[bytearray, memoryview], offset: int, values: Iterable[int]):
+        """Encode field values into a buffer.
+
+        Args:
+            buffer (Union[bytearray, memoryview]): The buffer to write to.
+            offset (int): The offset of the header in the buffer.
+            values (Iterable[int]): The field values, in the order of the fields.
+        """
+        if self.byte_string_indices:
+            converted: List[Union[int, bytes]] = list(values)
+
+            for index in self.byte_string_indices:
+                converted[index] = int(converted[index]).to_bytes(self.sizes[index], "big")
+
+            self.struct.pack_into(buffer, offset, *converted)
+
+        else:
+            self.struct.pack_into(buffer, offset, *values)
+
+
 class Fields:
-    """An iterable collection of Field objects."""
+    """An iterable collection of Field objects, with a codec that is compiled from them.
+
+    Fields describe the layout of a header and the default values of its fields. They are shared by all headers of a
+    kind, and are not changed by decoding; the values of a specific header are held in its record.
+    """
 
     def __init__(self, fields: List[Field]):
         """Initialize the header fields. Add more fields to it by means of `add()`.
@@ -71,6 +169,9 @@ class Fields:
             fields (List[Field]): The list of fields to add initially.
         """
         self._fields: OrderedDict[str, Field] = OrderedDict()  # pylint: disable=E1136
+        self._field_list: List[Field] = []
+        self.codec = HeaderCodec([])
+        self.defaults = self.codec.record_type()
 
         for field in fields:
             self.add_field(field)
@@ -78,7 +179,7 @@ class Fields:
     @property
     def size(self) -> int:
         """The total size of the header in bytes."""
-        return sum([field.size for field in self])
+        return self.codec.size
 
     @property
     def is_continuous(self) -> bool:
@@ -120,27 +221,43 @@ class Fields:
             self._sort_fields_by_offset()
             self._check_for_overlaps()
 
-    def as_bytes(self) -> bytes:
-        """Get the full header as a bytes object."""
-        buffer = bytearray()
+            # The field list and codec are only rebuilt here, as fields are added once, when headers are defined.
+            self._field_list = list(self._fields.values())
+            self.codec = HeaderCodec(self._field_list)
+            self.defaults = self.codec.record_type._make(field.value for field in self._field_list)
 
-        for field in self:
-            int_to_bytes(field.value, buffer, field.offset, field.size)
+    def as_bytes(self) -> bytes:
+        """Get the full header with default values as a bytes object."""
+        buffer = bytearray(self.size)
+        self.codec.pack_into(buffer, 0, self.defaults)
 
         return bytes(buffer)
 
+    def index(self, name: str) -> int:
+        """Get the position of a field, which is also its position in header records.
+
+        Args:
+            name (str): The name of the field.
+
+        Raises:
+            KeyError: If the field does not exist.
+
+        Returns:
+            int: The position of the field.
+        """
+        return self._field_list.index(self._fields[name])
+
     def as_list(self) -> List[Field]:
         """The fields as a list.
 
         Returns:
             List[Field]: The list of fields.
         """
-        return list(self._fields.values())
+        return list(self._field_list)
 
     def __iter__(self) -> Iterator[Field]:
         """The iterator for fields."""
-        for item in self._fields.values():
-            yield item
+        return iter(self._field_list)
 
     def __getitem__(self, name: str) -> Field:
         """Get a field by its name.
@@ -169,15 +286,26 @@ class Fields:
 
 
 class SigmaProtocolHeader(ABC):
-    """Base class for protocol headers."""
+    """Base class for protocol headers.
+
+    The layout is described by the class-level `fields`. The values of each header are held in its own immutable
+    `record`, which is replaced as a whole when a field is set, such that headers can be used by concurrent connections.
+    """
 
     READ_REQUEST: int = 0x0A
     READ_RESPONSE: int = 0x0B
     WRITE: int = 0x09
 
-    @property
-    def fields(self) -> Fields:
-        """Fields of the header."""
+    fields: Fields
+
+    def __init__(self, record: Optional[NamedTuple] = None):
+        """Initialize the header.
+
+        Args:
+            record (Optional[NamedTuple]): The field values, e.g. from the codec. Defaults to None, where the default
+                values of the fields are used.
+        """
+        self.record = self.fields.defaults if record is None else record
 
     @property
     def has_payload(self) -> bool:
@@ -186,7 +314,7 @@ class SigmaProtocolHeader(ABC):
         Returns:
             bool: True if this is a write / read response, False otherwise.
         """
-        return self.fields["operation"].value in [self.WRITE, self.READ_RESPONSE]
+        return self.record.operation in [self.WRITE, self.READ_RESPONSE]
 
     @property
     def is_write_request(self) -> bool:
@@ -195,7 +323,7 @@ class SigmaProtocolHeader(ABC):
         Returns:
             bool: True if this is a write.
         """
-        return self.fields["operation"].value == self.WRITE
+        return self.record.operation == self.WRITE
 
     @property
     def is_safeload(self) -> bool:
@@ -204,7 +332,7 @@ class SigmaProtocolHeader(ABC):
         Returns:
             bool: True if this is a safeload request.
         """
-        return self.fields["operation"].value == self.WRITE and self.fields["safeload"].value == 1
+        return self.record.operation == self.WRITE and self.record.safeload == 1
 
     @property
     def is_read_request(self) -> bool:
@@ -213,7 +341,7 @@ class SigmaProtocolHeader(ABC):
         Returns:
             bool: True if this is a read request.
         """
-        return self.fields["operation"].value == self.READ_REQUEST
+        return self.record.operation == self.READ_REQUEST
 
     @property
     def is_read_response(self) -> bool:
@@ -222,7 +350,7 @@ class SigmaProtocolHeader(ABC):
         Returns:
             bool: True if this is a read response.
         """
-        return self.fields["operation"].value == self.READ_RESPONSE
+        return self.record.operation == self.READ_RESPONSE
 
     def as_bytes(self) -> bytes:
         """Return the bytes representation of the current header.
@@ -230,19 +358,30 @@ class SigmaProtocolHeader(ABC):
         Returns:
             bytes: the assembled header
         """
-        return self.fields.as_bytes()
+        buffer = bytearray(self.fields.size)
+        self.pack_into(buffer)
+
+        return bytes(buffer)
+
+    def pack_into(self, buffer: Union[bytearray, memoryview], offset: int = 0):
+        """Write the current header into a buffer.
+
+        Args:
+            buffer (Union[bytearray, memoryview]): The buffer to write to.
+            offset (int, optional): The offset of the header in the buffer. Defaults to 0.
+        """
+        self.fields.codec.pack_into(buffer, offset, self.record)
 
-    def parse(self, data: bytes):
-        """Parse a header and populate field values.
+    def parse(self, data: Union[bytes, memoryview]):
+        """Parse a header into a new record of field values.
 
         Args:
-            data (bytes): The data to parse.
+            data (Union[bytes, memoryview]): The data to parse.
         """
         if len(data) != self.fields.size:
             raise ValueError(f"Input data needs to be exactly {self.fields.size} bytes long!")
 
-        for field in self.fields:
-            field.value = bytes_to_int(data, field.offset, field.size)
+        self.record = self.fields.codec.unpack(data)
 
     def __setitem__(self, name: str, value: int):
         """Set a field value.
@@ -256,7 +395,7 @@ class SigmaProtocolHeader(ABC):
         if name not in valid_names:
             raise ValueError(f"Invalid field name {name}; valid names are {', '.join(valid_names)}")
 
-        self.fields[name].value = value
+        self.record = self.record._replace(**{name: value})
 
     def __getitem__(self, name: str) -> int:
         """Get a field value.
@@ -267,7 +406,7 @@ class SigmaProtocolHeader(ABC):
         Returns:
             int: The field value.
         """
-        return self.fields[name].value
+        return self.record[self.fields.index(name)]
 
 
 _REGISTRY: Dict[int, Dict[str, Type[SigmaProtocolHeader]]] = {}
@@ -287,7 +426,7 @@ def _register(operation: int, chip_type: str, header_class: Type[SigmaProtocolHe
     _REGISTRY[operation][chip_type] = header_class
 
 
-def _get_header(dsp_type: str, operation: int) -> SigmaProtocolHeader:
+def get_header_class(dsp_type: str, operation: int) -> Type[SigmaProtocolHeader]:
     """Select the appropriate header class for the chip type and operation requested.
 
     Args:
@@ -295,7 +434,7 @@ def _get_header(dsp_type: str, operation: int) -> SigmaProtocolHeader:
         operation (int): The operation code.
 
     Returns:
-        SigmaProtocolHeader: The header object.
+        Type[SigmaProtocolHeader]: The header class.
     """
     if operation not in _REGISTRY:
         valid_opcodes = ", ".join([f"0x{op:02x}" for op in _REGISTRY])
@@ -304,7 +443,20 @@ def _get_header(dsp_type: str, operation: int) -> SigmaProtocolHeader:
     if dsp_type not in _REGISTRY[operation]:
         raise ValueError(f"DSP type {dsp_type} is not supported.")
 
-    header = _REGISTRY[operation][dsp_type]()
+    return _REGISTRY[operation][dsp_type]
+
+
+def _get_header(dsp_type: str, operation: int) -> SigmaProtocolHeader:
+    """Create a header of the appropriate class for the chip type and operation requested.
+
+    Args:
+        dsp_type (str): One of the supported DSP types.
+        operation (int): The operation code.
+
+    Returns:
+        SigmaProtocolHeader: The header object.
+    """
+    header = get_header_class(dsp_type, operation)()
     header["operation"] = operation
     return header
 
@@ -421,6 +573,9 @@ class Adau145xReadResponseHeader(SigmaProtocolHeader):
     )
 
 
+_register(SigmaProtocolHeader.WRITE, "adau14xx", Adau145xWriteHeader)
+_register(SigmaProtocolHeader.READ_REQUEST, "adau14xx", Adau145xReadRequestHeader)
+_register(SigmaProtocolHeader.READ_RESPONSE, "adau14xx", Adau145xReadResponseHeader)
 _register(SigmaProtocolHeader.WRITE, "adau144x", Adau145xWriteHeader)
 _register(SigmaProtocolHeader.READ_REQUEST, "adau144x", Adau145xReadRequestHeader)
 _register(SigmaProtocolHeader.READ_RESPONSE, "adau144x", Adau145xReadResponseHeader)
@@ -440,7 +595,7 @@ class SigmaProtocolPacket:
 
     dsp_type: str
     header: SigmaProtocolHeader
-    payload: bytearray
+    payload: Union[bytes, bytearray, memoryview]
 
     def __init__(self, dsp_type: str):
         """Initialize the packet.
@@ -450,32 +605,34 @@ class SigmaProtocolPacket:
         """
         self.dsp_type = dsp_type
 
-    def init_from_payload(self, operation: int, payload: bytearray, header_defaults: Union[Fields, None] = None):
+    def init_from_payload(
+        self, operation: int, payload: bytearray, header_defaults: Optional[SigmaProtocolHeader] = None
+    ):
         """Initialize the packet with a new header and the provided payload.
 
         Args:
             operation (int): Operation code; most often SigmaStudioPacket.READ_RESPONSE
             payload (bytearray): Payload.
-            header_defaults (Union[Fields, None]): Default values for header fields; useful when setting chip address,
-                etc. from therequest headers
+            header_defaults (Optional[SigmaProtocolHeader]): A header with default values for header fields; useful
+                when setting chip address, etc. from the request headers
         """
-        self.header = _get_header(self.dsp_type, operation)
-        self.payload = payload
-        self.header["total_length"] = self.header.fields.size + len(payload)
+        header_class = get_header_class(self.dsp_type, operation)
+        values = header_class.fields.defaults._asdict()
 
-        # adau145x and friends have some additional response fields
-        if "data_length" in self.header.fields:
-            self.header["data_length"] = len(payload)
+        if header_defaults is not None:
+            for name, value in header_defaults.record._asdict().items():
+                if name in values and name not in ["operation", "total_length", "data_length", "success"]:
+                    values[name] = value
 
-        if header_defaults is None:
-            return
+        values["operation"] = operation
+        values["total_length"] = header_class.fields.size + len(payload)
 
-        for field in self.header.fields:
-            if field.name in ["operation", "total_length", "data_length", "success"]:
-                continue
+        # adau145x and friends have some additional response fields
+        if "data_length" in values:
+            values["data_length"] = len(payload)
 
-            if field.name in header_defaults:
-                self.header.fields[field.name].value = header_defaults[field.name].value
+        self.header = header_class(header_class.fields.codec.record_type(**values))
+        self.payload = payload
 
     def init_from_network(self, request_handler: "SigmaStudioRequestHandler"):
         """Fetch data from the request handler.
@@ -483,18 +640,14 @@ class SigmaProtocolPacket:
         Args:
             request_handler (SigmaStudioRequestHandler): The request handler that deals with the network.
         """
-        # first get the operation code
-        header_bytes: bytearray = request_handler.read(1)
-
-        # get the appropriate header object
-        self.header = _get_header(self.dsp_type, header_bytes[0])
+        # first look at the operation code, and get the appropriate header class
+        header_class = get_header_class(self.dsp_type, request_handler.peek(1)[0])
 
-        # finally, read the rest of the header and parse it
-        header_bytes.extend(request_handler.read(self.header.fields.size - 1))
-        self.header.parse(header_bytes)
+        # then read the whole header at once, and decode it
+        self.header = header_class(header_class.fields.codec.unpack(request_handler.read(header_class.fields.size)))
 
         if self.header.is_write_request:
-            # we have a payload
+            # we have a payload, which is a view into the receive buffer
             self.payload = request_handler.read(self.header["data_length"])
 
     @property
@@ -506,8 +659,10 @@ class SigmaProtocolPacket:
         Returns:
             bytes: header and payload combined
         """
-        buffer = bytearray(self.header.as_bytes())
+        header_size = self.header.fields.size
+        buffer = bytearray(header_size + len(self.payload))
 
-        buffer.extend(self.payload)
+        self.header.pack_into(buffer)
+        buffer[header_size:] = self.payload
 
         return bytes(buffer)
@@ -2,6 +2,7 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: control.proto
 """Generated protocol buffer code."""
+from google.protobuf.internal import enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
@@ -19,9 +20,43 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\rcontrol.proto\x12\x18sigmadsp.backend_service\"D\n\x0c\x43hangeVolume\x12\x13\n\x0bname_tokens\x18\x01 \x03(\t\x12\r\n\x05value\x18\x02 \x01(\x01\x12\x10\n\x08relative\x18\x03 \x01(\x08\"e\n\x17\x43ontrolParameterRequest\x12?\n\rchange_volume\x18\x01 \x01(\x0b\x32&.sigmadsp.backend_service.ChangeVolumeH\x00\x42\t\n\x07\x63ommand\"!\n\x0eLoadParameters\x12\x0f\n\x07\x63ontent\x18\x01 \x03(\t\"\x8f\x01\n\x0e\x43ontrolRequest\x12\x13\n\treset_dsp\x18\x01 \x01(\x08H\x00\x12\x18\n\x0ehard_reset_dsp\x18\x02 \x01(\x08H\x00\x12\x43\n\x0fload_parameters\x18\x03 \x01(\x0b\x32(.sigmadsp.backend_service.LoadParametersH\x00\x42\t\n\x07\x63ommand\"3\n\x0f\x43ontrolResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t2\xdc\x01\n\x07\x42\x61\x63kend\x12^\n\x07\x63ontrol\x12(.sigmadsp.backend_service.ControlRequest\x1a).sigmadsp.backend_service.ControlResponse\x12q\n\x11\x63ontrol_parameter\x12\x31.sigmadsp.backend_service.ControlParameterRequest\x1a).sigmadsp.backend_service.ControlResponseb\x06proto3'
+  serialized_pb=b'\n\rcontrol.proto\x12\x18sigmadsp.backend_service\"D\n\x0c\x43hangeVolume\x12\x13\n\x0bname_tokens\x18\x01 \x03(\t\x12\r\n\x05value\x18\x02 \x01(\x01\x12\x10\n\x08relative\x18\x03 \x01(\x08\"3\n\nRampTarget\x12\x13\n\x0bname_tokens\x18\x01 \x03(\t\x12\x10\n\x08value_db\x18\x02 \x01(\x01\"\x87\x01\n\nRampVolume\x12\x35\n\x07targets\x18\x01 \x03(\x0b\x32$.sigmadsp.backend_service.RampTarget\x12\x12\n\nduration_s\x18\x02 \x01(\x01\x12.\n\x05\x63urve\x18\x03 \x01(\x0e\x32\x1f.sigmadsp.backend_service.Curve\"\xa2\x01\n\x17\x43ontrolParameterRequest\x12?\n\rchange_volume\x18\x01 \x01(\x0b\x32&.sigmadsp.backend_service.ChangeVolumeH\x00\x12;\n\x0bramp_volume\x18\x02 \x01(\x0b\x32$.sigmadsp.backend_service.RampVolumeH\x00\x42\t\n\x07\x63ommand\"!\n\x0eLoadParameters\x12\x0f\n\x07\x63ontent\x18\x01 \x03(\t\"Z\n\rDeployProgram\x12\x11\n\ttx_buffer\x18\x01 \x01(\t\x12\x11\n\tnum_bytes\x18\x02 \x01(\t\x12\r\n\x05\x66orce\x18\x03 \x01(\x08\x12\x14\n\x0c\x63hip_address\x18\x04 \x01(\r\"\x87\x02\n\x0e\x43ontrolRequest\x12\x13\n\treset_dsp\x18\x01 \x01(\x08H\x00\x12\x18\n\x0ehard_reset_dsp\x18\x02 \x01(\x08H\x00\x12\x43\n\x0fload_parameters\x18\x03 \x01(\x0b\x32(.sigmadsp.backend_service.LoadParametersH\x00\x12\x41\n\x0e\x64\x65ploy_program\x18\x04 \x01(\x0b\x32\'.sigmadsp.backend_service.DeployProgramH\x00\x12\x17\n\rsave_snapshot\x18\x05 \x01(\tH\x00\x12\x1a\n\x10restore_snapshot\x18\x06 \x01(\tH\x00\x42\t\n\x07\x63ommand\"3\n\x0f\x43ontrolResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x10\n\x0eMetricsRequest\"~\n\x0eLatencySummary\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x04\x12\x0f\n\x07mean_us\x18\x03 \x01(\x01\x12\x0e\n\x06p50_us\x18\x04 \x01(\x04\x12\x0e\n\x06p90_us\x18\x05 \x01(\x04\x12\x0e\n\x06p99_us\x18\x06 \x01(\x04\x12\x0e\n\x06max_us\x18\x07 \x01(\x04\"&\n\x07\x43ounter\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04\"\xa9\x01\n\nDspMetrics\x12\x14\n\x0c\x63hip_address\x18\x01 \x01(\r\x12;\n\tlatencies\x18\x02 \x03(\x0b\x32(.sigmadsp.backend_service.LatencySummary\x12\x33\n\x08\x63ounters\x18\x03 \x03(\x0b\x32!.sigmadsp.backend_service.Counter\x12\x13\n\x0butilization\x18\x04 \x01(\x01\"E\n\x0fMetricsResponse\x12\x32\n\x04\x64sps\x18\x01 \x03(\x0b\x32$.sigmadsp.backend_service.DspMetrics\"\x0f\n\rMetersRequest\":\n\nMeterValue\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\r\x12\r\n\x05value\x18\x03 \x01(\x01\"E\n\rMeterReadings\x12\x34\n\x06values\x18\x01 \x03(\x0b\x32$.sigmadsp.backend_service.MeterValue*/\n\x05\x43urve\x12\n\n\x06LINEAR\x10\x00\x12\r\n\tDB_LINEAR\x10\x01\x12\x0b\n\x07S_CURVE\x10\x02\x32\x9a\x03\n\x07\x42\x61\x63kend\x12^\n\x07\x63ontrol\x12(.sigmadsp.backend_service.ControlRequest\x1a).sigmadsp.backend_service.ControlResponse\x12q\n\x11\x63ontrol_parameter\x12\x31.sigmadsp.backend_service.ControlParameterRequest\x1a).sigmadsp.backend_service.ControlResponse\x12^\n\x07metrics\x12(.sigmadsp.backend_service.MetricsRequest\x1a).sigmadsp.backend_service.MetricsResponse\x12\\\n\x06meters\x12\'.sigmadsp.backend_service.MetersRequest\x1a\'.sigmadsp.backend_service.MeterReadings0\x01\x62\x06proto3'
 )
 
+_CURVE = _descriptor.EnumDescriptor(
+  name='Curve',
+  full_name='sigmadsp.backend_service.Curve',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='LINEAR', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='DB_LINEAR', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='S_CURVE', index=2, number=2,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=1492,
+  serialized_end=1539,
+)
+_sym_db.RegisterEnumDescriptor(_CURVE)
+
+Curve = enum_type_wrapper.EnumTypeWrapper(_CURVE)
+LINEAR = 0
+DB_LINEAR = 1
+S_CURVE = 2
 
 
 
@@ -71,6 +106,91 @@ _CHANGEVOLUME = _descriptor.Descriptor(
 )
 
 
+_RAMPTARGET = _descriptor.Descriptor(
+  name='RampTarget',
+  full_name='sigmadsp.backend_service.RampTarget',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name_tokens', full_name='sigmadsp.backend_service.RampTarget.name_tokens', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value_db', full_name='sigmadsp.backend_service.RampTarget.value_db', index=1,
+      number=2, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=113,
+  serialized_end=164,
+)
+
+
+_RAMPVOLUME = _descriptor.Descriptor(
+  name='RampVolume',
+  full_name='sigmadsp.backend_service.RampVolume',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='targets', full_name='sigmadsp.backend_service.RampVolume.targets', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='duration_s', full_name='sigmadsp.backend_service.RampVolume.duration_s', index=1,
+      number=2, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='curve', full_name='sigmadsp.backend_service.RampVolume.curve', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=167,
+  serialized_end=302,
+)
+
+
 _CONTROLPARAMETERREQUEST = _descriptor.Descriptor(
   name='ControlParameterRequest',
   full_name='sigmadsp.backend_service.ControlParameterRequest',
@@ -86,6 +206,13 @@ _CONTROLPARAMETERREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='ramp_volume', full_name='sigmadsp.backend_service.ControlParameterRequest.ramp_volume', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -103,8 +230,8 @@ _CONTROLPARAMETERREQUEST = _descriptor.Descriptor(
       create_key=_descriptor._internal_create_key,
     fields=[]),
   ],
-  serialized_start=113,
-  serialized_end=214,
+  serialized_start=305,
+  serialized_end=467,
 )
 
 
@@ -135,8 +262,61 @@ _LOADPARAMETERS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=216,
-  serialized_end=249,
+  serialized_start=469,
+  serialized_end=502,
+)
+
+
+_DEPLOYPROGRAM = _descriptor.Descriptor(
+  name='DeployProgram',
+  full_name='sigmadsp.backend_service.DeployProgram',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='tx_buffer', full_name='sigmadsp.backend_service.DeployProgram.tx_buffer', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='num_bytes', full_name='sigmadsp.backend_service.DeployProgram.num_bytes', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='force', full_name='sigmadsp.backend_service.DeployProgram.force', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='chip_address', full_name='sigmadsp.backend_service.DeployProgram.chip_address', index=3,
+      number=4, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=504,
+  serialized_end=594,
 )
 
 
@@ -169,6 +349,27 @@ _CONTROLREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='deploy_program', full_name='sigmadsp.backend_service.ControlRequest.deploy_program', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='save_snapshot', full_name='sigmadsp.backend_service.ControlRequest.save_snapshot', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='restore_snapshot', full_name='sigmadsp.backend_service.ControlRequest.restore_snapshot', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -186,8 +387,8 @@ _CONTROLREQUEST = _descriptor.Descriptor(
       create_key=_descriptor._internal_create_key,
     fields=[]),
   ],
-  serialized_start=252,
-  serialized_end=395,
+  serialized_start=597,
+  serialized_end=860,
 )
 
 
@@ -225,15 +426,348 @@ _CONTROLRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=397,
-  serialized_end=448,
+  serialized_start=862,
+  serialized_end=913,
 )
 
+
+_METRICSREQUEST = _descriptor.Descriptor(
+  name='MetricsRequest',
+  full_name='sigmadsp.backend_service.MetricsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=915,
+  serialized_end=931,
+)
+
+
+_LATENCYSUMMARY = _descriptor.Descriptor(
+  name='LatencySummary',
+  full_name='sigmadsp.backend_service.LatencySummary',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='sigmadsp.backend_service.LatencySummary.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='sigmadsp.backend_service.LatencySummary.count', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='mean_us', full_name='sigmadsp.backend_service.LatencySummary.mean_us', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='p50_us', full_name='sigmadsp.backend_service.LatencySummary.p50_us', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='p90_us', full_name='sigmadsp.backend_service.LatencySummary.p90_us', index=4,
+      number=5, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='p99_us', full_name='sigmadsp.backend_service.LatencySummary.p99_us', index=5,
+      number=6, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_us', full_name='sigmadsp.backend_service.LatencySummary.max_us', index=6,
+      number=7, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=933,
+  serialized_end=1059,
+)
+
+
+_COUNTER = _descriptor.Descriptor(
+  name='Counter',
+  full_name='sigmadsp.backend_service.Counter',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='sigmadsp.backend_service.Counter.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='sigmadsp.backend_service.Counter.value', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1061,
+  serialized_end=1099,
+)
+
+
+_DSPMETRICS = _descriptor.Descriptor(
+  name='DspMetrics',
+  full_name='sigmadsp.backend_service.DspMetrics',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='chip_address', full_name='sigmadsp.backend_service.DspMetrics.chip_address', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='latencies', full_name='sigmadsp.backend_service.DspMetrics.latencies', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='counters', full_name='sigmadsp.backend_service.DspMetrics.counters', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='utilization', full_name='sigmadsp.backend_service.DspMetrics.utilization', index=3,
+      number=4, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1102,
+  serialized_end=1271,
+)
+
+
+_METRICSRESPONSE = _descriptor.Descriptor(
+  name='MetricsResponse',
+  full_name='sigmadsp.backend_service.MetricsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='dsps', full_name='sigmadsp.backend_service.MetricsResponse.dsps', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1273,
+  serialized_end=1342,
+)
+
+
+_METERSREQUEST = _descriptor.Descriptor(
+  name='MetersRequest',
+  full_name='sigmadsp.backend_service.MetersRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1344,
+  serialized_end=1359,
+)
+
+
+_METERVALUE = _descriptor.Descriptor(
+  name='MeterValue',
+  full_name='sigmadsp.backend_service.MeterValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='sigmadsp.backend_service.MeterValue.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='address', full_name='sigmadsp.backend_service.MeterValue.address', index=1,
+      number=2, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='sigmadsp.backend_service.MeterValue.value', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1361,
+  serialized_end=1419,
+)
+
+
+_METERREADINGS = _descriptor.Descriptor(
+  name='MeterReadings',
+  full_name='sigmadsp.backend_service.MeterReadings',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='values', full_name='sigmadsp.backend_service.MeterReadings.values', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1421,
+  serialized_end=1490,
+)
+
+_RAMPVOLUME.fields_by_name['targets'].message_type = _RAMPTARGET
+_RAMPVOLUME.fields_by_name['curve'].enum_type = _CURVE
 _CONTROLPARAMETERREQUEST.fields_by_name['change_volume'].message_type = _CHANGEVOLUME
+_CONTROLPARAMETERREQUEST.fields_by_name['ramp_volume'].message_type = _RAMPVOLUME
 _CONTROLPARAMETERREQUEST.oneofs_by_name['command'].fields.append(
   _CONTROLPARAMETERREQUEST.fields_by_name['change_volume'])
 _CONTROLPARAMETERREQUEST.fields_by_name['change_volume'].containing_oneof = _CONTROLPARAMETERREQUEST.oneofs_by_name['command']
+_CONTROLPARAMETERREQUEST.oneofs_by_name['command'].fields.append(
+  _CONTROLPARAMETERREQUEST.fields_by_name['ramp_volume'])
+_CONTROLPARAMETERREQUEST.fields_by_name['ramp_volume'].containing_oneof = _CONTROLPARAMETERREQUEST.oneofs_by_name['command']
 _CONTROLREQUEST.fields_by_name['load_parameters'].message_type = _LOADPARAMETERS
+_CONTROLREQUEST.fields_by_name['deploy_program'].message_type = _DEPLOYPROGRAM
 _CONTROLREQUEST.oneofs_by_name['command'].fields.append(
   _CONTROLREQUEST.fields_by_name['reset_dsp'])
 _CONTROLREQUEST.fields_by_name['reset_dsp'].containing_oneof = _CONTROLREQUEST.oneofs_by_name['command']
@@ -243,11 +777,36 @@ _CONTROLREQUEST.fields_by_name['hard_reset_dsp'].containing_oneof = _CONTROLREQU
 _CONTROLREQUEST.oneofs_by_name['command'].fields.append(
   _CONTROLREQUEST.fields_by_name['load_parameters'])
 _CONTROLREQUEST.fields_by_name['load_parameters'].containing_oneof = _CONTROLREQUEST.oneofs_by_name['command']
+_CONTROLREQUEST.oneofs_by_name['command'].fields.append(
+  _CONTROLREQUEST.fields_by_name['deploy_program'])
+_CONTROLREQUEST.fields_by_name['deploy_program'].containing_oneof = _CONTROLREQUEST.oneofs_by_name['command']
+_CONTROLREQUEST.oneofs_by_name['command'].fields.append(
+  _CONTROLREQUEST.fields_by_name['save_snapshot'])
+_CONTROLREQUEST.fields_by_name['save_snapshot'].containing_oneof = _CONTROLREQUEST.oneofs_by_name['command']
+_CONTROLREQUEST.oneofs_by_name['command'].fields.append(
+  _CONTROLREQUEST.fields_by_name['restore_snapshot'])
+_CONTROLREQUEST.fields_by_name['restore_snapshot'].containing_oneof = _CONTROLREQUEST.oneofs_by_name['command']
+_DSPMETRICS.fields_by_name['latencies'].message_type = _LATENCYSUMMARY
+_DSPMETRICS.fields_by_name['counters'].message_type = _COUNTER
+_METRICSRESPONSE.fields_by_name['dsps'].message_type = _DSPMETRICS
+_METERREADINGS.fields_by_name['values'].message_type = _METERVALUE
 DESCRIPTOR.message_types_by_name['ChangeVolume'] = _CHANGEVOLUME
+DESCRIPTOR.message_types_by_name['RampTarget'] = _RAMPTARGET
+DESCRIPTOR.message_types_by_name['RampVolume'] = _RAMPVOLUME
 DESCRIPTOR.message_types_by_name['ControlParameterRequest'] = _CONTROLPARAMETERREQUEST
 DESCRIPTOR.message_types_by_name['LoadParameters'] = _LOADPARAMETERS
+DESCRIPTOR.message_types_by_name['DeployProgram'] = _DEPLOYPROGRAM
 DESCRIPTOR.message_types_by_name['ControlRequest'] = _CONTROLREQUEST
 DESCRIPTOR.message_types_by_name['ControlResponse'] = _CONTROLRESPONSE
+DESCRIPTOR.message_types_by_name['MetricsRequest'] = _METRICSREQUEST
+DESCRIPTOR.message_types_by_name['LatencySummary'] = _LATENCYSUMMARY
+DESCRIPTOR.message_types_by_name['Counter'] = _COUNTER
+DESCRIPTOR.message_types_by_name['DspMetrics'] = _DSPMETRICS
+DESCRIPTOR.message_types_by_name['MetricsResponse'] = _METRICSRESPONSE
+DESCRIPTOR.message_types_by_name['MetersRequest'] = _METERSREQUEST
+DESCRIPTOR.message_types_by_name['MeterValue'] = _METERVALUE
+DESCRIPTOR.message_types_by_name['MeterReadings'] = _METERREADINGS
+DESCRIPTOR.enum_types_by_name['Curve'] = _CURVE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 ChangeVolume = _reflection.GeneratedProtocolMessageType('ChangeVolume', (_message.Message,), {
@@ -257,6 +816,20 @@ ChangeVolume = _reflection.GeneratedProtocolMessageType('ChangeVolume', (_messag
   })
 _sym_db.RegisterMessage(ChangeVolume)
 
+RampTarget = _reflection.GeneratedProtocolMessageType('RampTarget', (_message.Message,), {
+  'DESCRIPTOR' : _RAMPTARGET,
+  '__module__' : 'control_pb2'
+  # @@protoc_insertion_point(class_scope:sigmadsp.backend_service.RampTarget)
+  })
+_sym_db.RegisterMessage(RampTarget)
+
+RampVolume = _reflection.GeneratedProtocolMessageType('RampVolume', (_message.Message,), {
+  'DESCRIPTOR' : _RAMPVOLUME,
+  '__module__' : 'control_pb2'
+  # @@protoc_insertion_point(class_scope:sigmadsp.backend_service.RampVolume)
+  })
+_sym_db.RegisterMessage(RampVolume)
+
 ControlParameterRequest = _reflection.GeneratedProtocolMessageType('ControlParameterRequest', (_message.Message,), {
   'DESCRIPTOR' : _CONTROLPARAMETERREQUEST,
   '__module__' : 'control_pb2'
@@ -271,6 +844,13 @@ LoadParameters = _reflection.GeneratedProtocolMessageType('LoadParameters', (_me
   })
 _sym_db.RegisterMessage(LoadParameters)
 
+DeployProgram = _reflection.GeneratedProtocolMessageType('DeployProgram', (_message.Message,), {
+  'DESCRIPTOR' : _DEPLOYPROGRAM,
+  '__module__' : 'control_pb2'
+  # @@protoc_insertion_point(class_scope:sigmadsp.backend_service.DeployProgram)
+  })
+_sym_db.RegisterMessage(DeployProgram)
+
 ControlRequest = _reflection.GeneratedProtocolMessageType('ControlRequest', (_message.Message,), {
   'DESCRIPTOR' : _CONTROLREQUEST,
   '__module__' : 'control_pb2'
@@ -285,6 +865,62 @@ ControlResponse = _reflection.GeneratedProtocolMessageType('ControlResponse', (_
   })
 _sym_db.RegisterMessage(ControlResponse)
 
+MetricsRequest = _reflection.GeneratedProtocolMessageType('MetricsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _METRICSREQUEST,
+  '__module__' : 'control_pb2'
+  # @@protoc_insertion_point(class_scope:sigmadsp.backend_service.MetricsRequest)
+  })
+_sym_db.RegisterMessage(MetricsRequest)
+
+LatencySummary = _reflection.GeneratedProtocolMessageType('LatencySummary', (_message.Message,), {
+  'DESCRIPTOR' : _LATENCYSUMMARY,
+  '__module__' : 'control_pb2'
+  # @@protoc_insertion_point(class_scope:sigmadsp.backend_service.LatencySummary)
+  })
+_sym_db.RegisterMessage(LatencySummary)
+
+Counter = _reflection.GeneratedProtocolMessageType('Counter', (_message.Message,), {
+  'DESCRIPTOR' : _COUNTER,
+  '__module__' : 'control_pb2'
+  # @@protoc_insertion_point(class_scope:sigmadsp.backend_service.Counter)
+  })
+_sym_db.RegisterMessage(Counter)
+
+DspMetrics = _reflection.GeneratedProtocolMessageType('DspMetrics', (_message.Message,), {
+  'DESCRIPTOR' : _DSPMETRICS,
+  '__module__' : 'control_pb2'
+  # @@protoc_insertion_point(class_scope:sigmadsp.backend_service.DspMetrics)
+  })
+_sym_db.RegisterMessage(DspMetrics)
+
+MetricsResponse = _reflection.GeneratedProtocolMessageType('MetricsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _METRICSRESPONSE,
+  '__module__' : 'control_pb2'
+  # @@protoc_insertion_point(class_scope:sigmadsp.backend_service.MetricsResponse)
+  })
+_sym_db.RegisterMessage(MetricsResponse)
+
+MetersRequest = _reflection.GeneratedProtocolMessageType('MetersRequest', (_message.Message,), {
+  'DESCRIPTOR' : _METERSREQUEST,
+  '__module__' : 'control_pb2'
+  # @@protoc_insertion_point(class_scope:sigmadsp.backend_service.MetersRequest)
+  })
+_sym_db.RegisterMessage(MetersRequest)
+
+MeterValue = _reflection.GeneratedProtocolMessageType('MeterValue', (_message.Message,), {
+  'DESCRIPTOR' : _METERVALUE,
+  '__module__' : 'control_pb2'
+  # @@protoc_insertion_point(class_scope:sigmadsp.backend_service.MeterValue)
+  })
+_sym_db.RegisterMessage(MeterValue)
+
+MeterReadings = _reflection.GeneratedProtocolMessageType('MeterReadings', (_message.Message,), {
+  'DESCRIPTOR' : _METERREADINGS,
+  '__module__' : 'control_pb2'
+  # @@protoc_insertion_point(class_scope:sigmadsp.backend_service.MeterReadings)
+  })
+_sym_db.RegisterMessage(MeterReadings)
+
 
 
 _BACKEND = _descriptor.ServiceDescriptor(
@@ -294,8 +930,8 @@ _BACKEND = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=451,
-  serialized_end=671,
+  serialized_start=1542,
+  serialized_end=1952,
   methods=[
   _descriptor.MethodDescriptor(
     name='control',
@@ -317,6 +953,26 @@ _BACKEND = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='metrics',
+    full_name='sigmadsp.backend_service.Backend.metrics',
+    index=2,
+    containing_service=None,
+    input_type=_METRICSREQUEST,
+    output_type=_METRICSRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='meters',
+    full_name='sigmadsp.backend_service.Backend.meters',
+    index=3,
+    containing_service=None,
+    input_type=_METERSREQUEST,
+    output_type=_METERREADINGS,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_BACKEND)
 
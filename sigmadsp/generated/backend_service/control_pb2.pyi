@@ -5,12 +5,30 @@ isort:skip_file
 import builtins
 import google.protobuf.descriptor
 import google.protobuf.internal.containers
+import google.protobuf.internal.enum_type_wrapper
 import google.protobuf.message
 import typing
 import typing_extensions
 
 DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
 
+class _Curve:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _CurveEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_Curve.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    LINEAR: _Curve.ValueType  # 0
+    DB_LINEAR: _Curve.ValueType  # 1
+    S_CURVE: _Curve.ValueType  # 2
+class Curve(_Curve, metaclass=_CurveEnumTypeWrapper):
+    pass
+
+LINEAR: Curve.ValueType  # 0
+DB_LINEAR: Curve.ValueType  # 1
+S_CURVE: Curve.ValueType  # 2
+global___Curve = Curve
+
+
 class ChangeVolume(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
     NAME_TOKENS_FIELD_NUMBER: builtins.int
@@ -29,18 +47,55 @@ class ChangeVolume(google.protobuf.message.Message):
     def ClearField(self, field_name: typing_extensions.Literal["name_tokens",b"name_tokens","relative",b"relative","value",b"value"]) -> None: ...
 global___ChangeVolume = ChangeVolume
 
+class RampTarget(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    NAME_TOKENS_FIELD_NUMBER: builtins.int
+    VALUE_DB_FIELD_NUMBER: builtins.int
+    @property
+    def name_tokens(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]: ...
+    value_db: builtins.float
+    def __init__(self,
+        *,
+        name_tokens: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        value_db: builtins.float = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["name_tokens",b"name_tokens","value_db",b"value_db"]) -> None: ...
+global___RampTarget = RampTarget
+
+class RampVolume(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    TARGETS_FIELD_NUMBER: builtins.int
+    DURATION_S_FIELD_NUMBER: builtins.int
+    CURVE_FIELD_NUMBER: builtins.int
+    @property
+    def targets(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___RampTarget]: ...
+    duration_s: builtins.float
+    curve: global___Curve.ValueType
+    def __init__(self,
+        *,
+        targets: typing.Optional[typing.Iterable[global___RampTarget]] = ...,
+        duration_s: builtins.float = ...,
+        curve: global___Curve.ValueType = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["curve",b"curve","duration_s",b"duration_s","targets",b"targets"]) -> None: ...
+global___RampVolume = RampVolume
+
 class ControlParameterRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
     CHANGE_VOLUME_FIELD_NUMBER: builtins.int
+    RAMP_VOLUME_FIELD_NUMBER: builtins.int
     @property
     def change_volume(self) -> global___ChangeVolume: ...
+    @property
+    def ramp_volume(self) -> global___RampVolume: ...
     def __init__(self,
         *,
         change_volume: typing.Optional[global___ChangeVolume] = ...,
+        ramp_volume: typing.Optional[global___RampVolume] = ...,
         ) -> None: ...
-    def HasField(self, field_name: typing_extensions.Literal["change_volume",b"change_volume","command",b"command"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing_extensions.Literal["change_volume",b"change_volume","command",b"command"]) -> None: ...
-    def WhichOneof(self, oneof_group: typing_extensions.Literal["command",b"command"]) -> typing.Optional[typing_extensions.Literal["change_volume"]]: ...
+    def HasField(self, field_name: typing_extensions.Literal["change_volume",b"change_volume","command",b"command","ramp_volume",b"ramp_volume"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["change_volume",b"change_volume","command",b"command","ramp_volume",b"ramp_volume"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["command",b"command"]) -> typing.Optional[typing_extensions.Literal["change_volume","ramp_volume"]]: ...
 global___ControlParameterRequest = ControlParameterRequest
 
 class LoadParameters(google.protobuf.message.Message):
@@ -55,24 +110,54 @@ class LoadParameters(google.protobuf.message.Message):
     def ClearField(self, field_name: typing_extensions.Literal["content",b"content"]) -> None: ...
 global___LoadParameters = LoadParameters
 
+class DeployProgram(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    TX_BUFFER_FIELD_NUMBER: builtins.int
+    NUM_BYTES_FIELD_NUMBER: builtins.int
+    FORCE_FIELD_NUMBER: builtins.int
+    CHIP_ADDRESS_FIELD_NUMBER: builtins.int
+    tx_buffer: typing.Text
+    num_bytes: typing.Text
+    force: builtins.bool
+    chip_address: builtins.int
+    def __init__(self,
+        *,
+        tx_buffer: typing.Text = ...,
+        num_bytes: typing.Text = ...,
+        force: builtins.bool = ...,
+        chip_address: builtins.int = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["chip_address",b"chip_address","force",b"force","num_bytes",b"num_bytes","tx_buffer",b"tx_buffer"]) -> None: ...
+global___DeployProgram = DeployProgram
+
 class ControlRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
     RESET_DSP_FIELD_NUMBER: builtins.int
     HARD_RESET_DSP_FIELD_NUMBER: builtins.int
     LOAD_PARAMETERS_FIELD_NUMBER: builtins.int
+    DEPLOY_PROGRAM_FIELD_NUMBER: builtins.int
+    SAVE_SNAPSHOT_FIELD_NUMBER: builtins.int
+    RESTORE_SNAPSHOT_FIELD_NUMBER: builtins.int
     reset_dsp: builtins.bool
     hard_reset_dsp: builtins.bool
     @property
     def load_parameters(self) -> global___LoadParameters: ...
+    @property
+    def deploy_program(self) -> global___DeployProgram: ...
+    save_snapshot: typing.Text
+    restore_snapshot: typing.Text
     def __init__(self,
         *,
         reset_dsp: builtins.bool = ...,
         hard_reset_dsp: builtins.bool = ...,
         load_parameters: typing.Optional[global___LoadParameters] = ...,
+        deploy_program: typing.Optional[global___DeployProgram] = ...,
+        save_snapshot: typing.Text = ...,
+        restore_snapshot: typing.Text = ...,
         ) -> None: ...
-    def HasField(self, field_name: typing_extensions.Literal["command",b"command","hard_reset_dsp",b"hard_reset_dsp","load_parameters",b"load_parameters","reset_dsp",b"reset_dsp"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing_extensions.Literal["command",b"command","hard_reset_dsp",b"hard_reset_dsp","load_parameters",b"load_parameters","reset_dsp",b"reset_dsp"]) -> None: ...
-    def WhichOneof(self, oneof_group: typing_extensions.Literal["command",b"command"]) -> typing.Optional[typing_extensions.Literal["reset_dsp","hard_reset_dsp","load_parameters"]]: ...
+    def HasField(self, field_name: typing_extensions.Literal["command",b"command","deploy_program",b"deploy_program","hard_reset_dsp",b"hard_reset_dsp","load_parameters",b"load_parameters","reset_dsp",b"reset_dsp","restore_snapshot",b"restore_snapshot","save_snapshot",b"save_snapshot"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["command",b"command","deploy_program",b"deploy_program","hard_reset_dsp",b"hard_reset_dsp","load_parameters",b"load_parameters","reset_dsp",b"reset_dsp","restore_snapshot",b"restore_snapshot","save_snapshot",b"save_snapshot"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["command",b"command"]) -> typing.Optional[typing_extensions.Literal["reset_dsp","hard_reset_dsp","load_parameters","deploy_program","save_snapshot","restore_snapshot"]]: ...
 global___ControlRequest = ControlRequest
 
 class ControlResponse(google.protobuf.message.Message):
@@ -88,3 +173,121 @@ class ControlResponse(google.protobuf.message.Message):
         ) -> None: ...
     def ClearField(self, field_name: typing_extensions.Literal["message",b"message","success",b"success"]) -> None: ...
 global___ControlResponse = ControlResponse
+
+class MetricsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    def __init__(self,
+        ) -> None: ...
+global___MetricsRequest = MetricsRequest
+
+class LatencySummary(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    NAME_FIELD_NUMBER: builtins.int
+    COUNT_FIELD_NUMBER: builtins.int
+    MEAN_US_FIELD_NUMBER: builtins.int
+    P50_US_FIELD_NUMBER: builtins.int
+    P90_US_FIELD_NUMBER: builtins.int
+    P99_US_FIELD_NUMBER: builtins.int
+    MAX_US_FIELD_NUMBER: builtins.int
+    name: typing.Text
+    count: builtins.int
+    mean_us: builtins.float
+    p50_us: builtins.int
+    p90_us: builtins.int
+    p99_us: builtins.int
+    max_us: builtins.int
+    def __init__(self,
+        *,
+        name: typing.Text = ...,
+        count: builtins.int = ...,
+        mean_us: builtins.float = ...,
+        p50_us: builtins.int = ...,
+        p90_us: builtins.int = ...,
+        p99_us: builtins.int = ...,
+        max_us: builtins.int = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["count",b"count","max_us",b"max_us","mean_us",b"mean_us","name",b"name","p50_us",b"p50_us","p90_us",b"p90_us","p99_us",b"p99_us"]) -> None: ...
+global___LatencySummary = LatencySummary
+
+class Counter(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    NAME_FIELD_NUMBER: builtins.int
+    VALUE_FIELD_NUMBER: builtins.int
+    name: typing.Text
+    value: builtins.int
+    def __init__(self,
+        *,
+        name: typing.Text = ...,
+        value: builtins.int = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["name",b"name","value",b"value"]) -> None: ...
+global___Counter = Counter
+
+class DspMetrics(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    CHIP_ADDRESS_FIELD_NUMBER: builtins.int
+    LATENCIES_FIELD_NUMBER: builtins.int
+    COUNTERS_FIELD_NUMBER: builtins.int
+    UTILIZATION_FIELD_NUMBER: builtins.int
+    chip_address: builtins.int
+    @property
+    def latencies(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___LatencySummary]: ...
+    @property
+    def counters(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___Counter]: ...
+    utilization: builtins.float
+    def __init__(self,
+        *,
+        chip_address: builtins.int = ...,
+        latencies: typing.Optional[typing.Iterable[global___LatencySummary]] = ...,
+        counters: typing.Optional[typing.Iterable[global___Counter]] = ...,
+        utilization: builtins.float = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["chip_address",b"chip_address","counters",b"counters","latencies",b"latencies","utilization",b"utilization"]) -> None: ...
+global___DspMetrics = DspMetrics
+
+class MetricsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    DSPS_FIELD_NUMBER: builtins.int
+    @property
+    def dsps(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___DspMetrics]: ...
+    def __init__(self,
+        *,
+        dsps: typing.Optional[typing.Iterable[global___DspMetrics]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dsps",b"dsps"]) -> None: ...
+global___MetricsResponse = MetricsResponse
+
+class MetersRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    def __init__(self,
+        ) -> None: ...
+global___MetersRequest = MetersRequest
+
+class MeterValue(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    NAME_FIELD_NUMBER: builtins.int
+    ADDRESS_FIELD_NUMBER: builtins.int
+    VALUE_FIELD_NUMBER: builtins.int
+    name: typing.Text
+    address: builtins.int
+    value: builtins.float
+    def __init__(self,
+        *,
+        name: typing.Text = ...,
+        address: builtins.int = ...,
+        value: builtins.float = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["address",b"address","name",b"name","value",b"value"]) -> None: ...
+global___MeterValue = MeterValue
+
+class MeterReadings(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    VALUES_FIELD_NUMBER: builtins.int
+    @property
+    def values(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___MeterValue]: ...
+    def __init__(self,
+        *,
+        values: typing.Optional[typing.Iterable[global___MeterValue]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["values",b"values"]) -> None: ...
+global___MeterReadings = MeterReadings
@@ -24,6 +24,16 @@ class BackendStub(object):
                 request_serializer=control__pb2.ControlParameterRequest.SerializeToString,
                 response_deserializer=control__pb2.ControlResponse.FromString,
                 )
+        self.metrics = channel.unary_unary(
+                '/sigmadsp.backend_service.Backend/metrics',
+                request_serializer=control__pb2.MetricsRequest.SerializeToString,
+                response_deserializer=control__pb2.MetricsResponse.FromString,
+                )
+        self.meters = channel.unary_stream(
+                '/sigmadsp.backend_service.Backend/meters',
+                request_serializer=control__pb2.MetersRequest.SerializeToString,
+                response_deserializer=control__pb2.MeterReadings.FromString,
+                )
 
 
 class BackendServicer(object):
@@ -41,6 +51,18 @@ class BackendServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def metrics(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def meters(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_BackendServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -54,6 +76,16 @@ def add_BackendServicer_to_server(servicer, server):
                     request_deserializer=control__pb2.ControlParameterRequest.FromString,
                     response_serializer=control__pb2.ControlResponse.SerializeToString,
             ),
+            'metrics': grpc.unary_unary_rpc_method_handler(
+                    servicer.metrics,
+                    request_deserializer=control__pb2.MetricsRequest.FromString,
+                    response_serializer=control__pb2.MetricsResponse.SerializeToString,
+            ),
+            'meters': grpc.unary_stream_rpc_method_handler(
+                    servicer.meters,
+                    request_deserializer=control__pb2.MetersRequest.FromString,
+                    response_serializer=control__pb2.MeterReadings.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'sigmadsp.backend_service.Backend', rpc_method_handlers)
@@ -97,3 +129,37 @@ class Backend(object):
             control__pb2.ControlResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def metrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/sigmadsp.backend_service.Backend/metrics',
+            control__pb2.MetricsRequest.SerializeToString,
+            control__pb2.MetricsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def meters(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/sigmadsp.backend_service.Backend/meters',
+            control__pb2.MetersRequest.SerializeToString,
+            control__pb2.MeterReadings.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -6,10 +6,15 @@
 - Performing soft reset
 """
 import logging
-from typing import Union
+import struct
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Union
 
 from sigmadsp.hardware.dsp import Dsp
+from sigmadsp.hardware.memory import MemoryMap, MemoryRegion
 from sigmadsp.helper.conversion import (
+    bytes_to_int16,
     bytes_to_int32,
     float_to_frac_8_24,
     frac_8_24_to_float,
@@ -24,6 +29,58 @@ logger = logging.getLogger(__name__)
 class Adau14xx(Dsp):
     """A class for controlling functionality of Analog Devices Sigma DSPs, especially ADAU14xx series parts."""
 
+    # Memories and registers, as seen from the control port
+    MEMORY_MAP = MemoryMap(
+        [
+            MemoryRegion("data memory 0", 0x0000, 0x4FFF, 4),
+            MemoryRegion("data memory 1", 0x6000, 0xAFFF, 4),
+            MemoryRegion("program memory", 0xC000, 0xDFFF, 4),
+            MemoryRegion("registers", 0xF000, 0xFFFF, 2, volatile=True),
+        ]
+    )
+
+    # Data memory, apart from the safeload registers, which would not reflect the effect of a safeload
+    PARAMETER_REGIONS = [
+        MemoryRegion("data memory 0", 0x0000, 0x4FFF, 4),
+        MemoryRegion("data memory 1", 0x6007, 0xAFFF, 4),
+    ]
+
+    # Program and parameters, which are restored while the core is stopped
+    SNAPSHOT_MEMORY_REGIONS = [MemoryRegion("program memory", 0xC000, 0xDFFF, 4), *PARAMETER_REGIONS]
+
+    # Clock and power setup, memories, serial port setup, and the core start registers
+    SNAPSHOT_REGIONS = [
+        MemoryRegion("pll registers", 0xF000, 0xF003, 2),
+        MemoryRegion("mclk output register", 0xF005, 0xF005, 2),
+        MemoryRegion("power registers", 0xF050, 0xF051, 2),
+        *SNAPSHOT_MEMORY_REGIONS,
+        MemoryRegion("serial port registers", 0xF200, 0xF21F, 2),
+        MemoryRegion("core start registers", 0xF401, 0xF402, 2),
+    ]
+
+    # All control registers are two bytes long
+    CONTROL_REGISTER_LENGTH = 2
+
+    # The PLL is set up while it is disabled, and has to lock after it was enabled, before memories can be accessed.
+    PLL_CONTROL_REGISTER = 0xF000
+    PLL_ENABLE_REGISTER = 0xF003
+    PLL_LOCK_REGISTER = 0xF004
+    PLL_LOCK_MASK = 1 << 0
+    PLL_LOCK_TIMEOUT_S = 0.1
+
+    MCLK_OUT_REGISTER = 0xF005
+
+    # Power of the serial ports, converters and other peripherals
+    POWER_ENABLE_REGISTER = 0xF050
+
+    SERIAL_PORT_REGISTER = 0xF200
+
+    # Core control: hibernation stops the core at the end of the current frame, before it is killed.
+    HIBERNATE_REGISTER = 0xF400
+    START_PULSE_REGISTER = 0xF401
+    START_CORE_REGISTER = 0xF402
+    KILL_CORE_REGISTER = 0xF403
+
     # Addresses and sizes of important registers
     RESET_REGISTER = 0xF890
     RESET_REGISTER_LENGTH = 2
@@ -34,6 +91,10 @@ class Adau14xx(Dsp):
     SAFELOAD_COUNT_REGISTER = 0x6006
     SAFELOAD_DATA_REGISTER_LENGTH = 4
 
+    # The safeload data registers only take effect, when the safeload count register is written.
+    SCRATCH_REGISTER = SAFELOAD_DATA_REGISTERS[0]
+    SCRATCH_REGISTER_LENGTH = len(SAFELOAD_DATA_REGISTERS) * SAFELOAD_DATA_REGISTER_LENGTH
+
     # All fixpoint (parameter) registers are four bytes long
     FIXPOINT_REGISTER_LENGTH = 4
 
@@ -46,17 +107,84 @@ class Adau14xx(Dsp):
         self.write(Adau14xx.RESET_REGISTER, int16_to_bytes(1))
         logger.info("Soft-resetting the DSP.")
 
-    def get_parameter_value(self, address: int, data_format: str) -> Union[float, int, None]:
+    def _restore(self, blocks: Dict[int, bytes]) -> List[Future]:
+        """Write the contents of all `SNAPSHOT_REGIONS` in the order that the chip requires.
+
+        The PLL is set up and has to lock first, and the power registers follow. The core is hibernated and killed,
+        while memories and serial ports are restored, and started again by the core start registers.
+
+        Args:
+            blocks (Dict[int, bytes]): The contents by start address of the region.
+
+        Raises:
+            OSError: If the PLL does not lock.
+
+        Returns:
+            List[Future]: The futures of all writes.
+        """
+        pll_block = blocks[Adau14xx.PLL_CONTROL_REGISTER]
+        pll_enable = pll_block[-Adau14xx.CONTROL_REGISTER_LENGTH :]
+
+        futures = [
+            self.write(Adau14xx.PLL_ENABLE_REGISTER, int16_to_bytes(0)),
+            self.write(Adau14xx.PLL_CONTROL_REGISTER, pll_block[: -Adau14xx.CONTROL_REGISTER_LENGTH]),
+            self.write(Adau14xx.MCLK_OUT_REGISTER, blocks[Adau14xx.MCLK_OUT_REGISTER]),
+            self.write(Adau14xx.PLL_ENABLE_REGISTER, pll_enable),
+        ]
+
+        if bytes_to_int16(pll_enable):
+            self._wait_for_pll_lock()
+
+        futures.append(self.write(Adau14xx.POWER_ENABLE_REGISTER, blocks[Adau14xx.POWER_ENABLE_REGISTER]))
+
+        # The core finishes its frame, before it is killed.
+        futures.append(self.protocol_handler.write(Adau14xx.HIBERNATE_REGISTER, int16_to_bytes(1), hold_s=self.frame_s))
+        futures.append(self.write(Adau14xx.KILL_CORE_REGISTER, int16_to_bytes(1)))
+
+        for region in Adau14xx.SNAPSHOT_MEMORY_REGIONS:
+            futures.append(self.write(region.start, blocks[region.start]))
+
+        futures.append(self.write(Adau14xx.SERIAL_PORT_REGISTER, blocks[Adau14xx.SERIAL_PORT_REGISTER]))
+
+        # The core starts on a rising edge of the start core register.
+        futures.append(self.write(Adau14xx.START_CORE_REGISTER, int16_to_bytes(0)))
+        futures.append(self.write(Adau14xx.KILL_CORE_REGISTER, int16_to_bytes(0)))
+        futures.append(self.write(Adau14xx.START_PULSE_REGISTER, blocks[Adau14xx.START_PULSE_REGISTER]))
+        futures.append(self.write(Adau14xx.HIBERNATE_REGISTER, int16_to_bytes(0)))
+
+        return futures
+
+    def _wait_for_pll_lock(self):
+        """Wait for the PLL to lock, after it was enabled.
+
+        Raises:
+            OSError: If the PLL does not lock within `PLL_LOCK_TIMEOUT_S`.
+        """
+        deadline = time.monotonic() + Adau14xx.PLL_LOCK_TIMEOUT_S
+
+        while True:
+            lock = bytes_to_int16(self.read(Adau14xx.PLL_LOCK_REGISTER, Adau14xx.CONTROL_REGISTER_LENGTH))
+
+            if lock & Adau14xx.PLL_LOCK_MASK:
+                return
+
+            if time.monotonic() > deadline:
+                raise OSError("The PLL of the DSP did not lock.")
+
+            time.sleep(self.frame_s)
+
+    def get_parameter_value(self, address: int, data_format: str, cached: bool = False) -> Union[float, int, None]:
         """Get a parameter value from a chosen register address.
 
         Args:
             address (int): The address to look at.
             data_format (str): The data type to return the register in. Can be 'float' or 'int'.
+            cached (bool, optional): If True, a known value is taken from the parameter shadow. Defaults to False.
 
         Returns:
             Union[float, int, None]: Representation of the register content in the specified format.
         """
-        data_register = self.read(address, Adau14xx.FIXPOINT_REGISTER_LENGTH)
+        data_register = self.read(address, Adau14xx.FIXPOINT_REGISTER_LENGTH, cached)
         data_integer = bytes_to_int32(data_register)
 
         if "int" == data_format:
@@ -68,6 +196,30 @@ class Adau14xx(Dsp):
         else:
             return None
 
+    def decode_parameter_values(self, data: bytes) -> List[float]:
+        """Decode consecutive parameter words, e.g. from a single read of several cells.
+
+        Args:
+            data (bytes): The words, which are signed 8.24 fixpoint values.
+
+        Returns:
+            List[float]: The values.
+        """
+        count = len(data) // Adau14xx.FIXPOINT_REGISTER_LENGTH
+
+        return [frac_8_24_to_float(value) for value in struct.unpack_from(f">{count}i", data)]
+
+    def encode_parameter_values(self, values: List[float]) -> bytes:
+        """Encode values as consecutive parameter words, e.g. for a single safeload of several cells.
+
+        Args:
+            values (List[float]): The values.
+
+        Returns:
+            bytes: The words, which are signed 8.24 fixpoint values.
+        """
+        return struct.pack(f">{len(values)}i", *(float_to_frac_8_24(value) for value in values))
+
     def set_parameter_value(self, value: Union[float, int], address: int) -> None:
         """Set a parameter value for a chosen register address.
 
@@ -86,25 +238,25 @@ class Adau14xx(Dsp):
         if data_register is not None:
             self.safeload(address, data_register)
 
-    def safeload(self, address: int, data: bytes, count: int = 1):
-        """Write data to the chip using software safeload.
+    def _safeload_words(self, address: int, data: bytes, count: int) -> Future:
+        """Write data to the chip using software safeload, as a single bus transaction.
+
+        The safeload registers are written through the protocol handler, such that the parameter shadow only records
+        the target of the safeload.
 
         Args:
             address (int): Address to write to
             data (bytes): Data to write; multiple parameters should be concatenated
-            count (int): Number of 4 byte words to write
+            count (int): Number of 4 byte words to write (max. 5)
+
+        Returns:
+            Future: The future of the write to the safeload count register.
         """
-        if count > len(Adau14xx.SAFELOAD_DATA_REGISTERS):
-            raise IndexError(
-                f"Cannot write {count * 4} bytes by means of software safeload, the maximum is "
-                f"{len(Adau14xx.SAFELOAD_DATA_REGISTERS) * 4} bytes."
-            )
-        for register_index, register_address in zip(range(count), Adau14xx.SAFELOAD_DATA_REGISTERS):
-            data_buf = data[
-                register_index * self.FIXPOINT_REGISTER_LENGTH : (register_index + 1) * self.FIXPOINT_REGISTER_LENGTH
-            ]
-            self.write(register_address, data_buf)
-
-        # TODO: test if the address is supposed to be shifted down by 1 as old forum posts suggest
-        self.write(self.SAFELOAD_ADDRESS_REGISTER, int32_to_bytes(address))
-        self.write(self.SAFELOAD_COUNT_REGISTER, int32_to_bytes(count))
+        with self.transaction():
+            for register_index, register_address in zip(range(count), Adau14xx.SAFELOAD_DATA_REGISTERS):
+                offset = register_index * self.FIXPOINT_REGISTER_LENGTH
+                self.protocol_handler.write(register_address, data[offset : offset + self.FIXPOINT_REGISTER_LENGTH])
+
+            # TODO: test if the address is supposed to be shifted down by 1 as old forum posts suggest
+            self.protocol_handler.write(self.SAFELOAD_ADDRESS_REGISTER, int32_to_bytes(address))
+            return self.protocol_handler.write(self.SAFELOAD_COUNT_REGISTER, int32_to_bytes(count), hold_s=self.frame_s)
@@ -5,9 +5,13 @@
 - Reading parameter registers
 """
 import logging
-from typing import Union
+import struct
+from concurrent.futures import Future
+from typing import ContextManager, Dict, List, Optional, Union
 
+from sigmadsp.hardware.base_protocol import Operation
 from sigmadsp.hardware.dsp import Dsp
+from sigmadsp.hardware.memory import MemoryMap, MemoryRegion
 from sigmadsp.helper.conversion import (
     bytes_to_int16,
     bytes_to_int32,
@@ -24,26 +28,71 @@ logger = logging.getLogger(__name__)
 class Adau1701(Dsp):
     """A class for controlling functionality of Analog Devices Sigma DSPs, especially ADAU1701 series parts."""
 
+    # Memories and registers, as seen from the control port
+    MEMORY_MAP = MemoryMap(
+        [
+            MemoryRegion("parameter memory", 0x0000, 0x03FF, 4),
+            MemoryRegion("program memory", 0x0400, 0x07FF, 5),
+            MemoryRegion("interface registers", 0x0800, 0x0807, 4, volatile=True),
+            MemoryRegion("gpio registers", 0x0808, 0x080F, 2, volatile=True),
+            MemoryRegion("safeload data registers", 0x0810, 0x0814, 5, volatile=True),
+            MemoryRegion("safeload address registers", 0x0815, 0x0819, 2, volatile=True),
+            MemoryRegion("control registers", 0x081A, 0x081E, 2, volatile=True),
+            MemoryRegion("serial input control register", 0x081F, 0x081F, 1, volatile=True),
+            MemoryRegion("multipurpose pin registers", 0x0820, 0x0821, 3, volatile=True),
+            MemoryRegion("auxiliary and dac registers", 0x0822, 0x0827, 2, volatile=True),
+        ]
+    )
+
+    # Parameter memory, which is only changed by the host
+    PARAMETER_REGIONS = [MemoryRegion("parameter memory", 0x0000, 0x03FF, 4)]
+
+    # Program and parameters, then serial port, pin and converter setup, and the core control register last
+    SNAPSHOT_REGIONS = [
+        MemoryRegion("program memory", 0x0400, 0x07FF, 5),
+        *PARAMETER_REGIONS,
+        MemoryRegion("serial output control register", 0x081E, 0x081E, 2),
+        MemoryRegion("serial input control register", 0x081F, 0x081F, 1),
+        MemoryRegion("multipurpose pin registers", 0x0820, 0x0821, 3),
+        MemoryRegion("auxiliary and dac registers", 0x0822, 0x0827, 2),
+        MemoryRegion("core control register", 0x081C, 0x081C, 2),
+    ]
+
     # Addresses and sizes of important registers
     CONTROL_REGISTER = 0x081C
     CONTROL_REGISTER_LENGTH = 2
 
-    # All fixpoint (parameter) registers are four bytes long
+    # All fixpoint (parameter) registers are four bytes long, with 28 significant bits
     FIXPOINT_REGISTER_LENGTH = 4
+    FIXPOINT_MASK = 0x0FFFFFFF
+    FIXPOINT_SIGN_BIT = 0x08000000
 
     # Safeload registers (address, data)
     SAFELOAD_REGISTERS = [
         (0x0815, 0x810),
         (0x0816, 0x811),
-        (0x0815, 0x812),
+        (0x0817, 0x812),
         (0x0818, 0x813),
         (0x0819, 0x814),
     ]
 
+    # The bit in the control register that initiates a safeload transfer, and clears itself afterwards
+    IST_MASK = 1 << 5
+
+    # The bit in the control register that runs the core, which is held and has its internal registers cleared at 0
+    CORE_RUN_MASK = 1 << 2
+
     # Safeload register length
     SAFELOAD_SA_LENGTH = 2
     SAFELOAD_SD_LENGTH = 5
 
+    # The safeload data registers only take effect, when a safeload is initiated in the control register.
+    SCRATCH_REGISTER = SAFELOAD_REGISTERS[0][1]
+    SCRATCH_REGISTER_LENGTH = SAFELOAD_SD_LENGTH
+
+    # The last known content of the control register, without the IST bit, or None, if it is unknown
+    _control_register: Optional[int] = None
+
     def soft_reset(self):
         """Soft reset the DSP.
 
@@ -51,17 +100,97 @@ class Adau1701(Dsp):
         """
         logger.info("Soft-resetting the DSP is not available on ADAU1701")
 
-    def get_parameter_value(self, address: int, data_format: str) -> Union[float, int, None]:
+    def hard_reset(self, delay: float = 0):
+        """Hard reset the DSP, which also resets its control register.
+
+        Args:
+            delay (float, optional): The time in seconds to hold the DSP in reset. Defaults to 0.
+        """
+        self._control_register = None
+        super().hard_reset(delay)
+
+    def write(self, address: int, data: bytes, coalesce: bool = False) -> Future:
+        """Write data to the DSP, keeping track of the content of the control register.
+
+        Args:
+            address (int): Address to write to
+            data (bytes): Data to write
+            coalesce (bool, optional): If True, the write may be merged with directly following coalescing writes to
+                contiguous addresses. Defaults to False.
+
+        Returns:
+            Future: The future that resolves, once the data was written.
+        """
+        if address == Adau1701.CONTROL_REGISTER and len(data) >= Adau1701.CONTROL_REGISTER_LENGTH:
+            self._control_register = bytes_to_int16(data[: Adau1701.CONTROL_REGISTER_LENGTH]) & ~Adau1701.IST_MASK
+
+        elif address < Adau1701.CONTROL_REGISTER < address + len(data):
+            # The write may span the control register, whose content is read again, when it is needed.
+            self._control_register = None
+
+        return super().write(address, data, coalesce)
+
+    def transaction(self) -> ContextManager[List[Operation]]:
+        """Collect all writes within this context, and send them to the DSP as a single bus transaction.
+
+        The control register is read beforehand, if its content is unknown, such that safeloads can be part of the
+        transaction.
+
+        Returns:
+            ContextManager[List[Operation]]: The transaction context of the communication handler.
+        """
+        if not self.protocol_handler.in_transaction():
+            self._control_register_value()
+
+        return super().transaction()
+
+    def _restore(self, blocks: Dict[int, bytes]) -> List[Future]:
+        """Write the contents of all `SNAPSHOT_REGIONS` in the order that the chip requires.
+
+        The core is held, while the memories and the setup registers are restored, and released by restoring the
+        control register last.
+
+        Args:
+            blocks (Dict[int, bytes]): The contents by start address of the region.
+
+        Returns:
+            List[Future]: The futures of all writes.
+        """
+        control = bytes_to_int16(blocks[Adau1701.CONTROL_REGISTER]) & ~Adau1701.IST_MASK
+        futures = [self.write(Adau1701.CONTROL_REGISTER, int16_to_bytes(control & ~Adau1701.CORE_RUN_MASK))]
+
+        for region in self.SNAPSHOT_REGIONS:
+            if region.start != Adau1701.CONTROL_REGISTER:
+                futures.append(self.write(region.start, blocks[region.start]))
+
+        futures.append(self.write(Adau1701.CONTROL_REGISTER, int16_to_bytes(control)))
+
+        return futures
+
+    def _control_register_value(self) -> int:
+        """Get the content of the control register, which is only read from the DSP, if it is unknown.
+
+        Returns:
+            int: The content, without the IST bit.
+        """
+        if self._control_register is None:
+            control_bytes = self.read(Adau1701.CONTROL_REGISTER, Adau1701.CONTROL_REGISTER_LENGTH)
+            self._control_register = bytes_to_int16(control_bytes) & ~Adau1701.IST_MASK
+
+        return self._control_register
+
+    def get_parameter_value(self, address: int, data_format: str, cached: bool = False) -> Union[float, int, None]:
         """Get a parameter value from a chosen register address.
 
         Args:
             address (int): The address to look at.
             data_format (str): The data type to return the register in. Can be 'float' or 'int'.
+            cached (bool, optional): If True, a known value is taken from the parameter shadow. Defaults to False.
 
         Returns:
             Union[float, int, None]: Representation of the register content in the specified format.
         """
-        data_register = self.read(address, Adau1701.FIXPOINT_REGISTER_LENGTH)
+        data_register = self.read(address, Adau1701.FIXPOINT_REGISTER_LENGTH, cached)
         data_integer = bytes_to_int32(data_register)
 
         float_value = frac_5_23_to_float(data_integer)
@@ -75,6 +204,35 @@ class Adau1701(Dsp):
         else:
             return None
 
+    def encode_parameter_values(self, values: List[float]) -> bytes:
+        """Encode values as consecutive parameter words, e.g. for a single safeload of several cells.
+
+        Args:
+            values (List[float]): The values.
+
+        Returns:
+            bytes: The words, which are signed 5.23 fixpoint values.
+        """
+        return struct.pack(
+            f">{len(values)}I", *(float_to_frac_5_23(value) & Adau1701.FIXPOINT_MASK for value in values)
+        )
+
+    def decode_parameter_values(self, data: bytes) -> List[float]:
+        """Decode consecutive parameter words, e.g. from a single read of several cells.
+
+        Args:
+            data (bytes): The words, which are signed 5.23 fixpoint values in the lower 28 bits.
+
+        Returns:
+            List[float]: The values.
+        """
+        count = len(data) // Adau1701.FIXPOINT_REGISTER_LENGTH
+
+        return [
+            frac_5_23_to_float((value & Adau1701.FIXPOINT_MASK) - (value & Adau1701.FIXPOINT_SIGN_BIT) * 2)
+            for value in struct.unpack_from(f">{count}I", data)
+        ]
+
     def set_parameter_value(self, value: Union[float, int], address: int) -> None:
         """Set a parameter value for a chosen register address.
 
@@ -88,31 +246,37 @@ class Adau1701(Dsp):
         if data_register is not None:
             self.safeload(address, data_register)
 
-    def safeload(self, address: int, data: bytes, count: int = 1):
-        """Write data to the chip using hardware safeload.
+    def _safeload_words(self, address: int, data: bytes, count: int) -> Future:
+        """Write data to the chip using hardware safeload, as a single bus transaction.
+
+        The safeload registers are written through the protocol handler, such that the parameter shadow only records
+        the target of the safeload.
 
         Args:
             address (int): Address to write to
             data (bytes): Data to write; multiple words should be concatenated
             count (int): number of words to write (max. 5)
-        """
-        # load up the address and data in safeload registers
-        for sd in range(0, count):
-            address_register, data_register = Adau1701.SAFELOAD_REGISTERS[sd]
-            address_bytes = int16_to_bytes(address)
-            data_buf = bytearray(Adau1701.SAFELOAD_SD_LENGTH)
 
-            data_buf[1:] = data[sd * Adau1701.FIXPOINT_REGISTER_LENGTH : (sd + 1) * Adau1701.FIXPOINT_REGISTER_LENGTH]
-
-            self.write(address_register, address_bytes)
-            self.write(data_register, data_buf)
+        Returns:
+            Future: The future of the write to the control register, which starts the safeload.
+        """
+        control_reg = self._control_register_value() | Adau1701.IST_MASK
 
-        control_bytes = self.read(Adau1701.CONTROL_REGISTER, Adau1701.CONTROL_REGISTER_LENGTH)
-        control_reg = bytes_to_int16(control_bytes)
+        with self.transaction():
+            # load up the address and data in safeload registers, one target address per slot
+            for sd in range(0, count):
+                address_register, data_register = Adau1701.SAFELOAD_REGISTERS[sd]
+                address_bytes = int16_to_bytes(address + sd)
+                data_buf = bytearray(Adau1701.SAFELOAD_SD_LENGTH)
 
-        ist_mask = 1 << 5
+                data_buf[1:] = data[
+                    sd * Adau1701.FIXPOINT_REGISTER_LENGTH : (sd + 1) * Adau1701.FIXPOINT_REGISTER_LENGTH
+                ]
 
-        control_reg |= ist_mask
+                self.protocol_handler.write(address_register, address_bytes)
+                self.protocol_handler.write(data_register, data_buf)
 
-        # start safe load
-        self.write(Adau1701.CONTROL_REGISTER, int16_to_bytes(control_reg))
+            # start safe load
+            return self.protocol_handler.write(
+                Adau1701.CONTROL_REGISTER, int16_to_bytes(control_reg), hold_s=self.frame_s
+            )
@@ -1,27 +1,199 @@
-"""This module implements the base class for I2C and SPI communication handlers."""
+"""This module implements the base class for I2C and SPI communication handlers.
+
+Callers submit typed read and write operations, which are queued in-process and executed by a single handler thread
+that owns the hardware. Every operation carries a future, through which its result (or error) is delivered.
+
+Operations that are submitted together form a batch, which the handler may send to the bus as a single unit.
+Batches are queued in priority lanes, such that interactive requests never wait for bulk transfers to finish.
+"""
 import logging
 import threading
+import time
+import zlib
 from abc import ABC, abstractmethod
-from multiprocessing import Pipe
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Deque, Iterator, List, Optional, Tuple, Union
+
+from sigmadsp.hardware.memory import MemoryMap
+from sigmadsp.hardware.metrics import BusMetrics
 
 # A logger for this module
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class Operation:
+    """A single bus operation, whose result is delivered by means of a future."""
+
+    # The DSP register address that the operation starts at.
+    address: int
+
+    # Resolved by the handler thread, as soon as the operation was executed.
+    future: Future = field(default_factory=Future, init=False, repr=False, compare=False)
+
+    # The time of submission, from `time.monotonic()`.
+    submitted: float = field(default=0.0, init=False, repr=False, compare=False)
+
+
+@dataclass
+class WriteOperation(Operation):
+    """An operation that writes data to the DSP. Its future resolves to None."""
+
+    # The data to write. It must not be modified, before the operation was executed.
+    data: bytes
+
+    # Whether the handler may merge this write with directly following writes to contiguous addresses.
+    coalesce: bool = False
+
+    # The time in seconds, for which the bus stays idle after the write, e.g. until the DSP applied a safeload.
+    hold_s: float = 0.0
+
+
+@dataclass
+class ReadOperation(Operation):
+    """An operation that reads data from the DSP. Its future resolves to the bytes that were read."""
+
+    # The number of bytes to read.
+    length: int
+
+
+class Priority(IntEnum):
+    """Priority classes of bus operations. Lower values are served first."""
+
+    # Requests from control clients, e.g. volume changes
+    INTERACTIVE = 0
+
+    # Requests from SigmaStudio
+    SIGMASTUDIO = 1
+
+    # Background polling, e.g. of meters
+    POLLING = 2
+
+    # Bulk transfers, e.g. program deployment
+    BULK = 3
+
+
+class PriorityLanes:
+    """A queue of operation batches with one FIFO lane per priority class."""
+
+    def __init__(self):
+        """Initialize empty lanes."""
+        self._lanes: List[Deque[List[Operation]]] = [deque() for _ in Priority]
+        self._condition = threading.Condition()
+
+    def put(self, priority: Priority, operations: List[Operation], front: bool = False):
+        """Add a batch to a lane.
+
+        Args:
+            priority (Priority): The lane to add the batch to.
+            operations (List[Operation]): The batch.
+            front (bool, optional): If True, the batch is served next within its lane. Defaults to False.
+        """
+        with self._condition:
+            if front:
+                self._lanes[priority].appendleft(operations)
+
+            else:
+                self._lanes[priority].append(operations)
+
+            self._condition.notify()
+
+    def get(self) -> Tuple[Priority, List[Operation]]:
+        """Remove and return the next batch of the highest priority lane, waiting for one if necessary.
+
+        Returns:
+            Tuple[Priority, List[Operation]]: The batch, and the lane it was taken from.
+        """
+        with self._condition:
+            while True:
+                for priority in Priority:
+                    if self._lanes[priority]:
+                        return priority, self._lanes[priority].popleft()
+
+                self._condition.wait()
+
+    def get_nowait(self, priority: Priority) -> Optional[List[Operation]]:
+        """Remove and return the next batch of a lane, if there is one.
+
+        Args:
+            priority (Priority): The lane.
+
+        Returns:
+            Optional[List[Operation]]: The batch, or None, if the lane is empty.
+        """
+        with self._condition:
+            if self._lanes[priority]:
+                return self._lanes[priority].popleft()
+
+            return None
+
+    def get_preempting(self, priority: Priority) -> Optional[Tuple[Priority, List[Operation]]]:
+        """Remove and return the next batch with a higher priority than the given one, if there is one.
+
+        Args:
+            priority (Priority): The priority to exceed.
+
+        Returns:
+            Optional[Tuple[Priority, List[Operation]]]: The batch and its lane, or None.
+        """
+        with self._condition:
+            for higher_priority in Priority:
+                if higher_priority >= priority:
+                    break
+
+                if self._lanes[higher_priority]:
+                    return higher_priority, self._lanes[higher_priority].popleft()
+
+            return None
+
+
 class BaseProtocol(ABC):
     """Base class for communication handlers talking to SigmaDSP chipsets."""
 
-    def __init__(self, bus: int = 0, device: int = 0):
+    # Default maximum size of merged writes in bytes
+    MAX_COALESCED_BYTES = 4092
+
+    # Minimum size of writes in bytes, which are verified by reading them back (if enabled)
+    VERIFY_MIN_BYTES = 64
+
+    # Size of the chunks in bytes, which are read back and compared individually
+    VERIFY_CHUNK_BYTES = 1024
+
+    # Number of times that mismatched chunks are rewritten, before verification fails
+    VERIFY_RETRIES = 3
+
+    def __init__(self, bus: int = 0, device: int = 0, memory_map: Optional[MemoryMap] = None):
         """Initialize the communications thread.
 
         Args:
             bus (int, optional): Bus number. Defaults to 0.
             device (int, optional): Device number / address. Defaults to 0
+            memory_map (Optional[MemoryMap], optional): The DSP's memory map, which determines how addresses advance
+                when transfers are split. Defaults to None, where all words are assumed to be 32 bit.
         """
+        self.memory_map = memory_map if memory_map is not None else MemoryMap([])
+
         self._initialize(bus, device)
 
-        # Generate a Pipe, for communicating with the protocol handler thread within this class.
-        self.pipe_end_owner, self.pipe_end_user = Pipe()
+        # Lists of operations that are pending for execution by the protocol handler thread.
+        self._lanes = PriorityLanes()
+
+        # Holds the priority and the operations of the transaction that are set in the calling thread, if any.
+        self._local = threading.local()
+
+        # The priority of the batch that the handler thread executes, and whether it may be preempted.
+        self._current_priority: Optional[Priority] = None
+        self._preemptible = False
+
+        # Counters, latencies and utilization of the bus.
+        self.metrics = BusMetrics()
+
+        # If True, bulk writes to memory are read back and checked, after they were executed.
+        self.verify_writes = False
 
         protocol = self.__class__.__name__
 
@@ -29,18 +201,140 @@ class BaseProtocol(ABC):
         self.thread = threading.Thread(target=self.serve_forever, name=f"{protocol} handler thread", daemon=True)
         self.thread.start()
 
-    def write(self, address: int, data: bytes):
-        """Write data over the hardware interface via the pipe to the hardware thread.
+    def submit(self, operations: List[Operation], priority: Optional[Priority] = None) -> List[Future]:
+        """Submit operations to the hardware thread, which executes them in order.
+
+        This does not block. Operations from concurrent callers are never interleaved with each other. Batches with
+        different priorities are not ordered with respect to each other.
+
+        Args:
+            operations (List[Operation]): The operations to execute.
+            priority (Optional[Priority], optional): The priority class of the operations. Defaults to None, where
+                the priority of the calling thread is used (see `priority()`).
+
+        Returns:
+            List[Future]: The futures of the submitted operations, in the same order.
+        """
+        if priority is None:
+            priority = getattr(self._local, "priority", Priority.INTERACTIVE)
+
+        submitted = time.monotonic()
+
+        for operation in operations:
+            operation.submitted = submitted
+
+        self._lanes.put(priority, operations)
+
+        return [operation.future for operation in operations]
+
+    @contextmanager
+    def priority(self, priority: Priority) -> Iterator[None]:
+        """Submit all operations of the calling thread with the given priority, while within this context.
+
+        Outside of any such context, operations are submitted as `Priority.INTERACTIVE`.
+
+        Args:
+            priority (Priority): The priority class.
+        """
+        previous_priority = getattr(self._local, "priority", Priority.INTERACTIVE)
+        self._local.priority = priority
+
+        try:
+            yield
+
+        finally:
+            self._local.priority = previous_priority
+
+    @contextmanager
+    def transaction(self) -> Iterator[List[Operation]]:
+        """Collect all reads and writes within this context, and submit them as a single batch when it is left.
+
+        Reads within a transaction have to use `read_async()`, as their results only become available after the
+        transaction was submitted. Nested transactions are merged into the outermost one. If the context is left with
+        an exception, the collected operations are discarded.
+
+        Yields:
+            List[Operation]: The operations that were collected so far.
+        """
+        operations: Union[List[Operation], None] = getattr(self._local, "operations", None)
+
+        if operations is not None:
+            # Join the transaction that is already open in this thread.
+            yield operations
+            return
+
+        operations = []
+        self._local.operations = operations
+
+        try:
+            yield operations
+
+        finally:
+            self._local.operations = None
+
+        if operations:
+            self.submit(operations)
+
+    def in_transaction(self) -> bool:
+        """Check, if a transaction is open in the calling thread.
+
+        Returns:
+            bool: True, if a transaction is open.
+        """
+        return getattr(self._local, "operations", None) is not None
+
+    def _enqueue(self, operation: Operation) -> Future:
+        """Add an operation to the open transaction, or submit it on its own, if there is none.
+
+        Args:
+            operation (Operation): The operation to enqueue.
+
+        Returns:
+            Future: The future of the operation.
+        """
+        operations: Union[List[Operation], None] = getattr(self._local, "operations", None)
+
+        if operations is None:
+            self.submit([operation])
+
+        else:
+            operations.append(operation)
+
+        return operation.future
+
+    def write(self, address: int, data: bytes, coalesce: bool = False, hold_s: float = 0.0) -> Future:
+        """Write data over the hardware interface, by means of the hardware thread.
+
+        This does not wait for the write to complete.
 
         Args:
             address (int): DSP register address to write to
             data (bytes): Binary data to write
+            coalesce (bool, optional): If True, the write may be merged with directly following coalescing writes to
+                contiguous addresses. Must not be used for register sequences that have to stay distinct.
+                Defaults to False.
+            hold_s (float, optional): The time in seconds, for which no further operation is transferred after the
+                write, e.g. for the DSP to act on it at its next frame boundary. Defaults to 0.0.
+
+        Returns:
+            Future: The future that resolves, once the data was written.
+        """
+        return self._enqueue(WriteOperation(address, data, coalesce, hold_s))
+
+    def read_async(self, address: int, length: int) -> Future:
+        """Read data from the hardware interface, without waiting for the result.
+
+        Args:
+            address (int): DSP register address to read from
+            length (int): Number of bytes to read
+
+        Returns:
+            Future: The future that resolves to the register content.
         """
-        self.pipe_end_owner.send("write")
-        self.pipe_end_owner.send((address, data))
+        return self._enqueue(ReadOperation(address, length))
 
     def read(self, address: int, length: int) -> bytes:
-        """Read data from the hardware interface via the pipe to the hardware thread.
+        """Read data from the hardware interface, by means of the hardware thread.
 
         Args:
             address (int): DSP register address to read from
@@ -49,26 +343,320 @@ class BaseProtocol(ABC):
         Returns:
             bytes: Register content
         """
-        self.pipe_end_owner.send("read")
-        self.pipe_end_owner.send((address, length))
+        if self.in_transaction():
+            raise RuntimeError("Cannot wait for a read within an open transaction, use read_async() instead.")
 
-        data = self.pipe_end_owner.recv()
+        return self.read_async(address, length).result()
 
-        return data
+    @property
+    def max_coalesced_bytes(self) -> int:
+        """The maximum size of merged writes in bytes, which should fit into a single bus transfer."""
+        return self.MAX_COALESCED_BYTES
 
     def serve_forever(self):
         """Handle incoming requests for writing or reading data."""
         while True:
-            mode = self.pipe_end_user.recv()
+            priority, operations = self._lanes.get()
+
+            start = time.monotonic()
+            self._run(priority, operations)
+            self.metrics.busy(start, time.monotonic())
+
+    def _run(self, priority: Priority, operations: List[Operation]):
+        """Execute a batch that was taken from a lane.
+
+        Args:
+            priority (Priority): The lane that the batch was taken from.
+            operations (List[Operation]): The batch.
+        """
+        previous_priority, previous_preemptible = self._current_priority, self._preemptible
+
+        # Batches with several operations are never interrupted, such that register sequences stay intact.
+        self._current_priority = priority
+        self._preemptible = len(operations) == 1
+
+        try:
+            write = self._coalescing_write(operations)
+
+            if write is not None:
+                self._execute_coalesced(write, priority)
+
+            else:
+                self._execute(operations)
+
+        finally:
+            self._current_priority, self._preemptible = previous_priority, previous_preemptible
+
+    def _preempt(self):
+        """Execute pending batches with a higher priority than the one that is currently executed.
+
+        Protocol handlers call this between the chunks of long transfers.
+        """
+        if not self._preemptible or self._current_priority is None:
+            return
+
+        while True:
+            entry = self._lanes.get_preempting(self._current_priority)
+
+            if entry is None:
+                return
+
+            self._run(*entry)
+
+    @staticmethod
+    def _coalescing_write(operations: List[Operation]) -> Optional[WriteOperation]:
+        """Get the write from a batch, if it consists of a single write that may be merged with others.
+
+        Args:
+            operations (List[Operation]): The batch to check.
+
+        Returns:
+            Optional[WriteOperation]: The write, or None, if the batch may not be merged.
+        """
+        if len(operations) == 1 and isinstance(operations[0], WriteOperation) and operations[0].coalesce:
+            return operations[0]
+
+        return None
+
+    def _execute_coalesced(self, first: WriteOperation, priority: Priority):
+        """Merge a coalescing write with directly following ones in its lane, and execute them as a single write.
+
+        Merging stops at the first batch that is not a coalescing write to the next contiguous address in the same
+        memory region. That batch is put back to the front of its lane, such that ordering is preserved.
+
+        Args:
+            first (WriteOperation): The first write.
+            priority (Priority): The lane that the write was taken from.
+        """
+        writes = [first]
+        length = len(first.data)
+        region = self.memory_map.region(first.address)
+        word_length = self.memory_map.word_length(first.address)
+
+        while region is not None and length % word_length == 0:
+            operations = self._lanes.get_nowait(priority)
+
+            if operations is None:
+                break
+
+            write = self._coalescing_write(operations)
+            next_address = first.address + length // word_length
+
+            if (
+                write is None
+                or write.address != next_address
+                or next_address not in region
+                or length + len(write.data) > self.max_coalesced_bytes
+            ):
+                self._lanes.put(priority, operations, front=True)
+                break
+
+            writes.append(write)
+            length += len(write.data)
+
+        if len(writes) == 1:
+            self._execute(writes)
+            return
+
+        merged = WriteOperation(first.address, b"".join(write.data for write in writes))
+        merged.submitted = first.submitted
+        self._execute([merged])
+
+        exception = merged.future.exception()
+
+        for write in writes:
+            if not write.future.set_running_or_notify_cancel():
+                continue
+
+            if exception is None:
+                write.future.set_result(None)
+
+            else:
+                write.future.set_exception(exception)
+
+    def _execute(self, operations: List[Operation]):
+        """Execute a batch of operations on the hardware and resolve their futures.
+
+        If the batch fails, all of its operations fail with the same error.
+
+        Args:
+            operations (List[Operation]): The operations to execute.
+        """
+        operations = [operation for operation in operations if operation.future.set_running_or_notify_cancel()]
+
+        if not operations:
+            return
+
+        start = time.monotonic()
+        self.metrics.observe("queue_wait", start - operations[0].submitted)
+
+        try:
+            results = self._transfer(operations)
+
+            if self._needs_verification(operations):
+                self._verify(operations[0])
+
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(
+                "Transfer of %d operation(s) at address 0x%04x failed: %s", len(operations), operations[0].address, e
+            )
+            self.metrics.count("errors")
+
+            for operation in operations:
+                operation.future.set_exception(e)
+
+            return
+
+        self._record(operations, time.monotonic() - start)
+
+        for operation, result in zip(operations, results):
+            operation.future.set_result(result)
+
+    def _needs_verification(self, operations: List[Operation]) -> bool:
+        """Check, if a batch is a bulk write that shall be verified.
+
+        Args:
+            operations (List[Operation]): The batch.
+
+        Returns:
+            bool: True, if verification is enabled, and the batch consists of a single large write to memory.
+        """
+        if not self.verify_writes or len(operations) != 1:
+            return False
+
+        write = operations[0]
+
+        if not isinstance(write, WriteOperation) or len(write.data) < self.VERIFY_MIN_BYTES:
+            return False
+
+        region = self.memory_map.region(write.address)
+
+        return (
+            region is not None
+            and not region.volatile
+            and write.address + len(write.data) // region.word_length - 1 <= region.end
+        )
+
+    def _verify(self, write: WriteOperation):
+        """Read back a write in chunks, and rewrite the chunks whose CRC32 does not match.
+
+        Args:
+            write (WriteOperation): The write that was executed.
+
+        Raises:
+            OSError: If chunks still do not match after `VERIFY_RETRIES` rewrites.
+        """
+        data = memoryview(write.data)
+        chunk_length, chunk_words = self.memory_map.chunk_size(write.address, self.VERIFY_CHUNK_BYTES)
+
+        # Chunks as (address, data, CRC32 of the data)
+        checked_chunks = []
+
+        for index, offset in enumerate(range(0, len(data), chunk_length)):
+            chunk = data[offset : offset + chunk_length]
+            checked_chunks.append((write.address + index * chunk_words, chunk, zlib.crc32(chunk)))
+
+        for attempt in range(self.VERIFY_RETRIES + 1):
+            results = self._transfer([ReadOperation(address, len(chunk)) for address, chunk, _ in checked_chunks])
+            checked_chunks = [
+                checked_chunk
+                for checked_chunk, result in zip(checked_chunks, results)
+                if zlib.crc32(result or b"") != checked_chunk[2]
+            ]
+
+            if not checked_chunks:
+                return
+
+            if attempt == self.VERIFY_RETRIES:
+                break
+
+            logger.warning(
+                "Verification of the write to 0x%04x found %d mismatched chunk(s), rewriting them.",
+                write.address,
+                len(checked_chunks),
+            )
+            self.metrics.count("verify_retries", len(checked_chunks))
+            self._transfer([WriteOperation(address, bytes(chunk)) for address, chunk, _ in checked_chunks])
+
+        self.metrics.count("verify_failures")
+
+        raise OSError(
+            f"Verification of the write to 0x{write.address:04x} failed, {len(checked_chunks)} chunk(s) do not match."
+        )
+
+    def _record(self, operations: List[Operation], seconds: float):
+        """Record the metrics of a batch that was transferred.
+
+        Args:
+            operations (List[Operation]): The operations of the batch.
+            seconds (float): The time that the transfer took.
+        """
+        if len(operations) > 1:
+            self.metrics.observe("transaction", seconds)
+            self.metrics.count("transactions")
+
+        for operation in operations:
+            if isinstance(operation, WriteOperation):
+                self.metrics.count("writes")
+                self.metrics.count("bytes_written", len(operation.data))
+
+                if len(operations) == 1:
+                    self.metrics.observe("write", seconds)
+
+            elif isinstance(operation, ReadOperation):
+                self.metrics.count("reads")
+                self.metrics.count("bytes_read", operation.length)
+
+                if len(operations) == 1:
+                    self.metrics.observe("read", seconds)
+
+    def _transfer(self, operations: List[Operation]) -> List[Optional[bytes]]:
+        """Transfer a batch of operations over the bus.
+
+        By default, operations are transferred one by one. Protocol handlers override this, if their hardware
+        interface can transfer several operations at once. Writes with a hold time are followed by `_hold()`.
+
+        Args:
+            operations (List[Operation]): The operations to transfer.
+
+        Returns:
+            List[Optional[bytes]]: The data that was read for each operation, None for writes.
+        """
+        results: List[Optional[bytes]] = []
+
+        for operation in operations:
+            results.append(self._transfer_single(operation))
+
+            if isinstance(operation, WriteOperation) and operation.hold_s > 0:
+                self._hold(operation.hold_s)
+
+        return results
+
+    def _hold(self, seconds: float):
+        """Keep the bus idle, after a write that the DSP acts on with a delay.
+
+        Args:
+            seconds (float): The time in seconds.
+        """
+        time.sleep(seconds)
+
+    def _transfer_single(self, operation: Operation) -> Optional[bytes]:
+        """Transfer a single operation over the bus.
+
+        Args:
+            operation (Operation): The operation to transfer.
+
+        Returns:
+            Optional[bytes]: The data that was read, or None for writes.
+        """
+        if isinstance(operation, WriteOperation):
+            self._write(operation.address, operation.data)
+            return None
 
-            if mode == "write":
-                address, data = self.pipe_end_user.recv()
-                self._write(address, data)
+        if isinstance(operation, ReadOperation):
+            return self._read(operation.address, operation.length)
 
-            elif mode == "read":
-                address, length = self.pipe_end_user.recv()
-                data = self._read(address, length)
-                self.pipe_end_user.send(data)
+        raise TypeError(f"Unknown operation type {type(operation)}.")
 
     @abstractmethod
     def _initialize(self, bus: int = 0, device: int = 0):
@@ -1,20 +1,30 @@
 """General definitions for interfacing DSPs."""
+import hashlib
 import logging
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, List, Type, Union
+from concurrent.futures import Future
+from dataclasses import dataclass, fields
+from typing import Any, ContextManager, Dict, List, Optional, Tuple, Type, Union
 
 import gpiozero
 
-from sigmadsp.hardware.base_protocol import BaseProtocol
+from sigmadsp.hardware.base_protocol import BaseProtocol, Operation, Priority
 from sigmadsp.hardware.i2c import I2C
+from sigmadsp.hardware.memory import MemoryMap, MemoryRegion
+from sigmadsp.hardware.shadow import ParameterShadow
+from sigmadsp.hardware.sim import Simulator
+from sigmadsp.hardware.snapshot import Snapshot, SnapshotError
 from sigmadsp.hardware.spi import SPI
 from sigmadsp.helper.conversion import clamp, db_to_linear, linear_to_db
+from sigmadsp.helper.export import ExportedWrite
 
 # A logger for this module
 logger = logging.getLogger(__name__)
 
+# The key of protocol handlers that DSPs share: protocol, bus number and device address
+HandlerKey = Tuple[str, int, int]
+
 
 class SafetyCheckException(Exception):
     """Custom exception for failed DSP safety checks."""
@@ -44,6 +54,10 @@ class InputPin(Pin):
     active_state: bool
     bounce_time: Union[float, None]
 
+    # The names of the backend actions on edges, e.g. "mute" when becoming active
+    on_active: Union[str, None] = None
+    on_inactive: Union[str, None] = None
+
     def __post_init__(self):
         """Initialize the input device, based on the configured parameters."""
         self.control = gpiozero.DigitalInputDevice(self.number, self.pull_up, self.active_state, self.bounce_time)
@@ -70,29 +84,117 @@ class Dsp(ABC):
     bus: int
     address: int
 
-    def __init__(self, config: dict):
+    # The address space of the DSP.
+    MEMORY_MAP: MemoryMap
+
+    # The memory regions that hold parameters, whose known contents may be shadowed on the host.
+    PARAMETER_REGIONS: List[MemoryRegion]
+
+    # The memories and registers that make up the runtime state of the DSP. They are restored by `_restore()`.
+    SNAPSHOT_REGIONS: List[MemoryRegion]
+
+    # The length of parameter words in bytes, and the maximum number of words per safeload
+    FIXPOINT_REGISTER_LENGTH: int
+    SAFELOAD_WORDS = 5
+
+    # A register that can be overwritten at any time without side effects, e.g. for testing communication.
+    SCRATCH_REGISTER: int
+    SCRATCH_REGISTER_LENGTH: int
+
+    # The sample rate of the DSP program, if not configured. Safeloads take effect at the next frame boundary.
+    DEFAULT_SAMPLE_RATE_HZ = 48000
+
+    def __init__(
+        self,
+        config: dict,
+        shared_handlers: Optional[Dict[HandlerKey, BaseProtocol]] = None,
+        shared_pins: Optional[Dict[int, Pin]] = None,
+    ):
         """Initialize the DSP and set up the protocol handler that talks to it.
 
+        DSPs that are created with the same shared handlers and pins use a single protocol handler for the same
+        protocol, bus and device, and a single pin object for the same pin number, e.g. a common reset line.
+
         Args:
             config (dict): Configuration settings, from the general configuration file.
+            shared_handlers (Optional[Dict[HandlerKey, BaseProtocol]], optional): Protocol handlers of other DSPs, to
+                which a new handler is added. Defaults to None, where the handler is not shared.
+            shared_pins (Optional[Dict[int, Pin]], optional): Pins of other DSPs by number, to which new pins are
+                added. Defaults to None, where pins are not shared.
         """
         self.config = config
         self.pins: List[Pin] = []
+        self._shared_pins: Dict[int, Pin] = shared_pins if shared_pins is not None else {}
+
+        # The numbers of the pins that were created for this DSP, rather than shared with another one
+        self._created_pin_numbers: List[int] = []
+
         self.parse_config()
 
+        self.shadow: Optional[ParameterShadow] = None
+
+        if self.parameter_shadow:
+            self.shadow = ParameterShadow(self.PARAMETER_REGIONS)
+
         protocol_handlers: Dict[str, Type[BaseProtocol]] = {
             "i2c": I2C,
             "spi": SPI,
+            "sim": Simulator,
         }
 
-        try:
-            handler_class: Type[BaseProtocol] = protocol_handlers[self.protocol]
-            self.protocol_handler = handler_class(bus=self.bus, device=self.address)
-        except KeyError as e:
-            logger.error("Unknown protocol: %s", self.protocol)
-            raise ConfigurationError from e
+        # Protocol-specific options for the handler.
+        handler_options: Dict[str, Dict[str, Any]] = {
+            "spi": {"speed_hz": self.spi_speed_hz} if self.spi_speed_hz is not None else {},
+            "i2c": {"max_transfer_bytes": self.i2c_max_transfer_bytes} if self.i2c_max_transfer_bytes else {},
+            "sim": {
+                "dsp_type": self.type,
+                "byte_time_s": self.sim_byte_time_us * 1e-6,
+                "sample_rate_hz": self.sample_rate_hz,
+            },
+        }
+
+        handler_key: HandlerKey = (self.protocol, self.bus, self.address)
+        shared_handler = shared_handlers.get(handler_key) if shared_handlers is not None else None
+
+        if shared_handler is not None:
+            logger.info("Sharing the %s handler on bus %d, device %d.", self.protocol, self.bus, self.address)
+            self.protocol_handler = shared_handler
+
+        else:
+            try:
+                handler_class: Type[BaseProtocol] = protocol_handlers[self.protocol]
+                self.protocol_handler = handler_class(
+                    bus=self.bus,
+                    device=self.address,
+                    memory_map=self.MEMORY_MAP,
+                    **handler_options.get(self.protocol, {}),
+                )
+            except KeyError as e:
+                logger.error("Unknown protocol: %s", self.protocol)
+                raise ConfigurationError from e
+
+            except ValueError as e:
+                logger.error("Invalid %s protocol settings: %s", self.protocol, e)
+                raise ConfigurationError from e
+
+            self.protocol_handler.verify_writes = self.verify_writes
+
+            if shared_handlers is not None:
+                shared_handlers[handler_key] = self.protocol_handler
 
-        self.hard_reset()
+        # Hashes of the contents of memory regions, as of the last deployment, by region name
+        self._deployed_hashes: Dict[str, str] = {}
+
+        reset_pin = self.get_pin_by_name("reset")
+
+        if reset_pin is None or reset_pin.number in self._created_pin_numbers:
+            self.hard_reset()
+
+        else:
+            logger.info("The shared reset pin (%d) was released already, not resetting again.", reset_pin.number)
+
+        if self.spi_calibration and shared_handler is None:
+            self.calibrate_spi_speed()
 
     def parse_config(self):
         """Parse the configuration file and extract relevant information."""
@@ -101,7 +203,8 @@ class Dsp(ABC):
                 pin_definition = self.config["dsp"]["pins"][pin_definition_key]
 
                 if pin_definition["mode"] == "output":
-                    output_pin = OutputPin(
+                    output_pin = self.create_pin(
+                        OutputPin,
                         pin_definition_key,
                         pin_definition["number"],
                         pin_definition["initial_state"],
@@ -111,12 +214,15 @@ class Dsp(ABC):
                     self.add_pin(output_pin)
 
                 elif pin_definition["mode"] == "input":
-                    input_pin = InputPin(
+                    input_pin = self.create_pin(
+                        InputPin,
                         pin_definition_key,
                         pin_definition["number"],
                         pin_definition["pull_up"],
                         pin_definition["active_state"],
                         pin_definition["bounce_time"],
+                        pin_definition.get("on_active"),
+                        pin_definition.get("on_inactive"),
                     )
 
                     self.add_pin(input_pin)
@@ -133,6 +239,61 @@ class Dsp(ABC):
             logger.error("Key %s missing from the DSP configuration.", e.args[0])
             raise ConfigurationError from e
 
+        # Optional settings
+        self.spi_speed_hz = self.config["dsp"].get("spi_speed_hz")
+
+        if self.spi_speed_hz is not None:
+            self.spi_speed_hz = int(self.spi_speed_hz)
+        self.spi_calibration = bool(self.config["dsp"].get("spi_calibration", False))
+
+        self.i2c_max_transfer_bytes = self.config["dsp"].get("i2c_max_transfer_bytes")
+
+        if self.i2c_max_transfer_bytes is not None:
+            self.i2c_max_transfer_bytes = int(self.i2c_max_transfer_bytes)
+
+        self.sim_byte_time_us = float(self.config["dsp"].get("sim_byte_time_us", 0))
+
+        self.sample_rate_hz = float(self.config["dsp"].get("sample_rate_hz", Dsp.DEFAULT_SAMPLE_RATE_HZ))
+
+        if self.sample_rate_hz <= 0:
+            logger.error("The sample rate must be positive, not %s.", self.sample_rate_hz)
+            raise ConfigurationError
+
+        self.verify_writes = bool(self.config["dsp"].get("verify_writes", False))
+
+        self.parameter_shadow = bool(self.config["dsp"].get("parameter_shadow", False))
+
+    def create_pin(self, pin_class: Type[Pin], *definition: Any) -> Pin:
+        """Create a pin, or get the pin with the same number, if another DSP shares it.
+
+        Args:
+            pin_class (Type[Pin]): The class of the pin.
+            *definition (Any): The fields of the pin, starting with name and number.
+
+        Raises:
+            ConfigurationError: If another DSP defines a pin with the same number differently.
+
+        Returns:
+            Pin: The pin.
+        """
+        number = definition[1]
+        shared_pin = self._shared_pins.get(number)
+
+        if shared_pin is None:
+            pin = pin_class(*definition)
+            self._shared_pins[number] = pin
+            self._created_pin_numbers.append(number)
+
+            return pin
+
+        shared_definition = tuple(getattr(shared_pin, pin_field.name) for pin_field in fields(shared_pin))
+
+        if type(shared_pin) is not pin_class or shared_definition != definition:
+            logger.error("Pin %d is defined differently by several DSPs.", number)
+            raise ConfigurationError
+
+        return shared_pin
+
     def get_pin_by_name(self, name: str) -> Union[Pin, None]:
         """Get a pin by its name.
 
@@ -193,29 +354,261 @@ class Dsp(ABC):
             return
 
         logger.info("Hard-resetting the DSP.")
+        self.invalidate_shadow()
+        self._deployed_hashes.clear()
 
         pin.control.on()
         time.sleep(delay)
         pin.control.off()
 
-    def write(self, address: int, data: bytes):
+    def calibrate_spi_speed(self):
+        """Select the fastest SPI clock speed, at which the DSP's scratch register can be reliably accessed."""
+        if not isinstance(self.protocol_handler, SPI):
+            logger.warning("SPI calibration is only available with the SPI protocol.")
+            return
+
+        logger.info("Calibrating the SPI clock speed.")
+        self.protocol_handler.calibrate_speed(self.SCRATCH_REGISTER, self.SCRATCH_REGISTER_LENGTH)
+
+    def write(self, address: int, data: bytes, coalesce: bool = False) -> Future:
         """Write data to the DSP using the configured communication handler.
 
         Args:
             address (int): Address to write to
             data (bytes): Data to write
+            coalesce (bool, optional): If True, the write may be merged with directly following coalescing writes to
+                contiguous addresses. Defaults to False.
+
+        Returns:
+            Future: The future that resolves, once the data was written.
         """
-        self.protocol_handler.write(address, data)
+        future = self.protocol_handler.write(address, data, coalesce)
+        self._forget_deployment(address)
 
-    def read(self, address: int, length: int) -> bytes:
-        """Write data to the DSP using the configured communication handler.
+        if self.shadow is not None and not self.shadow.covers(address, len(data)):
+            # The effect of writes to programs or registers on parameter memory is unknown.
+            self.invalidate_shadow()
+
+        else:
+            self._shadow_write(address, data, future)
+
+        return future
+
+    def deploy(self, writes: List[ExportedWrite], force: bool = False) -> List[str]:
+        """Deploy a program image, e.g. from SigmaStudio's exported system files, with bulk writes.
+
+        Writes to memory regions, whose contents are unchanged since the last deployment, are skipped. Writes to
+        volatile regions (registers) are always sent, since they control the DSP core during the download.
 
         Args:
-            address (int): Address to write to
+            writes (List[ExportedWrite]): The writes of the image, in the order of the download.
+            force (bool, optional): If True, all writes are sent. Defaults to False.
+
+        Returns:
+            List[str]: The names of the memory regions that were written, apart from volatile ones.
+        """
+        hashes: Dict[str, Any] = {}
+
+        for write in writes:
+            region = self.MEMORY_MAP.region(write.address)
+
+            if region is not None and not region.volatile:
+                digest = hashes.setdefault(region.name, hashlib.sha256())
+                digest.update(write.address.to_bytes(4, "big") + len(write.data).to_bytes(4, "big") + write.data)
+
+        image_hashes = {name: digest.hexdigest() for name, digest in hashes.items()}
+        changed = [name for name, digest in image_hashes.items() if force or self._deployed_hashes.get(name) != digest]
+
+        futures: List[Future] = []
+
+        with self.priority(Priority.BULK):
+            for write in writes:
+                region = self.MEMORY_MAP.region(write.address)
+
+                if region is None or region.volatile or region.name in changed:
+                    futures.append(self.write(write.address, write.data))
+
+        for future in futures:
+            future.result()
+
+        self._deployed_hashes = image_hashes
+
+        logger.info("Deployed program image, written regions: %s.", ", ".join(changed) or "none")
+
+        return changed
+
+    def snapshot(self) -> Snapshot:
+        """Capture the runtime state of the DSP, by reading all memories and registers in `SNAPSHOT_REGIONS`.
+
+        Returns:
+            Snapshot: The snapshot.
+        """
+        snapshot = Snapshot(self.type)
+
+        with self.priority(Priority.BULK):
+            for region in self.SNAPSHOT_REGIONS:
+                snapshot.blocks.append((region.start, self.read(region.start, region.size)))
+
+        logger.info("Captured snapshot of %d memory and register regions.", len(snapshot.blocks))
+
+        return snapshot
+
+    def restore(self, snapshot: Snapshot):
+        """Restore the runtime state of the DSP from a snapshot, with bulk writes.
+
+        The memories and registers are written in the chip-specific order of `_restore()`, such that the DSP is clocked
+        and its core is stopped, while the memories are written.
+
+        Args:
+            snapshot (Snapshot): The snapshot.
+
+        Raises:
+            SnapshotError: If the snapshot was taken from a different type of DSP, or lacks any of the
+                `SNAPSHOT_REGIONS`.
+        """
+        if snapshot.dsp_type != self.type:
+            raise SnapshotError(f"Cannot restore a snapshot of a {snapshot.dsp_type} DSP on a {self.type} DSP.")
+
+        blocks = dict(snapshot.blocks)
+
+        for region in self.SNAPSHOT_REGIONS:
+            if len(blocks.get(region.start, b"")) != region.size:
+                raise SnapshotError(f"The snapshot does not hold the {region.name} of the DSP.")
+
+        with self.priority(Priority.BULK):
+            futures = self._restore(blocks)
+
+        for future in futures:
+            future.result()
+
+        logger.info("Restored snapshot of %d memory and register regions.", len(self.SNAPSHOT_REGIONS))
+
+    @abstractmethod
+    def _restore(self, blocks: Dict[int, bytes]) -> List[Future]:
+        """Write the contents of all `SNAPSHOT_REGIONS` in the order that the chip requires.
+
+        Args:
+            blocks (Dict[int, bytes]): The contents by start address of the region.
+
+        Returns:
+            List[Future]: The futures of all writes.
+        """
+
+    def _forget_deployment(self, address: int):
+        """Forget the deployed contents of the memory region that is written to, since they may change.
+
+        Args:
+            address (int): The address that is written to.
+        """
+        region = self.MEMORY_MAP.region(address)
+
+        if region is not None:
+            self._deployed_hashes.pop(region.name, None)
+
+    def _safeload_submitted(self, address: int, data: bytes, future: Future, start: float):
+        """Record a safeload in the parameter shadow and in the bus metrics, once its transaction was submitted.
+
+        Args:
+            address (int): The target address of the safeload.
+            data (bytes): The data that is written to the target address.
+            future (Future): The future of the last write of the safeload.
+            start (float): The time when the safeload was started, from `time.monotonic()`.
+        """
+        self._shadow_write(address, data, future)
+        self._forget_deployment(address)
+
+        metrics = self.protocol_handler.metrics
+        future.add_done_callback(lambda _: metrics.observe("safeload", time.monotonic() - start))
+
+    def _shadow_write(self, address: int, data: bytes, future: Future):
+        """Record data that is written to parameter memory in the shadow, if it is enabled.
+
+        The data is recorded immediately, such that subsequent reads observe it. Writes are executed in the order of
+        submission, so a successful write leaves the shadow as it is, where newer writes may have been recorded in the
+        meantime. Failed writes are forgotten.
+
+        Args:
+            address (int): The address that is written to.
+            data (bytes): The data that is written.
+            future (Future): The future of the write.
+        """
+        shadow = self.shadow
+
+        if shadow is None:
+            return
+
+        data = bytes(data)
+        shadow.store(address, data)
+
+        def on_done(done_future: Future):
+            """Forget the data, if the write failed."""
+            if done_future.cancelled() or done_future.exception() is not None:
+                shadow.invalidate(address, len(data))
+
+        future.add_done_callback(on_done)
+
+    def invalidate_shadow(self, address: Optional[int] = None, length: int = 0):
+        """Forget the shadowed contents of a range of parameter memory, or of all of it.
+
+        Args:
+            address (Optional[int], optional): The start address of the range. Defaults to None, which forgets all
+                contents.
+            length (int, optional): The length of the range in bytes. Defaults to 0.
+        """
+        if self.shadow is not None:
+            self.shadow.invalidate(address, length)
+
+    def transaction(self) -> ContextManager[List[Operation]]:
+        """Collect all writes within this context, and send them to the DSP as a single bus transaction.
+
+        Returns:
+            ContextManager[List[Operation]]: The transaction context of the communication handler.
+        """
+        return self.protocol_handler.transaction()
+
+    def priority(self, priority: Priority) -> ContextManager[None]:
+        """Send all reads and writes of the calling thread with the given priority, while within this context.
+
+        Args:
+            priority (Priority): The priority class.
+
+        Returns:
+            ContextManager[None]: The priority context of the communication handler.
+        """
+        return self.protocol_handler.priority(priority)
+
+    def read(self, address: int, length: int, cached: bool = False) -> bytes:
+        """Read data from the DSP using the configured communication handler.
+
+        Args:
+            address (int): Address to read from
             length (int): Number of bytes to read
+            cached (bool, optional): If True, known contents of parameter memory are taken from the shadow, without
+                accessing the DSP. Defaults to False.
+
+        Returns:
+            bytes: The data that was read.
         """
+        if cached and self.shadow is not None:
+            data = self.shadow.load(address, length)
+
+            if data is not None:
+                return data
+
         return self.protocol_handler.read(address, length)
 
+    def read_async(self, address: int, length: int) -> Future:
+        """Read data from the DSP, without waiting for the result.
+
+        Args:
+            address (int): Address to read from
+            length (int): Number of bytes to read
+
+        Returns:
+            Future: The future that resolves to the data that was read.
+        """
+        return self.protocol_handler.read_async(address, length)
+
     def set_volume(self, value_db: float, address: int) -> float:
         """Set the volume register at the given address to a certain value in dB.
 
@@ -249,7 +642,7 @@ class Dsp(ABC):
             float: The new volume in dB.
         """
         # Read current volume and apply adjustment
-        current_volume = self.get_parameter_value(address, data_format="float")
+        current_volume = self.get_parameter_value(address, data_format="float", cached=True)
 
         if not isinstance(current_volume, float):
             raise TypeError
@@ -274,14 +667,64 @@ class Dsp(ABC):
     def soft_reset(self):
         """Soft reset the DSP."""
 
-    @abstractmethod
-    def safeload(self, address: int, data: bytes, count: int):
+    @property
+    def frame_s(self) -> float:
+        """The duration of a single sample period in seconds, which a safeload takes to be applied."""
+        return 1 / self.sample_rate_hz
+
+    def safeload(self, address: int, data: bytes, count: Optional[int] = None) -> Optional[Future]:
         """Write data to the chip using chip-specific safeload.
 
+        Data of any length is split into safeloads of up to `SAFELOAD_WORDS` words, with consecutive target addresses.
+        Each of them is submitted as a single bus transaction, without waiting for the previous one to complete. The
+        bus is held for a frame after each of them, such that the DSP applies it, before the safeload registers are
+        overwritten by the next one.
+
+        Args:
+            address (int): Address to write to
+            data (bytes): Data to write; multiple words should be concatenated
+            count (Optional[int], optional): Number of words to write. Defaults to None, where all words in the data
+                are written.
+
+        Returns:
+            Optional[Future]: The future of the last write of the last safeload, or None, if there are no words.
+        """
+        if count is None:
+            count = len(data) // self.FIXPOINT_REGISTER_LENGTH
+
+        if count * self.FIXPOINT_REGISTER_LENGTH > len(data):
+            raise ValueError(f"Cannot safeload {count} words from {len(data)} bytes of data.")
+
+        if count < 1:
+            return None
+
+        start = time.monotonic()
+
+        for word_index in range(0, count, self.SAFELOAD_WORDS):
+            word_count = min(self.SAFELOAD_WORDS, count - word_index)
+            offset = word_index * self.FIXPOINT_REGISTER_LENGTH
+
+            future = self._safeload_words(
+                address + word_index, data[offset : offset + word_count * self.FIXPOINT_REGISTER_LENGTH], word_count
+            )
+
+        self._safeload_submitted(address, data[: count * self.FIXPOINT_REGISTER_LENGTH], future, start)
+
+        return future
+
+    @abstractmethod
+    def _safeload_words(self, address: int, data: bytes, count: int) -> Future:
+        """Submit a single chip-specific safeload as one bus transaction.
+
+        The write that triggers the safeload holds the bus for `frame_s`.
+
         Args:
             address (int): Address to write to
             data (bytes): Data to write
-            count (int): Number of 4 byte words to write (max. 5)
+            count (int): Number of words to write (max. `SAFELOAD_WORDS`)
+
+        Returns:
+            Future: The future of the last write of the safeload.
         """
 
     @abstractmethod
@@ -296,7 +739,33 @@ class Dsp(ABC):
         """
 
     @abstractmethod
-    def get_parameter_value(self, address: int, data_format: str) -> Union[float, int, None]:
+    def encode_parameter_values(self, values: List[float]) -> bytes:
+        """Encode values as consecutive parameter words, e.g. for a single safeload of several cells.
+
+        This is an abstract method because number formats are chip-specific.
+
+        Args:
+            values (List[float]): The values.
+
+        Returns:
+            bytes: The words, which are signed fixpoint values.
+        """
+
+    @abstractmethod
+    def decode_parameter_values(self, data: bytes) -> List[float]:
+        """Decode consecutive parameter words, e.g. from a single read of several cells.
+
+        This is an abstract method because number formats are chip-specific.
+
+        Args:
+            data (bytes): The words, which are signed fixpoint values.
+
+        Returns:
+            List[float]: The values.
+        """
+
+    @abstractmethod
+    def get_parameter_value(self, address: int, data_format: str, cached: bool = False) -> Union[float, int, None]:
         """Get a parameter value from a chosen register address.
 
         This is an abstract method because number formats are chip-specific.
@@ -304,6 +773,7 @@ class Dsp(ABC):
         Args:
             address (int): The address to look at.
             data_format (str): The data type to return the register in. Can be 'float' or 'int'.
+            cached (bool, optional): If True, a known value is taken from the parameter shadow. Defaults to False.
 
         Returns:
             Union[float, int, None]: Representation of the register content in the specified format.
@@ -0,0 +1,146 @@
+"""This module dispatches edges on DSP input pins to subscribers, without polling.
+
+Edges are reported by the gpiozero edge callbacks, debounced per pin, and dispatched on a separate thread, such that
+subscribers may access the DSP without stalling the detection of further edges. Debouncing is done here only, not by
+gpiozero, which could drop the edge that settles the pin.
+"""
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Set
+
+from sigmadsp.hardware.dsp import InputPin
+
+# A logger for this module
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PinEvent:
+    """A change of the state of an input pin."""
+
+    # The name of the pin, as in the configuration
+    pin_name: str
+
+    # True, if the pin became active, False, if it became inactive
+    active: bool
+
+    # The time of the edge, from `time.monotonic()`
+    time: float
+
+
+# A function that receives pin events
+PinSubscriber = Callable[[PinEvent], None]
+
+
+class GpioEventBus:
+    """Receives edges of input pins, debounces them, and dispatches them to subscribers."""
+
+    def __init__(self):
+        """Initialize the event bus, and start the thread that dispatches events."""
+        self._subscribers: Dict[str, List[PinSubscriber]] = {}
+        self._lock = threading.Lock()
+
+        # The attached pins, and their last dispatched state and edge time, for debouncing
+        self._pins: Dict[str, InputPin] = {}
+        self._states: Dict[str, bool] = {}
+        self._edge_times: Dict[str, float] = {}
+        self._debounce_s: Dict[str, float] = {}
+
+        # Pins, whose state is checked again after their debounce time, since an edge was suppressed
+        self._settling: Set[str] = set()
+
+        self._events: "queue.Queue[PinEvent]" = queue.Queue()
+
+        thread = threading.Thread(target=self._dispatch, name="GPIO event bus thread", daemon=True)
+        thread.start()
+
+    def attach(self, pin: InputPin):
+        """Receive the edges of an input pin.
+
+        Edges are debounced with the bounce time of the pin, if any, which replaces the debouncing by gpiozero.
+
+        Args:
+            pin (InputPin): The pin.
+        """
+        with self._lock:
+            self._pins[pin.name] = pin
+            self._states[pin.name] = bool(pin.control.is_active)
+            self._debounce_s[pin.name] = pin.bounce_time or 0.0
+
+        pin.control.pin.bounce = None
+        pin.control.when_activated = lambda: self.edge(pin.name, True)
+        pin.control.when_deactivated = lambda: self.edge(pin.name, False)
+
+        logger.info("Listening for edges on input pin '%s' (%d).", pin.name, pin.number)
+
+    def subscribe(self, pin_name: str, subscriber: PinSubscriber):
+        """Receive the events of a pin.
+
+        Args:
+            pin_name (str): The name of the pin.
+            subscriber (PinSubscriber): The function that receives the events.
+        """
+        with self._lock:
+            self._subscribers.setdefault(pin_name, []).append(subscriber)
+
+    def edge(self, pin_name: str, active: bool):
+        """Report an edge on a pin, which is dispatched, unless it bounces or does not change the state.
+
+        If an edge is suppressed as bouncing, the state of the pin is checked again after the debounce time, such that
+        the final state is not missed.
+
+        Args:
+            pin_name (str): The name of the pin.
+            active (bool): True, if the pin became active, False, if it became inactive.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            if self._states.get(pin_name) == active:
+                return
+
+            remaining_s = self._edge_times.get(pin_name, -float("inf")) + self._debounce_s.get(pin_name, 0.0) - now
+
+            if remaining_s > 0:
+                if pin_name in self._pins and pin_name not in self._settling:
+                    self._settling.add(pin_name)
+                    timer = threading.Timer(remaining_s, self._settle, (pin_name,))
+                    timer.daemon = True
+                    timer.start()
+
+                return
+
+            self._states[pin_name] = active
+            self._edge_times[pin_name] = now
+
+        self._events.put(PinEvent(pin_name, active, now))
+
+    def _settle(self, pin_name: str):
+        """Report the current state of a pin, after its debounce time passed.
+
+        Args:
+            pin_name (str): The name of the pin.
+        """
+        with self._lock:
+            self._settling.discard(pin_name)
+            pin = self._pins[pin_name]
+
+        self.edge(pin_name, bool(pin.control.is_active))
+
+    def _dispatch(self):
+        """Pass events to the subscribers of their pins, in the order of the edges."""
+        while True:
+            event = self._events.get()
+
+            with self._lock:
+                subscribers = list(self._subscribers.get(event.pin_name, []))
+
+            for subscriber in subscribers:
+                try:
+                    subscriber(event)
+
+                except Exception as e:  # pylint: disable=broad-except
+                    logger.error("Handling of %s failed: %s", event, e)
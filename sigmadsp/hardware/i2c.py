@@ -1,9 +1,18 @@
 """This module implements an I2C handler that talks to Sigma DSP devices."""
+import ctypes
 import logging
+from typing import List, Optional
 
 from smbus2 import SMBus, i2c_msg
-
-from sigmadsp.hardware.base_protocol import BaseProtocol
+from smbus2.smbus2 import I2C_M_RD
+
+from sigmadsp.hardware.base_protocol import (
+    BaseProtocol,
+    Operation,
+    ReadOperation,
+    WriteOperation,
+)
+from sigmadsp.hardware.memory import MemoryMap
 from sigmadsp.helper.conversion import int16_to_bytes
 
 # A logger for this module
@@ -16,6 +25,46 @@ class I2C(BaseProtocol):
     Tested with ADAU1701
     """
 
+    # Length of addresses (in bytes) for accessing registers
+    ADDRESS_LENGTH = 2
+
+    # Maximum number of messages per I2C_RDWR ioctl, see `I2C_RDWR_IOCTL_MAX_MSGS` in `linux/i2c-dev.h`
+    MAX_MESSAGES = 42
+
+    # Default maximum number of bytes per I2C message, including the register address
+    DEFAULT_MAX_TRANSFER_BYTES = 4096
+
+    # Maximum number of bytes per I2C message, as accepted by i2c-dev, which rejects longer messages with EINVAL
+    MAX_TRANSFER_BYTES = 8192
+
+    def __init__(
+        self,
+        bus: int = 1,
+        device: int = 0x38,
+        max_transfer_bytes: int = DEFAULT_MAX_TRANSFER_BYTES,
+        memory_map: Optional[MemoryMap] = None,
+    ):
+        """Initialize the I2C handler.
+
+        Args:
+            bus (int, optional): Bus number. Defaults to 1.
+            device (int, optional): Device number. Defaults to 0x38.
+            max_transfer_bytes (int, optional): Maximum number of bytes per I2C message, as supported by the adapter.
+                Defaults to `I2C.DEFAULT_MAX_TRANSFER_BYTES`.
+            memory_map (Optional[MemoryMap], optional): The DSP's memory map. Defaults to None.
+        """
+        if not I2C.ADDRESS_LENGTH < max_transfer_bytes <= I2C.MAX_TRANSFER_BYTES:
+            raise ValueError(f"Invalid maximum I2C transfer size of {max_transfer_bytes} bytes.")
+
+        self.max_transfer_bytes = max_transfer_bytes
+
+        super().__init__(bus, device, memory_map)
+
+    @property
+    def max_coalesced_bytes(self) -> int:
+        """The maximum size of merged writes in bytes, which fit into a single I2C message."""
+        return self.max_transfer_bytes - I2C.ADDRESS_LENGTH
+
     def _initialize(self, bus: int = 1, device: int = 0x38):
         """Initialize the I2C hardware.
 
@@ -28,6 +77,124 @@ class I2C(BaseProtocol):
         self.bus = SMBus(bus)
         self.i2c_addr = device
 
+    def _message(self, buffer: bytearray, offset: int, length: int, flags: int = 0) -> i2c_msg:
+        """Create an I2C message that refers to a part of a buffer, without copying it.
+
+        The buffer must be kept alive and must not be resized, until the message was transferred.
+
+        Args:
+            buffer (bytearray): The buffer to send from, or receive into.
+            offset (int): The offset of the message data within the buffer.
+            length (int): The length of the message data.
+            flags (int, optional): Message flags, e.g. I2C_M_RD. Defaults to 0.
+
+        Returns:
+            i2c_msg: The message.
+        """
+        buffer_address = ctypes.addressof((ctypes.c_char * len(buffer)).from_buffer(buffer))
+
+        return i2c_msg(
+            addr=self.i2c_addr,
+            flags=flags,
+            len=length,
+            buf=ctypes.cast(buffer_address + offset, ctypes.POINTER(ctypes.c_char)),
+        )
+
+    def _operation_messages(
+        self, operation: Operation, buffers: List[bytearray], result: Optional[bytearray]
+    ) -> List[List[i2c_msg]]:
+        """Build the messages for an operation, split into chunks that the adapter can transfer.
+
+        The register address is advanced by the number of words in each chunk.
+
+        Args:
+            operation (Operation): The operation.
+            buffers (List[bytearray]): Receives the buffers that the messages refer to.
+            result (Optional[bytearray]): For reads, the buffer that receives the data.
+
+        Returns:
+            List[List[i2c_msg]]: Groups of messages, one per chunk, which must be transferred in a single ioctl.
+        """
+        chunk_length, chunk_words = self.memory_map.chunk_size(
+            operation.address, self.max_transfer_bytes - I2C.ADDRESS_LENGTH
+        )
+        chunks: List[List[i2c_msg]] = []
+
+        if isinstance(operation, WriteOperation):
+            data = memoryview(operation.data)
+
+            for chunk_index, offset in enumerate(range(0, max(len(data), 1), chunk_length)):
+                chunk = data[offset : offset + chunk_length]
+
+                frame = bytearray(I2C.ADDRESS_LENGTH + len(chunk))
+                int16_to_bytes(operation.address + chunk_index * chunk_words, frame)
+                frame[I2C.ADDRESS_LENGTH :] = chunk
+
+                buffers.append(frame)
+                chunks.append([self._message(frame, 0, len(frame))])
+
+        elif isinstance(operation, ReadOperation) and result is not None:
+            for chunk_index, offset in enumerate(range(0, operation.length, chunk_length)):
+                address_bytes = int16_to_bytes(operation.address + chunk_index * chunk_words)
+
+                buffers.append(address_bytes)
+                chunks.append(
+                    [
+                        self._message(address_bytes, 0, len(address_bytes)),
+                        self._message(result, offset, min(chunk_length, operation.length - offset), I2C_M_RD),
+                    ]
+                )
+
+        return chunks
+
+    def _transfer(self, operations: List[Operation]) -> List[Optional[bytes]]:
+        """Transfer a batch of operations with as few I2C_RDWR ioctls as possible.
+
+        Writes become one message per chunk, reads a write message with the register address and a read message per
+        chunk. Read data is received directly into the result buffers. Messages are flushed after writes with a hold
+        time, before holding the bus.
+
+        Args:
+            operations (List[Operation]): The operations to transfer.
+
+        Returns:
+            List[Optional[bytes]]: The data that was read for each operation, None for writes.
+        """
+        results: List[Optional[bytes]] = [None] * len(operations)
+        messages: List[i2c_msg] = []
+
+        # The buffers that the messages refer to, which must be kept alive until they were transferred.
+        buffers: List[bytearray] = []
+
+        for index, operation in enumerate(operations):
+            result: Optional[bytearray] = None
+
+            if isinstance(operation, ReadOperation):
+                result = bytearray(operation.length)
+                buffers.append(result)
+                results[index] = result
+
+            for chunk_messages in self._operation_messages(operation, buffers, result):
+                if len(messages) + len(chunk_messages) > I2C.MAX_MESSAGES:
+                    self.bus.i2c_rdwr(*messages)
+                    messages.clear()
+
+                    # Operations with a higher priority may be executed between transfers.
+                    self._preempt()
+
+                messages.extend(chunk_messages)
+
+            if isinstance(operation, WriteOperation) and operation.hold_s > 0:
+                # I2C_RDWR cannot delay between messages, so the messages up to the write are transferred first.
+                self.bus.i2c_rdwr(*messages)
+                messages.clear()
+                self._hold(operation.hold_s)
+
+        if messages:
+            self.bus.i2c_rdwr(*messages)
+
+        return results
+
     def _read(self, address: int, length: int) -> bytes:
         """Read data over the i2c port from a SigmaDSP.
 
@@ -38,15 +205,9 @@ class I2C(BaseProtocol):
         Returns:
             bytes: Data that was read from the DSP
         """
-        address_bytes = list(int16_to_bytes(address))
-
-        msg_wr = i2c_msg.write(self.i2c_addr, address_bytes)
-        msg_rd = i2c_msg.read(self.i2c_addr, length)
+        (data,) = self._transfer([ReadOperation(address, length)])
 
-        self.bus.i2c_rdwr(msg_wr, msg_rd)
-        rd_list = bytes(msg_rd)
-
-        return rd_list
+        return data or b""
 
     def _write(self, address: int, data: bytes):
         """Write data over the I2C port onto a SigmaDSP.
@@ -55,9 +216,4 @@ class I2C(BaseProtocol):
             address (int): Address to write to
             data (bytes): Data to write
         """
-        wr_content = list(int16_to_bytes(address))
-        wr_content.extend(list(data))
-
-        msg_wr = i2c_msg.write(self.i2c_addr, wr_content)
-
-        self.bus.i2c_rdwr(msg_wr)
+        self._transfer([WriteOperation(address, data)])
@@ -0,0 +1,117 @@
+"""Descriptions of SigmaDSP memories and registers, as seen from the control port.
+
+Addresses on the control port are counted in words, where the word length depends on the memory or register that is
+accessed. Protocol handlers need the word length for advancing addresses, when splitting transfers into chunks.
+"""
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple, Union
+
+
+@dataclass(frozen=True)
+class MemoryRegion:
+    """A contiguous range of addresses with a common word length."""
+
+    # The name of the region, e.g. "program" or "parameter".
+    name: str
+
+    # The first address of the region.
+    start: int
+
+    # The last address of the region (inclusive).
+    end: int
+
+    # The number of bytes per address increment.
+    word_length: int
+
+    # Whether the contents may differ from what was written, e.g. for control and status registers.
+    volatile: bool = False
+
+    @property
+    def word_count(self) -> int:
+        """The number of words in the region."""
+        return self.end - self.start + 1
+
+    @property
+    def size(self) -> int:
+        """The size of the region in bytes."""
+        return self.word_count * self.word_length
+
+    def __contains__(self, address: int) -> bool:
+        """Magic method for using `in`.
+
+        Args:
+            address (int): The address to check.
+
+        Returns:
+            bool: True, if the address is within the region.
+        """
+        return self.start <= address <= self.end
+
+
+class MemoryMap:
+    """A collection of memory regions, which describes the address space of a DSP."""
+
+    # The word length that is assumed for addresses outside of any region.
+    DEFAULT_WORD_LENGTH = 4
+
+    def __init__(self, regions: List[MemoryRegion]):
+        """Initialize the memory map.
+
+        Args:
+            regions (List[MemoryRegion]): The regions in the map, which must not overlap.
+        """
+        self.regions = sorted(regions, key=lambda region: region.start)
+
+        for region, next_region in zip(self.regions, self.regions[1:]):
+            if region.end >= next_region.start:
+                raise ValueError(f"Memory regions {region.name} and {next_region.name} overlap.")
+
+    def region(self, address: int) -> Union[MemoryRegion, None]:
+        """Find the region that contains an address.
+
+        Args:
+            address (int): The address to look for.
+
+        Returns:
+            Union[MemoryRegion, None]: The region, or None, if the address is not mapped.
+        """
+        for region in self.regions:
+            if address in region:
+                return region
+
+        return None
+
+    def word_length(self, address: int) -> int:
+        """Get the word length at an address.
+
+        Args:
+            address (int): The address to look at.
+
+        Returns:
+            int: The number of bytes per address increment.
+        """
+        region = self.region(address)
+
+        if region is None:
+            return MemoryMap.DEFAULT_WORD_LENGTH
+
+        return region.word_length
+
+    def chunk_size(self, address: int, max_bytes: int) -> Tuple[int, int]:
+        """Get the largest chunk of whole words that fits into a transfer, starting at an address.
+
+        Args:
+            address (int): The start address of the chunk.
+            max_bytes (int): The maximum number of data bytes per transfer.
+
+        Returns:
+            Tuple[int, int]: The chunk size in bytes, and the corresponding number of words.
+        """
+        word_length = self.word_length(address)
+        words = max_bytes // word_length
+
+        return words * word_length, words
+
+    def __iter__(self) -> Iterator[MemoryRegion]:
+        """The iterator for regions."""
+        return iter(self.regions)
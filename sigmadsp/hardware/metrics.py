@@ -0,0 +1,248 @@
+"""Bus-level metrics of protocol handlers: operation counters, latency histograms and bus utilization.
+
+Metrics are recorded by the handler thread, and can be read from any thread. Recording only involves a few integer
+operations, so it is always enabled.
+"""
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List
+
+
+@dataclass(frozen=True)
+class HistogramSummary:
+    """A summary of the values that were recorded in a histogram, in microseconds."""
+
+    count: int
+    mean_us: float
+    p50_us: int
+    p90_us: int
+    p99_us: int
+    max_us: int
+
+
+class LatencyHistogram:
+    """A histogram of durations with logarithmic buckets, which are linearly subdivided (HDR-style).
+
+    Durations are recorded in microseconds. Values below `2 * SUB_BUCKETS` are counted exactly, larger ones with a
+    relative error of at most `1 / SUB_BUCKETS`.
+    """
+
+    # Number of bits of precision for values beyond the exact range
+    SUB_BUCKET_BITS = 4
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    @staticmethod
+    def bucket_index(value_us: int) -> int:
+        """Get the index of the bucket that counts a value.
+
+        Args:
+            value_us (int): The value in microseconds.
+
+        Returns:
+            int: The bucket index.
+        """
+        if value_us < 2 * LatencyHistogram.SUB_BUCKETS:
+            return value_us
+
+        shift = value_us.bit_length() - LatencyHistogram.SUB_BUCKET_BITS - 1
+
+        return (shift + 1) * LatencyHistogram.SUB_BUCKETS + (value_us >> shift) - LatencyHistogram.SUB_BUCKETS
+
+    @staticmethod
+    def bucket_value(index: int) -> int:
+        """Get the lowest value that is counted by a bucket.
+
+        Args:
+            index (int): The bucket index.
+
+        Returns:
+            int: The value in microseconds.
+        """
+        if index < 2 * LatencyHistogram.SUB_BUCKETS:
+            return index
+
+        shift = index // LatencyHistogram.SUB_BUCKETS - 1
+
+        return (index - shift * LatencyHistogram.SUB_BUCKETS) << shift
+
+    def record(self, seconds: float):
+        """Record a duration.
+
+        Args:
+            seconds (float): The duration in seconds.
+        """
+        value_us = max(round(seconds * 1e6), 0)
+        index = LatencyHistogram.bucket_index(value_us)
+
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value_us
+        self.max_us = max(self.max_us, value_us)
+
+    def percentile(self, percent: float) -> int:
+        """Get the value, below which a percentage of the recorded values lie.
+
+        Args:
+            percent (float): The percentage, between 0 and 100.
+
+        Returns:
+            int: The lower bound of the bucket that contains the percentile, in microseconds.
+        """
+        if not self.count:
+            return 0
+
+        threshold = self.count * percent / 100
+        seen = 0
+
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+
+            if seen >= threshold:
+                return LatencyHistogram.bucket_value(index)
+
+        return self.max_us
+
+    def summary(self) -> HistogramSummary:
+        """Summarize the recorded values.
+
+        Returns:
+            HistogramSummary: The summary.
+        """
+        return HistogramSummary(
+            count=self.count,
+            mean_us=self.total_us / self.count if self.count else 0.0,
+            p50_us=self.percentile(50),
+            p90_us=self.percentile(90),
+            p99_us=self.percentile(99),
+            max_us=self.max_us,
+        )
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """The state of the bus metrics at one point in time."""
+
+    # Latency summaries by name, e.g. "read" or "queue_wait"
+    latencies: Dict[str, HistogramSummary]
+
+    # Counters by name, e.g. "bytes_read"
+    counters: Dict[str, int]
+
+    # The fraction of time that the bus was busy, within the utilization window
+    utilization: float
+
+
+class BusMetrics:
+    """Counters, latency histograms and utilization of a protocol handler."""
+
+    # The names of the latency histograms
+    LATENCIES = ("read", "write", "transaction", "safeload", "queue_wait")
+
+    # The names of the counters
+    COUNTERS = (
+        "reads",
+        "writes",
+        "transactions",
+        "bytes_read",
+        "bytes_written",
+        "errors",
+        "verify_retries",
+        "verify_failures",
+    )
+
+    # The length of the window for computing the bus utilization, in seconds
+    UTILIZATION_WINDOW_S = 10
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self._latencies = {name: LatencyHistogram() for name in BusMetrics.LATENCIES}
+        self._counters = {name: 0 for name in BusMetrics.COUNTERS}
+
+        # Busy time within the utilization window, as [second, busy seconds] per second
+        self._busy: Deque[List[float]] = deque()
+
+    def observe(self, name: str, seconds: float):
+        """Record a duration in a latency histogram.
+
+        Args:
+            name (str): The name of the histogram.
+            seconds (float): The duration in seconds.
+        """
+        with self._lock:
+            self._latencies[name].record(seconds)
+
+    def count(self, name: str, amount: int = 1):
+        """Increase a counter.
+
+        Args:
+            name (str): The name of the counter.
+            amount (int, optional): The amount to add. Defaults to 1.
+        """
+        with self._lock:
+            self._counters[name] += amount
+
+    def busy(self, start: float, end: float):
+        """Record an interval, during which the bus was busy.
+
+        Args:
+            start (float): The start of the interval, from `time.monotonic()`.
+            end (float): The end of the interval, from `time.monotonic()`.
+        """
+        second = int(end)
+
+        with self._lock:
+            if self._busy and self._busy[-1][0] == second:
+                self._busy[-1][1] += end - start
+
+            else:
+                self._busy.append([second, end - start])
+
+            self._expire(end)
+
+    def _expire(self, now: float):
+        """Forget busy time from before the utilization window.
+
+        Args:
+            now (float): The current time, from `time.monotonic()`.
+        """
+        while self._busy and self._busy[0][0] < int(now) - BusMetrics.UTILIZATION_WINDOW_S:
+            self._busy.popleft()
+
+    def utilization(self) -> float:
+        """Get the fraction of time that the bus was busy within the utilization window.
+
+        Returns:
+            float: The utilization, between 0 and 1.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            self._expire(now)
+            busy_s = sum(busy for second, busy in self._busy if second < int(now))
+
+        return min(busy_s / BusMetrics.UTILIZATION_WINDOW_S, 1.0)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Get the current state of the metrics.
+
+        Returns:
+            MetricsSnapshot: The snapshot.
+        """
+        utilization = self.utilization()
+
+        with self._lock:
+            return MetricsSnapshot(
+                latencies={name: histogram.summary() for name, histogram in self._latencies.items()},
+                counters=dict(self._counters),
+                utilization=utilization,
+            )
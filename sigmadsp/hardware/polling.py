@@ -0,0 +1,226 @@
+"""This module polls cells that are read back from the DSP, e.g. level meters, and publishes their values.
+
+The cells are grouped into contiguous address ranges, which are each read with a single bus transfer, at polling
+priority. Polling only runs while there are subscribers.
+
+Polls never wait for their reads on the scheduler thread, since polling reads queue behind all other bus traffic, and
+would stall other tasks on the same scheduler (e.g. parameter ramps). Instead, the values are published by the thread
+that completes the last read of a poll.
+"""
+import logging
+import sched
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sigmadsp.hardware.base_protocol import Priority
+from sigmadsp.hardware.dsp import Dsp
+from sigmadsp.helper.parser import Cell
+
+# A logger for this module
+logger = logging.getLogger(__name__)
+
+# A function that receives the polled values by cell. It must not block, as it is called by the bus handler thread.
+Subscriber = Callable[[Dict[Cell, float]], None]
+
+
+def group_ranges(addresses: Iterable[int], max_gap_words: int = 0) -> List[Tuple[int, int]]:
+    """Group addresses into the fewest ranges, where gaps of up to `max_gap_words` unused words are read along.
+
+    Args:
+        addresses (Iterable[int]): The addresses.
+        max_gap_words (int, optional): The largest number of unused words within a range. Defaults to 0, where
+            only contiguous addresses are grouped.
+
+    Returns:
+        List[Tuple[int, int]]: The ranges as (start address, word count), in ascending order.
+    """
+    ranges: List[Tuple[int, int]] = []
+
+    for address in sorted(set(addresses)):
+        if ranges:
+            start, word_count = ranges[-1]
+
+            if address - (start + word_count) <= max_gap_words:
+                ranges[-1] = (start, address - start + 1)
+                continue
+
+        ranges.append((address, 1))
+
+    return ranges
+
+
+class MeterPoller:
+    """Periodically reads a set of cells with as few bus transfers as possible, and publishes their values."""
+
+    # The default polling rate in Hz
+    RATE_HZ = 10.0
+
+    # The default number of unused words between cells, which are rather read along than starting another transfer
+    MAX_GAP_WORDS = 8
+
+    def __init__(
+        self,
+        dsp: Dsp,
+        scheduler: sched.scheduler,
+        cells: List[Cell],
+        rate_hz: float = RATE_HZ,
+        max_gap_words: int = MAX_GAP_WORDS,
+    ):
+        """Initialize the meter poller.
+
+        Args:
+            dsp (Dsp): The DSP, whose cells are polled.
+            scheduler (sched.scheduler): The scheduler that runs the polls, which must be run by another thread.
+            cells (List[Cell]): The cells to poll.
+            rate_hz (float, optional): The number of polls per second. Defaults to `MeterPoller.RATE_HZ`.
+            max_gap_words (int, optional): The largest number of unused words within a single read. Defaults to
+                `MeterPoller.MAX_GAP_WORDS`.
+        """
+        if rate_hz <= 0:
+            raise ValueError(f"Invalid polling rate {rate_hz} Hz.")
+
+        self.dsp = dsp
+        self.scheduler = scheduler
+        self.cells = cells
+        self.interval_s = 1 / rate_hz
+        self.ranges = group_ranges((cell.parameter_address for cell in cells), max_gap_words)
+
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+        self._poll_event: Optional[sched.Event] = None
+
+        # The poll whose reads are still pending, if any
+        self._pending_poll: Optional[Future] = None
+
+        logger.info("Polling %d cells with %d reads per poll.", len(cells), len(self.ranges))
+
+    def subscribe(self, subscriber: Subscriber):
+        """Receive the values of every poll. Polling starts with the first subscriber.
+
+        Args:
+            subscriber (Subscriber): The function that receives the values.
+        """
+        with self._lock:
+            self._subscribers.append(subscriber)
+
+            if self._poll_event is None:
+                self._poll_event = self.scheduler.enter(0, 0, self._tick)
+
+    def unsubscribe(self, subscriber: Subscriber):
+        """Stop receiving values. Polling stops with the last subscriber.
+
+        Args:
+            subscriber (Subscriber): The function that received the values.
+        """
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+            if not self._subscribers and self._poll_event is not None:
+                try:
+                    self.scheduler.cancel(self._poll_event)
+
+                except ValueError:
+                    # The poll is running right now, and will not be rescheduled.
+                    pass
+
+                self._poll_event = None
+
+    def poll(self) -> Dict[Cell, float]:
+        """Read all cells, with one read per address range, and wait for the values.
+
+        Returns:
+            Dict[Cell, float]: The values by cell.
+        """
+        return self.poll_async().result()
+
+    def poll_async(self) -> Future:
+        """Read all cells, with one read per address range, without waiting for the reads.
+
+        Returns:
+            Future: The future that resolves to the values by cell, once the last read completed.
+        """
+        word_length = self.dsp.FIXPOINT_REGISTER_LENGTH
+        poll: Future = Future()
+
+        with self.dsp.priority(Priority.POLLING):
+            futures = [self.dsp.read_async(start, word_count * word_length) for start, word_count in self.ranges]
+
+        if not futures:
+            poll.set_result({})
+            return poll
+
+        remaining = [len(futures)]
+        remaining_lock = threading.Lock()
+
+        def on_read_done(_: Future):
+            """Decode all values, once the last read of the poll completed."""
+            with remaining_lock:
+                remaining[0] -= 1
+
+                if remaining[0]:
+                    return
+
+            try:
+                values: Dict[int, float] = {}
+
+                for (start, _), future in zip(self.ranges, futures):
+                    for index, value in enumerate(self.dsp.decode_parameter_values(future.result())):
+                        values[start + index] = value
+
+                poll.set_result({cell: values[cell.parameter_address] for cell in self.cells})
+
+            except Exception as e:  # pylint: disable=broad-except
+                poll.set_exception(e)
+
+        for future in futures:
+            future.add_done_callback(on_read_done)
+
+        return poll
+
+    def _tick(self):
+        """Start a poll, and schedule the next one, while there are subscribers.
+
+        A poll is skipped, while the reads of the previous one are still pending, such that reads do not pile up
+        behind other bus traffic.
+        """
+        with self._lock:
+            if not self._subscribers:
+                return
+
+            self._poll_event = self.scheduler.enter(self.interval_s, 0, self._tick)
+
+            if self._pending_poll is not None and not self._pending_poll.done():
+                return
+
+        try:
+            poll = self.poll_async()
+
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Meter poll failed: %s", e)
+            return
+
+        with self._lock:
+            self._pending_poll = poll
+
+        poll.add_done_callback(self._publish)
+
+    def _publish(self, poll: Future):
+        """Pass the values of a completed poll to the subscribers.
+
+        Args:
+            poll (Future): The poll.
+        """
+        try:
+            values = poll.result()
+
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Meter poll failed: %s", e)
+            return
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            subscriber(values)
@@ -0,0 +1,180 @@
+"""This module ramps DSP parameters smoothly from their current values to targets, e.g. for volume fades.
+
+A ramp engine runs on a scheduler and periodically computes the values of all active ramps. All values of one tick are
+sent to the DSP within a single bus transaction, with one multi-word safeload per run of contiguous parameters. Since
+the DSP applies safeloads at frame boundaries, each safeload holds the bus for a frame, and fewer of them keep ticks
+short.
+"""
+import logging
+import sched
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Optional
+
+from sigmadsp.hardware.dsp import Dsp
+from sigmadsp.hardware.polling import group_ranges
+from sigmadsp.helper.conversion import clamp, db_to_linear, linear_to_db
+
+# A logger for this module
+logger = logging.getLogger(__name__)
+
+
+class Curve(Enum):
+    """The shapes of ramps."""
+
+    # Linear in amplitude
+    LINEAR = "linear"
+
+    # Linear in dB, which is perceived as an even fade
+    DB_LINEAR = "db_linear"
+
+    # Smooth start and end (smoothstep), linear in amplitude
+    S_CURVE = "s_curve"
+
+
+@dataclass
+class Ramp:
+    """A transition of a single parameter from a start to a target value."""
+
+    start_value: float
+    target_value: float
+
+    # The start time from `time.monotonic()`, and the duration in seconds
+    start_time: float
+    duration_s: float
+
+    curve: Curve
+
+    # The lowest level in dB for ramps that are linear in dB, which stands in for silence.
+    DB_FLOOR = -120.0
+
+    def progress(self, now: float) -> float:
+        """Get the progress of the ramp.
+
+        Args:
+            now (float): The current time, from `time.monotonic()`.
+
+        Returns:
+            float: The progress between 0 (start) and 1 (done).
+        """
+        if self.duration_s <= 0:
+            return 1.0
+
+        return clamp((now - self.start_time) / self.duration_s, 0.0, 1.0)
+
+    def value(self, now: float) -> float:
+        """Get the value of the ramp at a point in time.
+
+        Args:
+            now (float): The current time, from `time.monotonic()`.
+
+        Returns:
+            float: The value.
+        """
+        progress = self.progress(now)
+
+        if progress >= 1.0:
+            return self.target_value
+
+        if self.curve is Curve.DB_LINEAR and self.start_value >= 0 and self.target_value >= 0:
+            start_db = linear_to_db(max(self.start_value, db_to_linear(Ramp.DB_FLOOR)))
+            target_db = linear_to_db(max(self.target_value, db_to_linear(Ramp.DB_FLOOR)))
+
+            return db_to_linear(start_db + (target_db - start_db) * progress)
+
+        if self.curve is Curve.S_CURVE:
+            progress = progress * progress * (3 - 2 * progress)
+
+        return self.start_value + (self.target_value - self.start_value) * progress
+
+
+class RampEngine:
+    """Drives parameter ramps on a scheduler, with one bus transaction per tick."""
+
+    # The default time between ticks in seconds
+    TICK_S = 0.01
+
+    def __init__(self, dsp: Dsp, scheduler: sched.scheduler, tick_s: float = TICK_S):
+        """Initialize the ramp engine.
+
+        Args:
+            dsp (Dsp): The DSP, whose parameters are ramped.
+            scheduler (sched.scheduler): The scheduler that runs the ticks, which must be run by another thread.
+            tick_s (float, optional): The time between ticks in seconds. Defaults to `RampEngine.TICK_S`.
+        """
+        self.dsp = dsp
+        self.scheduler = scheduler
+        self.tick_s = tick_s
+
+        # Active ramps by parameter address
+        self._ramps: Dict[int, Ramp] = {}
+        self._lock = threading.Lock()
+
+        self._tick_event: Optional[sched.Event] = None
+
+    def ramp(self, targets: Dict[int, float], duration_s: float, curve: Curve = Curve.LINEAR):
+        """Ramp parameters from their current values to targets.
+
+        A ramp that is still in progress for one of the parameters is superseded, and the new ramp starts from the
+        value that was reached.
+
+        Args:
+            targets (Dict[int, float]): The target values by parameter address.
+            duration_s (float): The duration of the ramps in seconds.
+            curve (Curve, optional): The shape of the ramps. Defaults to Curve.LINEAR.
+        """
+        now = time.monotonic()
+        start_values: Dict[int, float] = {}
+
+        with self._lock:
+            for address in targets:
+                if address in self._ramps:
+                    start_values[address] = self._ramps[address].value(now)
+
+        for address in targets:
+            if address not in start_values:
+                value = self.dsp.get_parameter_value(address, data_format="float", cached=True)
+                start_values[address] = float(value or 0.0)
+
+        with self._lock:
+            for address, target_value in targets.items():
+                self._ramps[address] = Ramp(start_values[address], target_value, now, duration_s, curve)
+
+            if self._tick_event is None:
+                self._tick_event = self.scheduler.enter(0, 0, self._tick)
+
+    def active(self) -> Dict[int, float]:
+        """Get the targets of all ramps that are still in progress.
+
+        Returns:
+            Dict[int, float]: The target values by parameter address.
+        """
+        with self._lock:
+            return {address: ramp.target_value for address, ramp in self._ramps.items()}
+
+    def _tick(self):
+        """Send the current values of all active ramps to the DSP, and schedule the next tick, if any ramp remains."""
+        now = time.monotonic()
+
+        with self._lock:
+            values = {address: ramp.value(now) for address, ramp in self._ramps.items()}
+
+            for address in [address for address, ramp in self._ramps.items() if ramp.progress(now) >= 1.0]:
+                del self._ramps[address]
+
+            if self._ramps:
+                self._tick_event = self.scheduler.enter(self.tick_s, 0, self._tick)
+
+            else:
+                self._tick_event = None
+
+        try:
+            with self.dsp.transaction():
+                for start, word_count in group_ranges(values):
+                    words = [values[address] for address in range(start, start + word_count)]
+                    self.dsp.safeload(start, self.dsp.encode_parameter_values(words))
+
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Ramp tick failed: %s", e)
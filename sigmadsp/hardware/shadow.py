@@ -0,0 +1,120 @@
+"""A host-side copy of DSP parameter memory, which answers reads of known state without bus transfers.
+
+The shadow is write-through: it only learns the contents of words that the host wrote itself. Words that were never
+written, or whose contents became unknown, are read from the DSP.
+"""
+import threading
+from typing import Dict, List, Optional
+
+from sigmadsp.hardware.memory import MemoryRegion
+
+
+class ParameterShadow:
+    """A shadow of the parameter memory regions of a DSP, organized in words."""
+
+    def __init__(self, regions: List[MemoryRegion]):
+        """Initialize an empty shadow.
+
+        Args:
+            regions (List[MemoryRegion]): The memory regions that shall be shadowed.
+        """
+        self.regions = regions
+
+        # Known word contents by address
+        self._words: Dict[int, bytes] = {}
+        self._lock = threading.Lock()
+
+    def _region(self, address: int, length: int) -> Optional[MemoryRegion]:
+        """Find the shadowed region that fully contains a range of whole words.
+
+        Args:
+            address (int): The start address of the range.
+            length (int): The length of the range in bytes.
+
+        Returns:
+            Optional[MemoryRegion]: The region, or None, if the range is not shadowed.
+        """
+        for region in self.regions:
+            if address in region:
+                if length % region.word_length or address + length // region.word_length - 1 > region.end:
+                    return None
+
+                return region
+
+        return None
+
+    def covers(self, address: int, length: int) -> bool:
+        """Check, if a range of addresses can be shadowed.
+
+        Args:
+            address (int): The start address of the range.
+            length (int): The length of the range in bytes.
+
+        Returns:
+            bool: True, if the range consists of whole words within a single shadowed region.
+        """
+        return self._region(address, length) is not None
+
+    def store(self, address: int, data: bytes):
+        """Record data that was written to the DSP.
+
+        Ranges that cannot be shadowed are ignored.
+
+        Args:
+            address (int): The start address of the data.
+            data (bytes): The data.
+        """
+        region = self._region(address, len(data))
+
+        if region is None:
+            return
+
+        word_length = region.word_length
+
+        with self._lock:
+            for index, offset in enumerate(range(0, len(data), word_length)):
+                self._words[address + index] = bytes(data[offset : offset + word_length])
+
+    def load(self, address: int, length: int) -> Optional[bytes]:
+        """Get the known contents of a range of addresses.
+
+        Args:
+            address (int): The start address of the range.
+            length (int): The length of the range in bytes.
+
+        Returns:
+            Optional[bytes]: The contents, or None, if any word in the range is unknown.
+        """
+        region = self._region(address, length)
+
+        if region is None:
+            return None
+
+        with self._lock:
+            try:
+                return b"".join(self._words[address + index] for index in range(length // region.word_length))
+
+            except KeyError:
+                return None
+
+    def invalidate(self, address: Optional[int] = None, length: int = 0):
+        """Forget the contents of a range of addresses, or of all addresses.
+
+        Args:
+            address (Optional[int], optional): The start address of the range. Defaults to None, which forgets all
+                contents.
+            length (int, optional): The length of the range in bytes. Defaults to 0.
+        """
+        with self._lock:
+            if address is None:
+                self._words.clear()
+                return
+
+            region = self._region(address, length)
+
+            if region is None:
+                self._words.clear()
+                return
+
+            for index in range(length // region.word_length):
+                self._words.pop(address + index, None)
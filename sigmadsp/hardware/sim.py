@@ -0,0 +1,379 @@
+"""This module implements a protocol handler that simulates a SigmaDSP, for testing and benchmarking without hardware.
+
+The simulated memory follows the DSP's memory map. Safeload and reset registers behave like on the real chipsets,
+and bus timing can be modelled with a fixed time per transferred byte.
+
+Like on the real chipsets, safeloads are applied at the next frame boundary, with the contents that the safeload
+registers have at that time. The simulated time advances with the bus time of transfers and with bus holds, and a frame
+boundary also passes between batches, such that results do not depend on the timing of the host.
+"""
+import logging
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from sigmadsp.hardware.base_protocol import BaseProtocol, Operation
+from sigmadsp.hardware.memory import MemoryMap, MemoryRegion
+
+# A logger for this module
+logger = logging.getLogger(__name__)
+
+
+class Simulator(BaseProtocol):
+    """Simulate transfers from and to SigmaDSP chipsets.
+
+    Supports the memory, safeload and reset behavior of ADAU14xx and ADAU1701.
+    """
+
+    # Number of bytes that are transferred in addition to the data, for the command and address
+    HEADER_LENGTH = 3
+
+    # ADAU14xx software safeload: writing the count register copies the data registers to the target address, at the
+    # next frame boundary.
+    ADAU14XX_SAFELOAD_DATA_REGISTER = 0x6000
+    ADAU14XX_SAFELOAD_ADDRESS_REGISTER = 0x6005
+    ADAU14XX_SAFELOAD_COUNT_REGISTER = 0x6006
+
+    # ADAU14xx soft reset register, where 0 holds the DSP in reset. The clock generator registers keep their contents.
+    ADAU14XX_RESET_REGISTER = 0xF890
+    ADAU14XX_CLOCK_REGISTERS = range(0xF000, 0xF007)
+
+    # ADAU14xx clock generator: the PLL locks at the next frame boundary after it was enabled, and the memories are
+    # only accessible while it is locked. The simulated DSP boots with a locked PLL.
+    ADAU14XX_PLL_ENABLE_REGISTER = 0xF003
+    ADAU14XX_PLL_LOCK_REGISTER = 0xF004
+
+    # ADAU1701 hardware safeload: setting the IST bit in the control register transfers all safeload slots that were
+    # written since the last safeload, at the next frame boundary.
+    ADAU1701_SAFELOAD_DATA_REGISTER = 0x0810
+    ADAU1701_SAFELOAD_ADDRESS_REGISTER = 0x0815
+    ADAU1701_SAFELOAD_SLOTS = 5
+    ADAU1701_CONTROL_REGISTER = 0x081C
+    ADAU1701_IST_MASK = 1 << 5
+
+    # The supported DSP types
+    DSP_TYPES = ("adau14xx", "adau1701")
+
+    def __init__(
+        self,
+        bus: int = 0,
+        device: int = 0,
+        dsp_type: str = "adau14xx",
+        byte_time_s: float = 0,
+        memory_map: Optional[MemoryMap] = None,
+        sample_rate_hz: float = 48000,
+    ):
+        """Initialize the simulator.
+
+        Args:
+            bus (int, optional): Bus number (unused). Defaults to 0.
+            device (int, optional): Device number (unused). Defaults to 0.
+            dsp_type (str, optional): The type of the simulated DSP. Defaults to "adau14xx".
+            byte_time_s (float, optional): The time in seconds that each transferred byte takes. Defaults to 0.
+            memory_map (Optional[MemoryMap], optional): The DSP's memory map, which determines the simulated memory.
+                Defaults to None.
+            sample_rate_hz (float, optional): The sample rate, at whose frame boundaries safeloads are applied.
+                Defaults to 48000.
+        """
+        if dsp_type not in Simulator.DSP_TYPES:
+            raise ValueError(f"Cannot simulate DSP type '{dsp_type}'.")
+
+        self.dsp_type = dsp_type
+        self.byte_time_s = byte_time_s
+
+        # The number of times that the DSP was released from reset.
+        self.reset_count = 0
+
+        self.frame_s = 1 / sample_rate_hz
+
+        # The simulated time since the last frame boundary in seconds.
+        self._frame_time_s = 0.0
+
+        # Whether a safeload was started, which is applied at the next frame boundary.
+        self._safeload_pending = False
+
+        # Whether the ADAU14xx PLL was enabled, and locks at the next frame boundary.
+        self._pll_locking = False
+
+        # The ADAU1701 safeload slots that were written since the last safeload.
+        self._pending_safeload_slots: Set[int] = set()
+
+        super().__init__(bus, device, memory_map)
+
+    def _initialize(self, bus: int = 0, device: int = 0):
+        """Allocate the simulated memory, with one buffer per memory region.
+
+        Args:
+            bus (int, optional): Bus number (unused). Defaults to 0.
+            device (int, optional): Device number (unused). Defaults to 0.
+        """
+        self.memories: Dict[MemoryRegion, bytearray] = {region: bytearray(region.size) for region in self.memory_map}
+
+        # Whether memory accesses require a locked PLL, which is only simulated, if the clock registers are mapped.
+        self._clock_gated = (
+            self.dsp_type == "adau14xx" and self.memory_map.region(Simulator.ADAU14XX_PLL_LOCK_REGISTER) is not None
+        )
+
+        if self._clock_gated:
+            self._store(Simulator.ADAU14XX_PLL_ENABLE_REGISTER, b"\x01")
+            self._store(Simulator.ADAU14XX_PLL_LOCK_REGISTER, b"\x01")
+
+        logger.info("Simulating a %s DSP with %d memory regions.", self.dsp_type, len(self.memories))
+
+    def power_cycle(self):
+        """Switch the simulated DSP off and on, which clears all memories and registers, and leaves the PLL disabled.
+
+        Must only be called, while no operations are pending.
+        """
+        for memory in self.memories.values():
+            memory[:] = bytes(len(memory))
+
+        self._frame_time_s = 0.0
+        self._safeload_pending = False
+        self._pll_locking = False
+        self._pending_safeload_slots.clear()
+
+    def _check_clock(self, address: int):
+        """Check, if an address can be accessed, which requires a locked PLL for the memories of an ADAU14xx.
+
+        Args:
+            address (int): The address to access.
+
+        Raises:
+            OSError: If the address is in a memory, while the PLL is not locked.
+        """
+        if not self._clock_gated:
+            return
+
+        region = self.memory_map.region(address)
+
+        if region is not None and not region.volatile and not any(self._load(Simulator.ADAU14XX_PLL_LOCK_REGISTER)):
+            raise OSError(f"Cannot access address 0x{address:04x}, the PLL of the DSP is not locked.")
+
+    def _locate(self, address: int) -> Tuple[bytearray, int, int]:
+        """Find the memory location of an address.
+
+        Args:
+            address (int): The address to look for.
+
+        Raises:
+            OSError: If the address is not mapped.
+
+        Returns:
+            Tuple[bytearray, int, int]: The memory buffer, the offset of the word within it, and the word length.
+        """
+        region = self.memory_map.region(address)
+
+        if region is None:
+            raise OSError(f"Address 0x{address:04x} is not mapped.")
+
+        return self.memories[region], (address - region.start) * region.word_length, region.word_length
+
+    def _load(self, address: int) -> bytes:
+        """Get the contents of a single word.
+
+        Args:
+            address (int): The address of the word.
+
+        Returns:
+            bytes: The contents.
+        """
+        memory, offset, word_length = self._locate(address)
+
+        return bytes(memory[offset : offset + word_length])
+
+    def _store(self, address: int, word: bytes):
+        """Set the contents of a single word, without side effects.
+
+        Args:
+            address (int): The address of the word.
+            word (bytes): The contents, which are right-aligned within the word.
+        """
+        memory, offset, word_length = self._locate(address)
+
+        memory[offset : offset + word_length] = bytes(word[-word_length:]).rjust(word_length, b"\x00")
+
+    def _delay(self, length: int):
+        """Wait for as long as the transfer of some data would take on the bus.
+
+        Args:
+            length (int): The number of data bytes.
+        """
+        if self.byte_time_s > 0:
+            seconds = (Simulator.HEADER_LENGTH + length) * self.byte_time_s
+            time.sleep(seconds)
+            self._advance(seconds)
+
+    def _hold(self, seconds: float):
+        """Keep the bus idle, which lets the simulated time pass.
+
+        Args:
+            seconds (float): The time in seconds.
+        """
+        if self.byte_time_s > 0:
+            time.sleep(seconds)
+
+        self._advance(seconds)
+
+    def _advance(self, seconds: float):
+        """Advance the simulated time, and pass the frame boundaries within it.
+
+        Args:
+            seconds (float): The time in seconds.
+        """
+        self._frame_time_s += seconds
+
+        if self._frame_time_s >= self.frame_s:
+            self._frame_time_s %= self.frame_s
+            self._frame_boundary()
+
+    def _transfer(self, operations: List[Operation]):
+        """Transfer a batch of operations, after which a frame boundary passes.
+
+        Args:
+            operations (List[Operation]): The operations to transfer.
+
+        Returns:
+            List[Optional[bytes]]: The data that was read for each operation, None for writes.
+        """
+        results = super()._transfer(operations)
+
+        self._frame_time_s = 0.0
+        self._frame_boundary()
+
+        return results
+
+    def _frame_boundary(self):
+        """Lock an enabled PLL, and apply the pending safeload, as the DSP does at the start of a frame."""
+        if self._pll_locking:
+            self._pll_locking = False
+            self._store(Simulator.ADAU14XX_PLL_LOCK_REGISTER, b"\x01")
+
+        if not self._safeload_pending:
+            return
+
+        self._safeload_pending = False
+
+        if self.dsp_type == "adau14xx":
+            count = int.from_bytes(self._load(Simulator.ADAU14XX_SAFELOAD_COUNT_REGISTER), "big")
+            target = int.from_bytes(self._load(Simulator.ADAU14XX_SAFELOAD_ADDRESS_REGISTER), "big")
+
+            for index in range(count):
+                self._store(target + index, self._load(Simulator.ADAU14XX_SAFELOAD_DATA_REGISTER + index))
+
+            return
+
+        for slot in sorted(self._pending_safeload_slots):
+            target = int.from_bytes(self._load(Simulator.ADAU1701_SAFELOAD_ADDRESS_REGISTER + slot), "big")
+            self._store(target, self._load(Simulator.ADAU1701_SAFELOAD_DATA_REGISTER + slot))
+
+        self._pending_safeload_slots.clear()
+
+        # The IST bit clears itself, once the safeload is done.
+        control = int.from_bytes(self._load(Simulator.ADAU1701_CONTROL_REGISTER), "big") & ~Simulator.ADAU1701_IST_MASK
+        self._store(Simulator.ADAU1701_CONTROL_REGISTER, control.to_bytes(2, "big"))
+
+    def _read(self, address: int, length: int) -> bytes:
+        """Read data from the simulated DSP, where the address auto-increments per word.
+
+        Args:
+            address (int): Address to read from
+            length (int): Number of bytes to read
+
+        Returns:
+            bytes: Data that was read from the DSP
+        """
+        self._delay(length)
+        self._check_clock(address)
+
+        data = bytearray()
+
+        while len(data) < length:
+            data.extend(self._load(address))
+            address += 1
+
+        return bytes(data[:length])
+
+    def _write(self, address: int, data: bytes):
+        """Write data onto the simulated DSP, where the address auto-increments per word.
+
+        Args:
+            address (int): Address to write to
+            data (bytes): Data to write
+
+        Raises:
+            ValueError: If the data does not end on a word boundary.
+        """
+        self._delay(len(data))
+        self._check_clock(address)
+
+        offset = 0
+
+        while offset < len(data):
+            _, _, word_length = self._locate(address)
+            word = data[offset : offset + word_length]
+
+            if len(word) < word_length:
+                raise ValueError(f"Incomplete word written to address 0x{address:04x}.")
+
+            self._store(address, word)
+
+            if self.dsp_type == "adau14xx":
+                self._adau14xx_written(address, word)
+
+            else:
+                self._adau1701_written(address, word)
+
+            offset += word_length
+            address += 1
+
+    def _adau14xx_written(self, address: int, word: bytes):
+        """Apply the side effects of writing a word to an ADAU14xx.
+
+        Args:
+            address (int): The address that was written to.
+            word (bytes): The word that was written.
+        """
+        if address == Simulator.ADAU14XX_SAFELOAD_COUNT_REGISTER:
+            self._safeload_pending = True
+
+        elif address == Simulator.ADAU14XX_PLL_ENABLE_REGISTER:
+            self._pll_locking = bool(int.from_bytes(word, "big"))
+
+            if not self._pll_locking:
+                self._store(Simulator.ADAU14XX_PLL_LOCK_REGISTER, b"\x00")
+
+        elif address == Simulator.ADAU14XX_RESET_REGISTER:
+            if int.from_bytes(word, "big"):
+                self.reset_count += 1
+
+            else:
+                # Entering reset restores all registers to their defaults, the memories keep their contents.
+                registers = self.memory_map.region(address)
+
+                if registers is not None:
+                    clock = [
+                        (clock_address, self._load(clock_address)) for clock_address in self.ADAU14XX_CLOCK_REGISTERS
+                    ]
+                    self.memories[registers][:] = bytes(registers.size)
+
+                    for clock_address, clock_word in clock:
+                        self._store(clock_address, clock_word)
+
+                    self._store(address, word)
+
+    def _adau1701_written(self, address: int, word: bytes):
+        """Apply the side effects of writing a word to an ADAU1701.
+
+        Args:
+            address (int): The address that was written to.
+            word (bytes): The word that was written.
+        """
+        for slot in range(Simulator.ADAU1701_SAFELOAD_SLOTS):
+            if address in (
+                Simulator.ADAU1701_SAFELOAD_DATA_REGISTER + slot,
+                Simulator.ADAU1701_SAFELOAD_ADDRESS_REGISTER + slot,
+            ):
+                self._pending_safeload_slots.add(slot)
+
+        if address == Simulator.ADAU1701_CONTROL_REGISTER and int.from_bytes(word, "big") & Simulator.ADAU1701_IST_MASK:
+            self._safeload_pending = True
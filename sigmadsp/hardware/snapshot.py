@@ -0,0 +1,138 @@
+"""This module stores the runtime state of a DSP (memories and registers) in compact, checksummed binary files.
+
+A snapshot file consists of a header with the format version and a CRC32 of the payload, followed by the payload,
+which is compressed with zlib. The payload holds the DSP type and a list of blocks, each with a start address and the
+contents of the DSP from that address on. The order of restoring the blocks is defined by the DSP class.
+"""
+import logging
+import struct
+import zlib
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+# A logger for this module
+logger = logging.getLogger(__name__)
+
+
+class SnapshotError(Exception):
+    """Custom exception for snapshot files that cannot be used."""
+
+
+@dataclass
+class Snapshot:
+    """The contents of a DSP's memories and registers."""
+
+    # The type of the DSP, e.g. "adau14xx"
+    dsp_type: str
+
+    # The contents of the DSP, as (start address, data)
+    blocks: List[Tuple[int, bytes]] = field(default_factory=list)
+
+    # The file header: magic number, format version and CRC32 of the uncompressed payload
+    MAGIC = b"SDSP"
+    VERSION = 1
+    HEADER = struct.Struct(">4sBI")
+
+    # The payload: the DSP type, and the number of blocks, each with start address and data length
+    DSP_TYPE = struct.Struct(">16s")
+    BLOCK_COUNT = struct.Struct(">H")
+    BLOCK = struct.Struct(">HI")
+
+    def to_bytes(self) -> bytes:
+        """Serialize the snapshot.
+
+        Returns:
+            bytes: The content of a snapshot file.
+        """
+        payload = bytearray()
+        payload += Snapshot.DSP_TYPE.pack(self.dsp_type.encode("ascii"))
+        payload += Snapshot.BLOCK_COUNT.pack(len(self.blocks))
+
+        for address, data in self.blocks:
+            payload += Snapshot.BLOCK.pack(address, len(data))
+            payload += data
+
+        return Snapshot.HEADER.pack(Snapshot.MAGIC, Snapshot.VERSION, zlib.crc32(payload)) + zlib.compress(payload)
+
+    @staticmethod
+    def from_bytes(content: bytes) -> "Snapshot":
+        """Deserialize a snapshot.
+
+        Args:
+            content (bytes): The content of a snapshot file.
+
+        Raises:
+            SnapshotError: If the content is not a valid snapshot.
+
+        Returns:
+            Snapshot: The snapshot.
+        """
+        if len(content) < Snapshot.HEADER.size:
+            raise SnapshotError("The snapshot is truncated.")
+
+        magic, version, checksum = Snapshot.HEADER.unpack_from(content)
+
+        if magic != Snapshot.MAGIC or version != Snapshot.VERSION:
+            raise SnapshotError("The content is not a snapshot of a supported version.")
+
+        try:
+            payload = zlib.decompress(content[Snapshot.HEADER.size :])
+
+        except zlib.error as e:
+            raise SnapshotError("The snapshot payload is corrupted.") from e
+
+        if zlib.crc32(payload) != checksum:
+            raise SnapshotError("The snapshot checksum does not match.")
+
+        try:
+            (dsp_type,) = Snapshot.DSP_TYPE.unpack_from(payload)
+            offset = Snapshot.DSP_TYPE.size
+
+            (block_count,) = Snapshot.BLOCK_COUNT.unpack_from(payload, offset)
+            offset += Snapshot.BLOCK_COUNT.size
+
+            snapshot = Snapshot(dsp_type.rstrip(b"\x00").decode("ascii"))
+
+            for _ in range(block_count):
+                address, length = Snapshot.BLOCK.unpack_from(payload, offset)
+                offset += Snapshot.BLOCK.size
+
+                data = payload[offset : offset + length]
+                offset += length
+
+                if len(data) != length:
+                    raise SnapshotError("The snapshot payload is truncated.")
+
+                snapshot.blocks.append((address, data))
+
+        except (struct.error, UnicodeDecodeError) as e:
+            raise SnapshotError("The snapshot payload is malformed.") from e
+
+        if offset != len(payload):
+            raise SnapshotError("The snapshot payload is malformed.")
+
+        return snapshot
+
+    def save(self, path: str):
+        """Write the snapshot to a file.
+
+        Args:
+            path (str): The path of the file.
+        """
+        with open(path, "wb") as snapshot_file:
+            snapshot_file.write(self.to_bytes())
+
+        logger.info("Saved snapshot of %d blocks to %s.", len(self.blocks), path)
+
+    @staticmethod
+    def load(path: str) -> "Snapshot":
+        """Read a snapshot from a file.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            Snapshot: The snapshot.
+        """
+        with open(path, "rb") as snapshot_file:
+            return Snapshot.from_bytes(snapshot_file.read())
@@ -1,14 +1,67 @@
 """This module implements an SPI handler that talks to Sigma DSP devices."""
+import ctypes
+import fcntl
 import logging
+import math
+import random
+import threading
+from typing import List, Optional, Tuple
 
 import spidev
 
-from sigmadsp.hardware.base_protocol import BaseProtocol
+from sigmadsp.hardware.base_protocol import BaseProtocol, Operation, WriteOperation
+from sigmadsp.hardware.memory import MemoryMap
 
 # A logger for this module
 logger = logging.getLogger(__name__)
 
 
+class SpiIocTransfer(ctypes.Structure):
+    """A single transfer within an SPI message, see `struct spi_ioc_transfer` in `linux/spi/spidev.h`."""
+
+    _fields_ = [
+        ("tx_buf", ctypes.c_uint64),
+        ("rx_buf", ctypes.c_uint64),
+        ("len", ctypes.c_uint32),
+        ("speed_hz", ctypes.c_uint32),
+        ("delay_usecs", ctypes.c_uint16),
+        ("bits_per_word", ctypes.c_uint8),
+        ("cs_change", ctypes.c_uint8),
+        ("tx_nbits", ctypes.c_uint8),
+        ("rx_nbits", ctypes.c_uint8),
+        ("word_delay_usecs", ctypes.c_uint8),
+        ("pad", ctypes.c_uint8),
+    ]
+
+
+def spi_ioc_message(count: int) -> int:
+    """Compute the ioctl request number for an SPI message, see `SPI_IOC_MESSAGE(N)` in `linux/spi/spidev.h`.
+
+    Args:
+        count (int): The number of transfers in the message.
+
+    Returns:
+        int: The ioctl request number.
+    """
+    ioc_write = 1
+    spi_ioc_magic = ord("k")
+    size = count * ctypes.sizeof(SpiIocTransfer)
+
+    return (ioc_write << 30) | (size << 16) | (spi_ioc_magic << 8)
+
+
+def write_spi_header(frame: bytearray, command: int, address: int):
+    """Write the SPI header to the start of a frame buffer.
+
+    Args:
+        frame (bytearray): The frame buffer, at least `SPI.HEADER_LENGTH` bytes long
+        command (int): `SPI.WRITE` or `SPI.READ`
+        address (int): The register address to access
+    """
+    frame[0] = command
+    frame[1:3] = address.to_bytes(SPI.ADDRESS_LENGTH, "big")
+
+
 def build_spi_frame(address: int, data: bytes) -> bytearray:
     """Build an SPI frame that is later written to the DSP.
 
@@ -19,10 +72,25 @@ def build_spi_frame(address: int, data: bytes) -> bytearray:
     Returns:
         bytearray: The complete SPI frame buffer
     """
-    frame = bytearray(SPI.HEADER_LENGTH)
-    frame[0] = SPI.WRITE
-    frame[1:3] = address.to_bytes(SPI.ADDRESS_LENGTH, "big")
-    frame += data
+    frame = bytearray(SPI.HEADER_LENGTH + len(data))
+    write_spi_header(frame, SPI.WRITE, address)
+    frame[SPI.HEADER_LENGTH :] = data
+
+    return frame
+
+
+def build_spi_read_frame(address: int, length: int) -> bytearray:
+    """Build an SPI frame that reads from the DSP. The response overwrites the zeros that follow the header.
+
+    Args:
+        address (int): The register address to read from
+        length (int): The number of bytes to read
+
+    Returns:
+        bytearray: The complete SPI frame buffer
+    """
+    frame = bytearray(SPI.HEADER_LENGTH + length)
+    write_spi_header(frame, SPI.READ, address)
 
     return frame
 
@@ -49,9 +117,132 @@ class SPI(BaseProtocol):
     # Derive maximum payload (bytes) from number of maximum words
     MAX_PAYLOAD_BYTES = MAX_PAYLOAD_WORDS * 4
 
+    # Merged writes must fit into a single SPI transfer
+    MAX_COALESCED_BYTES = MAX_PAYLOAD_BYTES
+
+    # Maximum number of transfers in a single SPI message, limited by the size field of the ioctl request number
+    MAX_MESSAGE_TRANSFERS = ((1 << 14) - 1) // ctypes.sizeof(SpiIocTransfer)
+
+    # Maximum delay after a transfer in microseconds, limited by its field in the transfer structure
+    MAX_DELAY_USECS = 0xFFFF
+
     WRITE = 0
     READ = 1
 
+    # The SigmaDSP allows a maximum SPI transfer speed of 20 MHz.
+    MAX_SPEED_HZ = 20000000
+
+    # Raspberry Pi hardware allows binary steps (1 MHz, 2 MHz, ...)
+    DEFAULT_SPEED_HZ = 16000000
+
+    # Transfer speeds that are tried during calibration, slowest first
+    CALIBRATION_SPEEDS_HZ = [1000000, 2000000, 4000000, 8000000, 12000000, 16000000, 20000000]
+
+    # Number of write/read-back cycles that have to pass at a calibration speed
+    CALIBRATION_REPETITIONS = 16
+
+    def __init__(
+        self, bus: int = 0, device: int = 0, speed_hz: int = DEFAULT_SPEED_HZ, memory_map: Optional[MemoryMap] = None
+    ):
+        """Initialize the SPI handler.
+
+        Args:
+            bus (int, optional): Bus number. Defaults to 0.
+            device (int, optional): Device number. Defaults to 0.
+            speed_hz (int, optional): SPI clock speed in Hz. Defaults to `SPI.DEFAULT_SPEED_HZ`.
+            memory_map (Optional[MemoryMap], optional): The DSP's memory map. Defaults to None.
+        """
+        if speed_hz > SPI.MAX_SPEED_HZ:
+            logger.warning("SPI speed of %d Hz is too high, using %d Hz instead.", speed_hz, SPI.MAX_SPEED_HZ)
+            speed_hz = SPI.MAX_SPEED_HZ
+
+        self._initial_speed_hz = speed_hz
+
+        super().__init__(bus, device, memory_map)
+
+    @property
+    def speed_hz(self) -> int:
+        """The SPI clock speed in Hz."""
+        return self.spi.max_speed_hz
+
+    @speed_hz.setter
+    def speed_hz(self, speed_hz: int):
+        """Set the SPI clock speed in Hz. This must not be changed while transfers are pending.
+
+        Args:
+            speed_hz (int): The new speed.
+        """
+        self.spi.max_speed_hz = speed_hz
+
+    def calibrate_speed(self, address: int, length: int) -> int:
+        """Find the fastest SPI clock speed, at which data can be reliably written and read back.
+
+        The current speed is assumed to be safe. Starting from there, the calibration speeds are stepped up, while test
+        patterns are repeatedly written to a scratch register, which must be safe to overwrite, and read back. At the
+        first speed that fails, calibration stops and the last speed that passed is kept. The original register content
+        is restored afterwards, at that speed.
+
+        Other threads must not access the DSP during calibration.
+
+        Args:
+            address (int): The address of the scratch register.
+            length (int): The length of the scratch register in bytes.
+
+        Returns:
+            int: The selected speed in Hz.
+        """
+        selected_speed_hz = self.speed_hz
+        original_data = self.read(address, length)
+
+        try:
+            for speed_hz in SPI.CALIBRATION_SPEEDS_HZ:
+                if speed_hz <= selected_speed_hz or speed_hz > SPI.MAX_SPEED_HZ:
+                    continue
+
+                self.speed_hz = speed_hz
+
+                if not self._check_speed(address, length, random.Random(speed_hz)):
+                    logger.info("SPI read-back check failed at %d Hz.", speed_hz)
+                    break
+
+                selected_speed_hz = speed_hz
+
+        finally:
+            self.speed_hz = selected_speed_hz
+            self.write(address, original_data).result()
+
+        logger.info("SPI calibration selected %d Hz.", selected_speed_hz)
+
+        return selected_speed_hz
+
+    def _check_speed(self, address: int, length: int, generator: random.Random) -> bool:
+        """Write test patterns at the current speed, and check that they are read back correctly.
+
+        Args:
+            address (int): The address of the scratch register.
+            length (int): The length of the scratch register in bytes.
+            generator (random.Random): Generates random test patterns.
+
+        Returns:
+            bool: True, if all patterns were read back correctly.
+        """
+        patterns = [bytes([0x55, 0xAA]) * length, bytes([0x00, 0xFF]) * length]
+
+        while len(patterns) < SPI.CALIBRATION_REPETITIONS:
+            patterns.append(bytes(generator.getrandbits(8) for _ in range(length)))
+
+        for pattern in patterns:
+            try:
+                self.write(address, pattern[:length]).result()
+
+                if self.read(address, length) != pattern[:length]:
+                    return False
+
+            except OSError:
+                return False
+
+        return True
+
     def _initialize(self, bus: int = 0, device: int = 0):
         """Initialize the SPI hardware.
 
@@ -65,17 +256,121 @@ class SPI(BaseProtocol):
         self.spi = spidev.SpiDev()
         self.spi.open(bus, device)
 
-        # The SigmaDSP allows a maximum SPI transfer speed of 20 MHz.
-        # Raspberry Pi hardware allows binary steps (1 MHz, 2 MHz, ...)
-        self.spi.max_speed_hz = 16000000
+        # Buffers for reading and writing, which are reused by each thread.
+        self._buffers = threading.local()
+
+        self.spi.max_speed_hz = self._initial_speed_hz
 
         # The SigmaDSP uses SPI mode 0 with 8 bits per word. Do not change.
         self.spi.mode = 0
         self.spi.bits_per_word = 8
 
+    def _transfer(self, operations: List[Operation]) -> List[Optional[bytes]]:
+        """Transfer a batch of operations with as few SPI messages as possible.
+
+        Every operation becomes one transfer with its own chip select cycle, but many transfers share a single
+        ioctl. Operations that do not fit into one transfer are split by `_write()` or `_read()`.
+
+        Args:
+            operations (List[Operation]): The operations to transfer.
+
+        Returns:
+            List[Optional[bytes]]: The data that was read for each operation, None for writes.
+        """
+        results: List[Optional[bytes]] = [None] * len(operations)
+
+        # Transfers of the current message, as (operation index, frame)
+        message: List[Tuple[int, bytearray]] = []
+        message_length = 0
+
+        for index, operation in enumerate(operations):
+            if isinstance(operation, WriteOperation):
+                frame_length = SPI.HEADER_LENGTH + len(operation.data)
+
+            else:
+                frame_length = SPI.HEADER_LENGTH + operation.length
+
+            if (
+                message_length + frame_length > SPI.MAX_SPI_BYTES
+                or len(message) >= SPI.MAX_MESSAGE_TRANSFERS
+                or frame_length > SPI.MAX_SPI_BYTES
+            ):
+                self._transfer_message(message, operations, results)
+                message = []
+                message_length = 0
+
+            if frame_length > SPI.MAX_SPI_BYTES:
+                results[index] = self._transfer_single(operation)
+
+                if isinstance(operation, WriteOperation) and operation.hold_s > 0:
+                    self._hold(operation.hold_s)
+
+                continue
+
+            if isinstance(operation, WriteOperation):
+                frame = build_spi_frame(operation.address, operation.data)
+
+            else:
+                frame = build_spi_read_frame(operation.address, frame_length - SPI.HEADER_LENGTH)
+
+            message.append((index, frame))
+            message_length += frame_length
+
+        self._transfer_message(message, operations, results)
+
+        return results
+
+    def _transfer_message(
+        self, message: List[Tuple[int, bytearray]], operations: List[Operation], results: List[Optional[bytes]]
+    ):
+        """Transfer a list of frames as a single SPI message, and store the data that was read.
+
+        Args:
+            message (List[Tuple[int, bytearray]]): The transfers in the message, as (operation index, frame).
+            operations (List[Operation]): All operations of the batch.
+            results (List[Optional[bytes]]): Receives the data that was read, at the operation's index.
+        """
+        if not message:
+            return
+
+        transfers = (SpiIocTransfer * len(message))()
+
+        # Keep references to the frame buffers, until the transfer is done.
+        buffers = []
+
+        for transfer, (index, frame) in zip(transfers, message):
+            buffer = (ctypes.c_char * len(frame)).from_buffer(frame)
+            buffers.append(buffer)
+
+            # Received data overwrites the transmitted frame.
+            transfer.tx_buf = transfer.rx_buf = ctypes.addressof(buffer)
+            transfer.len = len(frame)
+            transfer.speed_hz = self.spi.max_speed_hz
+            transfer.bits_per_word = 8
+
+            # Release chip select after each frame, such that the DSP sees a new header.
+            transfer.cs_change = 1
+
+            operation = operations[index]
+
+            if isinstance(operation, WriteOperation) and operation.hold_s > 0:
+                # The kernel waits after the frame, before the next one is transferred.
+                transfer.delay_usecs = min(math.ceil(operation.hold_s * 1e6), SPI.MAX_DELAY_USECS)
+
+        # Chip select is released at the end of the message anyway.
+        transfers[len(message) - 1].cs_change = 0
+
+        fcntl.ioctl(self.spi.fileno(), spi_ioc_message(len(message)), transfers)
+
+        for index, frame in message:
+            if not isinstance(operations[index], WriteOperation):
+                results[index] = bytes(frame[SPI.HEADER_LENGTH :])
+
     def _read(self, address: int, length: int) -> bytes:
         """Read data over the SPI port from a SigmaDSP.
 
+        Reads of any length are supported, they are split into chunks that fit the spidev buffer.
+
         Args:
             address (int): Address to read from
             length (int): Number of bytes to read
@@ -83,14 +378,74 @@ class SPI(BaseProtocol):
         Returns:
             bytes: Data that was read from the DSP
         """
-        spi_request = bytearray(length + SPI.HEADER_LENGTH)
-        spi_request[0] = SPI.READ
-        spi_request[1:3] = address.to_bytes(SPI.ADDRESS_LENGTH, "big")
+        data = bytearray(length)
+
+        if not length:
+            return data
+
+        header, transfers = self._read_transfers()
+        data_buffer = (ctypes.c_char * length).from_buffer(data)
+
+        # Reads that are larger than the spidev buffer are split into chunks,
+        # where the read address is advanced accordingly.
+        max_chunk_length, chunk_words = self.memory_map.chunk_size(address, SPI.MAX_SPI_BYTES - SPI.HEADER_LENGTH)
+
+        current_address = address
+        offset = 0
 
-        # Read, by writing zeros
-        spi_response = self.spi.xfer(spi_request)
+        while offset < length:
+            chunk_length = min(length - offset, max_chunk_length)
 
-        return bytes(spi_response[SPI.HEADER_LENGTH :])
+            write_spi_header(header, SPI.READ, current_address)
+
+            # The response is received directly into the output buffer.
+            transfers[1].rx_buf = ctypes.addressof(data_buffer) + offset
+            transfers[1].len = chunk_length
+
+            for transfer in transfers:
+                transfer.speed_hz = self.spi.max_speed_hz
+
+            fcntl.ioctl(self.spi.fileno(), spi_ioc_message(2), transfers)
+
+            current_address += chunk_words
+            offset += chunk_length
+
+            # Operations with a higher priority may be executed between chunks.
+            if offset < length:
+                self._preempt()
+
+        return data
+
+    def _read_transfers(self) -> Tuple[bytearray, ctypes.Array]:
+        """Get the header buffer and SPI message for reading, which are allocated once per thread.
+
+        The message consists of two transfers within a single chip select cycle: the header is sent first,
+        then the response is clocked in while sending zeros.
+
+        Returns:
+            Tuple[bytearray, ctypes.Array]: The header buffer and the transfers of the message.
+        """
+        try:
+            return self._buffers.read_header, self._buffers.read_transfers
+
+        except AttributeError:
+            header = bytearray(SPI.HEADER_LENGTH)
+            write_spi_header(header, SPI.READ, 0)
+
+            header_buffer = (ctypes.c_char * len(header)).from_buffer(header)
+
+            transfers = (SpiIocTransfer * 2)()
+            transfers[0].tx_buf = ctypes.addressof(header_buffer)
+            transfers[0].len = len(header)
+
+            for transfer in transfers:
+                transfer.bits_per_word = 8
+
+            self._buffers.read_header = header
+            self._buffers.read_header_buffer = header_buffer
+            self._buffers.read_transfers = transfers
+
+            return header, transfers
 
     def _write(self, address: int, data: bytes):
         """Write data over the SPI port onto a SigmaDSP.
@@ -102,32 +457,41 @@ class SPI(BaseProtocol):
         Returns:
             int: Number of bytes written
         """
-        remaining_data_length = len(data)
+        frame = self._write_frame()
+        frame_view = memoryview(frame)
+        data_view = memoryview(data)
+
+        # Packets that are larger than the spidev buffer are split into chunks,
+        # where the write address is advanced accordingly.
+        max_chunk_length, chunk_words = self.memory_map.chunk_size(address, SPI.MAX_SPI_BYTES - SPI.HEADER_LENGTH)
+
         current_address = address
-        current_data = data
 
-        while remaining_data_length > 0:
-            # There is data remaining for writing
+        for offset in range(0, len(data_view), max_chunk_length):
+            chunk = data_view[offset : offset + max_chunk_length]
+            frame_length = SPI.HEADER_LENGTH + len(chunk)
 
-            if remaining_data_length >= SPI.MAX_PAYLOAD_BYTES:
-                # Packet has to be split into smaller chunks,
-                # where the write address is advanced accordingly.
-                # DSP register addresses are counted in words (32 bit per increment).
+            write_spi_header(frame, SPI.WRITE, current_address)
+            frame_view[SPI.HEADER_LENGTH : frame_length] = chunk
 
-                # Build the frame from a subset of the input data, and write it
-                frame = build_spi_frame(
-                    current_address,
-                    current_data[: SPI.MAX_PAYLOAD_BYTES],
-                )
-                self.spi.writebytes(frame)
+            self.spi.writebytes2(frame_view[:frame_length])
 
-                # Update address, data counter, and the binary data buffer
-                current_address += SPI.MAX_PAYLOAD_WORDS
-                remaining_data_length -= SPI.MAX_PAYLOAD_BYTES
-                current_data = current_data[SPI.MAX_PAYLOAD_BYTES :]
+            current_address += chunk_words
 
-            else:
-                # The packet fits into one transmission.
-                frame = build_spi_frame(current_address, current_data)
-                self.spi.writebytes(frame)
-                remaining_data_length = 0
+            # Operations with a higher priority may be executed between chunks.
+            if offset + max_chunk_length < len(data_view):
+                self._preempt()
+
+    def _write_frame(self) -> bytearray:
+        """Get the frame buffer for writing, which is allocated once per thread.
+
+        Returns:
+            bytearray: The frame buffer, which holds the largest possible SPI frame.
+        """
+        try:
+            return self._buffers.write_frame
+
+        except AttributeError:
+            self._buffers.write_frame = bytearray(SPI.MAX_SPI_BYTES)
+
+            return self._buffers.write_frame
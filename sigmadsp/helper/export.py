@@ -0,0 +1,100 @@
+"""A module that reads program images from SigmaStudio's exported system files.
+
+SigmaStudio exports a complete download as a byte buffer (`TxBuffer_IC_1.dat`), and the lengths of the individual
+writes within it (`NumBytes_IC_1.dat`). Both contain comma-separated numbers, where bytes are written in hexadecimal
+(e.g. `0x08, 0x1C, 0x00, 0x58,`). Each write starts with its two-byte target address, followed by the data.
+
+Other export formats, such as Intel HEX images (`.hex`), are not supported.
+"""
+import logging
+import re
+from dataclasses import dataclass
+from typing import List
+
+# A logger for this module
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ExportedWrite:
+    """A single write from an exported download."""
+
+    # The target address.
+    address: int
+
+    # The data, which is written to consecutive addresses from the target address.
+    data: bytes
+
+
+class ExportError(Exception):
+    """Custom exception for malformed export files."""
+
+
+# The number of bytes of the target address at the start of each write
+ADDRESS_LENGTH = 2
+
+# Patterns of the numbers within the buffer file (hexadecimal) and the lengths file (decimal)
+BYTE_PATTERN = re.compile(r"0[xX]([0-9a-fA-F]{1,2})\b")
+LENGTH_PATTERN = re.compile(r"\b(\d+)\b")
+
+# The start of an Intel HEX record, which is not supported
+INTEL_HEX_PATTERN = re.compile(r"^\s*:[0-9a-fA-F]{2}")
+
+
+def parse_export(tx_buffer: str, num_bytes: str) -> List[ExportedWrite]:
+    """Split the content of an exported byte buffer into writes.
+
+    Args:
+        tx_buffer (str): The content of the buffer file, e.g. `TxBuffer_IC_1.dat`.
+        num_bytes (str): The content of the lengths file, e.g. `NumBytes_IC_1.dat`.
+
+    Raises:
+        ExportError: If the buffer is an Intel HEX image, or if the lengths do not match the buffer.
+
+    Returns:
+        List[ExportedWrite]: The writes, in the order of the download.
+    """
+    if INTEL_HEX_PATTERN.match(tx_buffer):
+        raise ExportError("Intel HEX images are not supported, use the exported TxBuffer and NumBytes files.")
+
+    buffer = bytes(int(match.group(1), 16) for match in BYTE_PATTERN.finditer(tx_buffer))
+    lengths = [int(match.group(1)) for match in LENGTH_PATTERN.finditer(num_bytes)]
+
+    if sum(lengths) != len(buffer):
+        raise ExportError(
+            f"The write lengths add up to {sum(lengths)} bytes, but the buffer holds {len(buffer)} bytes."
+        )
+
+    writes: List[ExportedWrite] = []
+    offset = 0
+
+    for length in lengths:
+        if length <= ADDRESS_LENGTH:
+            raise ExportError(f"A write of {length} bytes cannot hold an address and data.")
+
+        address = int.from_bytes(buffer[offset : offset + ADDRESS_LENGTH], "big")
+        writes.append(ExportedWrite(address, buffer[offset + ADDRESS_LENGTH : offset + length]))
+        offset += length
+
+    logger.info("Read %d writes with %d bytes from the exported download.", len(writes), len(buffer))
+
+    return writes
+
+
+def load_export(tx_buffer_path: str, num_bytes_path: str) -> List[ExportedWrite]:
+    """Read the writes of an exported download from the files.
+
+    Args:
+        tx_buffer_path (str): The path of the buffer file, e.g. `TxBuffer_IC_1.dat`.
+        num_bytes_path (str): The path of the lengths file, e.g. `NumBytes_IC_1.dat`.
+
+    Returns:
+        List[ExportedWrite]: The writes, in the order of the download.
+    """
+    with open(tx_buffer_path, "r", encoding="utf8") as tx_buffer_file:
+        tx_buffer = tx_buffer_file.read()
+
+    with open(num_bytes_path, "r", encoding="utf8") as num_bytes_file:
+        num_bytes = num_bytes_file.read()
+
+    return parse_export(tx_buffer, num_bytes)
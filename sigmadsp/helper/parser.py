@@ -37,11 +37,14 @@ class Cell:
     # The cell name prefix for cells that adjust volume.
     VOLUME_PREFIX: ClassVar[str] = "volume"
 
+    # The cell name prefix for cells that are read back from the DSP, e.g. level meters or limiter gain reduction.
+    METER_PREFIX: ClassVar[str] = "meter"
+
     # The cell name for a safety hash.
     SAFETY_HASH: ClassVar[str] = "safety_hash"
 
     # A complete list of valid prefixes, which are understood by the parser.
-    VALID_PREFIX_TOKENS: ClassVar[List[str]] = [ADJUSTABLE_PREFIX, VOLUME_PREFIX]
+    VALID_PREFIX_TOKENS: ClassVar[List[str]] = [ADJUSTABLE_PREFIX, VOLUME_PREFIX, METER_PREFIX]
 
     @property
     def full_name_tokens(self) -> List[str]:
@@ -114,6 +117,15 @@ class Cell:
             and (Cell.TARGET_PARAMETER in self.parameter_name)
         )
 
+    @property
+    def is_meter_cell(self) -> bool:
+        """Determine, whether the cell is a meter cell, whose value is read back from the DSP.
+
+        Returns:
+            bool: True, if it is a meter cell, False otherwise.
+        """
+        return Cell.METER_PREFIX in self.prefix_tokens
+
 
 class Parser:
     """Parse a parameter input file from Sigma Studio and detects cells in it."""
@@ -235,6 +247,15 @@ class Parser:
         """
         return [cell for cell in self.cells if cell.is_volume_cell]
 
+    @property
+    def meter_cells(self) -> List[Cell]:
+        """Return all cells that are read back from the DSP, e.g. for level meters. These are named 'meter_...'.
+
+        Returns:
+            List[Cell]: The list of meter cells
+        """
+        return [cell for cell in self.cells if cell.is_meter_cell]
+
     def get_matching_cells_by_name_tokens(self, all_cells: List[Cell], name_tokens: List[str]) -> List[Cell]:
         """Find cells in a list of cells, whose names match the specified name tokens.
 
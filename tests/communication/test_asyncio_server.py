@@ -0,0 +1,134 @@
+"""Tests for the communication.sigma_asyncio_server module."""
+import socket
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Union
+
+from sigmadsp.communication.base import ReadRequest, SafeloadRequest, WriteRequest
+from sigmadsp.communication.sigma_asyncio_server import SigmaStudioAsyncServer
+
+
+def receive_exactly(connection: socket.socket, length: int) -> bytes:
+    """Receive a number of bytes from a socket."""
+    data = b""
+
+    while len(data) < length:
+        data += connection.recv(length - len(data))
+
+    return data
+
+
+def test_write_and_read():
+    """Test that writes are handed to the request handler, and reads are answered with the handler's data."""
+    requests: List[Union[WriteRequest, ReadRequest]] = []
+
+    def request_handler(request: Union[WriteRequest, ReadRequest]) -> Optional[Future]:
+        requests.append(request)
+
+        if isinstance(request, ReadRequest):
+            future: Future = Future()
+            future.set_result(bytes(range(request.length)))
+
+            return future
+
+        return None
+
+    server = SigmaStudioAsyncServer("127.0.0.1", 0, "adau14xx", request_handler)
+    payload = b"\x01\x02\x03\x04"
+
+    # ADAU145x write header: operation, safeload, channel, total length, chip address, data length, address
+    write_packet = bytes([0x09, 0x01, 0x00]) + (14 + 4).to_bytes(4, "big") + b"\x01"
+    write_packet += len(payload).to_bytes(4, "big") + (0x0100).to_bytes(2, "big") + payload
+
+    # ADAU145x read request header: operation, total length, chip address, data length, address, reserved
+    read_packet = bytes([0x0A]) + (14).to_bytes(4, "big") + b"\x01" + (8).to_bytes(4, "big") + b"\xf0\x00\x00\x00"
+
+    with socket.create_connection(("127.0.0.1", server.port)) as connection:
+        connection.sendall(write_packet + read_packet)
+        response = receive_exactly(connection, 14 + 8)
+
+    assert requests == [SafeloadRequest(0x0100, payload, 1), ReadRequest(0xF000, 8, 1)]
+    assert response[0] == 0x0B
+    assert response[10:12] == b"\xf0\x00"
+    assert response[14:] == bytes(range(8))
+
+
+def test_pipelined_reads():
+    """Test that reads are submitted before earlier reads complete, and answered in the order of the requests."""
+    futures: List[Future] = []
+
+    def request_handler(request: Union[WriteRequest, ReadRequest]) -> Optional[Future]:
+        future: Future = Future()
+        futures.append(future)
+
+        return future
+
+    server = SigmaStudioAsyncServer("127.0.0.1", 0, "adau14xx", request_handler)
+
+    def read_packet(address: int) -> bytes:
+        return (
+            bytes([0x0A])
+            + (14).to_bytes(4, "big")
+            + b"\x01"
+            + (2).to_bytes(4, "big")
+            + address.to_bytes(2, "big")
+            + b"\x00\x00"
+        )
+
+    with socket.create_connection(("127.0.0.1", server.port)) as connection:
+        connection.sendall(read_packet(0x0001) + read_packet(0x0002))
+
+        while len(futures) < 2:
+            time.sleep(0.01)
+
+        # The later read completes first, but its response must not overtake the earlier one.
+        futures[1].set_result(b"\x00\x02")
+        futures[0].set_result(b"\x00\x01")
+
+        response = receive_exactly(connection, 2 * (14 + 2))
+
+    assert response[10:12] == b"\x00\x01"
+    assert response[14:16] == b"\x00\x01"
+    assert response[26:28] == b"\x00\x02"
+    assert response[30:32] == b"\x00\x02"
+
+
+def test_pending_writes_pause_receiving():
+    """Test that pending writes count against the in-flight limit, such that receiving pauses."""
+    futures: List[Future] = []
+
+    def request_handler(request: Union[WriteRequest, ReadRequest]) -> Optional[Future]:
+        future: Future = Future()
+        futures.append(future)
+
+        return future
+
+    class LimitedServer(SigmaStudioAsyncServer):
+        """A server with few requests in flight."""
+
+        MAX_IN_FLIGHT = 4
+
+    server = LimitedServer("127.0.0.1", 0, "adau14xx", request_handler)
+    payload = b"\x01\x02\x03\x04"
+
+    # ADAU145x write header: operation, safeload, channel, total length, chip address, data length, address
+    write_packet = bytes([0x09, 0x00, 0x00]) + (14 + 4).to_bytes(4, "big") + b"\x01"
+    write_packet += len(payload).to_bytes(4, "big") + (0x0100).to_bytes(2, "big") + payload
+
+    with socket.create_connection(("127.0.0.1", server.port)) as connection:
+        connection.sendall(20 * write_packet)
+        time.sleep(0.1)
+
+        # The queue is full, one write is awaited by the sender, and one waits for a place in the queue.
+        assert len(futures) == LimitedServer.MAX_IN_FLIGHT + 2
+
+        deadline = time.time() + 1
+
+        while len(futures) < 20 and time.time() < deadline:
+            for future in futures:
+                if not future.done():
+                    future.set_result(None)
+
+            time.sleep(0.01)
+
+    assert len(futures) == 20
@@ -0,0 +1,85 @@
+"""Tests for the header codecs of the communication.sigmastudio_protocols module."""
+from sigmadsp.communication.sigmastudio_protocols import (
+    _REGISTRY,
+    Adau145xReadResponseHeader,
+    Adau145xWriteHeader,
+    Field,
+    Fields,
+    SigmaProtocolHeader,
+    SigmaProtocolPacket,
+)
+from sigmadsp.helper.conversion import int_to_bytes
+
+
+def reference_bytes(header: SigmaProtocolHeader) -> bytes:
+    """Assemble a header field by field, as before the codecs were compiled."""
+    buffer = bytearray()
+
+    for field in header.fields:
+        int_to_bytes(header[field.name], buffer, field.offset, field.size)
+
+    return bytes(buffer)
+
+
+def test_registered_headers_are_byte_identical():
+    """Test that all registered headers encode and decode exactly like the field description."""
+    for headers in _REGISTRY.values():
+        for header_class in headers.values():
+            header = header_class()
+
+            for index, field in enumerate(header.fields):
+                header[field.name] = (0x5A + index * 0x11) % (1 << (8 * field.size))
+
+            expected = reference_bytes(header)
+            assert header.fields.size == len(expected)
+            assert header.as_bytes() == expected
+
+            buffer = bytearray(3 + header.fields.size)
+            header.pack_into(buffer, 3)
+            assert bytes(buffer[3:]) == expected
+
+            parsed = header_class()
+            parsed.parse(memoryview(expected))
+            assert parsed.record == header.record
+
+
+def test_codec_with_gaps_and_odd_sizes():
+    """Test fields, whose sizes have no struct format character, and undefined bytes between fields."""
+    fields = Fields([Field("first", 0, 3, 0x123456), Field("second", 5, 2, 0xABCD)])
+
+    assert not fields.is_continuous
+    assert fields.size == 7
+    assert fields.as_bytes() == b"\x12\x34\x56\x00\x00\xab\xcd"
+    assert fields.codec.unpack(b"\x00\x00\x01\xff\xff\x00\x02") == (1, 2)
+
+
+def test_headers_do_not_share_values():
+    """Test that decoding or changing one header leaves other headers and the field defaults untouched."""
+    first = Adau145xWriteHeader()
+    second = Adau145xWriteHeader()
+
+    first["address"] = 0x1234
+    second.parse(bytes([0x09, 0x01, 0x00, 0, 0, 0, 18, 0x01, 0, 0, 0, 4, 0x00, 0x20]))
+
+    assert first["address"] == 0x1234
+    assert second["address"] == 0x20
+    assert Adau145xWriteHeader.fields["address"].value == 0
+    assert Adau145xWriteHeader.fields.defaults.address == 0
+
+
+def test_read_response_from_request():
+    """Test that read responses take their addressing from the request header."""
+    request = Adau145xWriteHeader()
+    request["chip_address"] = 1
+    request["address"] = 0x0123
+
+    packet = SigmaProtocolPacket("adau145x")
+    packet.init_from_payload(SigmaProtocolHeader.READ_RESPONSE, b"\x00\x00\x00\x01", request)
+
+    assert isinstance(packet.header, Adau145xReadResponseHeader)
+    assert packet.header.is_read_response
+    assert packet.header["total_length"] == 18
+    assert packet.header["data_length"] == 4
+    assert packet.header["chip_address"] == 1
+    assert packet.header["success"] == 0
+    assert packet.as_bytes == bytes([0x0B, 0, 0, 0, 18, 1, 0, 0, 0, 4, 0x01, 0x23, 0, 0, 0, 0, 0, 1])
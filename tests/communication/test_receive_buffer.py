@@ -0,0 +1,51 @@
+"""Tests for the receive buffer in the communication.base module."""
+import pytest
+
+from sigmadsp.communication.base import ReceiveBuffer
+
+
+class FakeConnection:
+    """A connection that delivers prepared data, in chunks of limited size."""
+
+    def __init__(self, data: bytes, chunk_size: int):
+        """Prepare the data to deliver."""
+        self.data = data
+        self.chunk_size = chunk_size
+        self.receive_calls = 0
+
+    def recv_into(self, buffer: memoryview) -> int:
+        """Deliver the next chunk of data."""
+        self.receive_calls += 1
+        chunk = self.data[: min(len(buffer), self.chunk_size)]
+        self.data = self.data[len(chunk) :]
+        buffer[: len(chunk)] = chunk
+
+        return len(chunk)
+
+
+def test_reads_in_large_chunks():
+    """Test that many small reads cost few receive calls, and views stay valid when the buffer is replaced."""
+    data = bytes(range(256)) * 16
+    connection = FakeConnection(data, chunk_size=1024)
+    receive_buffer = ReceiveBuffer(connection, size=1000)
+
+    views = []
+
+    while len(views) * 8 < len(data):
+        assert receive_buffer.peek(1)[0] == data[len(views) * 8]
+        views.append(receive_buffer.read(8))
+
+    assert b"".join(bytes(view) for view in views) == data
+    assert connection.receive_calls <= 6
+
+    with pytest.raises(ConnectionError):
+        receive_buffer.read(1)
+
+
+def test_reads_larger_than_buffer():
+    """Test that reads larger than the buffer are possible."""
+    data = bytes(range(200)) * 30
+    receive_buffer = ReceiveBuffer(FakeConnection(data, chunk_size=4096), size=512)
+
+    assert bytes(receive_buffer.read(10)) == data[:10]
+    assert bytes(receive_buffer.read(len(data) - 10)) == data[10:]
@@ -0,0 +1,66 @@
+"""Tests for the communication.sigma_tcp_server module."""
+import socket
+import threading
+
+from sigmadsp.communication.base import (
+    ReadRequest,
+    ReadResponse,
+    ThreadedTCPServer,
+    WriteRequest,
+)
+from sigmadsp.communication.sigma_tcp_server import Adau1701RequestHandler
+
+
+def test_pipelined_requests_keep_their_order():
+    """Test that requests are submitted in order, and each read is answered before later requests are submitted."""
+    server = ThreadedTCPServer(("127.0.0.1", 0), Adau1701RequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # ADAU1701 write header: operation, safeload, channel, total length, chip address, data length, address
+    def write_packet(address: int) -> bytes:
+        return bytes([0x09, 0x00, 0x00, 0x00, 12, 0x01, 0x00, 2]) + address.to_bytes(2, "big") + b"\xab\xcd"
+
+    # ADAU1701 read request header: operation, total length, chip address, data length, address
+    def read_packet(address: int) -> bytes:
+        return bytes([0x0A, 0x00, 8, 0x01, 0x00, 2]) + address.to_bytes(2, "big")
+
+    with server, socket.create_connection(server.server_address) as connection:
+        connection.sendall(write_packet(0x10) + read_packet(0x20) + write_packet(0x30) + read_packet(0x40))
+
+        assert server.pipe_end_user.recv() == WriteRequest(0x10, b"\xab\xcd", 1)
+        assert server.pipe_end_user.recv() == ReadRequest(0x20, 2, 1)
+
+        # The later write waits for the response to the earlier read.
+        assert not server.pipe_end_user.poll(0.1)
+        server.pipe_end_user.send(ReadResponse(b"\x00\x01"))
+
+        assert server.pipe_end_user.recv() == WriteRequest(0x30, b"\xab\xcd", 1)
+        assert server.pipe_end_user.recv() == ReadRequest(0x40, 2, 1)
+        server.pipe_end_user.send(ReadResponse(b"\x00\x02"))
+
+        response = b""
+
+        while len(response) < 2 * 6:
+            response += connection.recv(64)
+
+        server.shutdown()
+
+    assert response == bytes([0x0B, 0x00, 6, 0x20, 0x00, 0x01, 0x0B, 0x00, 6, 0x40, 0x00, 0x02])
+
+
+def test_failed_read_closes_connection():
+    """Test that the connection is closed, if a read request could not be answered with data."""
+    server = ThreadedTCPServer(("127.0.0.1", 0), Adau1701RequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with server, socket.create_connection(server.server_address) as connection:
+        connection.sendall(bytes([0x0A, 0x00, 8, 0x01, 0x00, 2, 0x00, 0x20]))
+
+        assert server.pipe_end_user.recv() == ReadRequest(0x20, 2, 1)
+        server.pipe_end_user.send(ReadResponse(b"", success=False))
+
+        connection.settimeout(1)
+
+        assert connection.recv(64) == b""
+
+        server.shutdown()
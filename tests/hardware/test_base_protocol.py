@@ -0,0 +1,285 @@
+"""Tests for the hardware.base_protocol module."""
+import threading
+
+import pytest
+
+from sigmadsp.hardware.base_protocol import (
+    BaseProtocol,
+    Priority,
+    ReadOperation,
+    WriteOperation,
+)
+from sigmadsp.hardware.memory import MemoryMap, MemoryRegion
+
+
+class MemoryProtocol(BaseProtocol):
+    """A protocol handler that stores written data in memory, one byte per address."""
+
+    def _initialize(self, bus: int = 0, device: int = 0):
+        """Allocate the memory."""
+        self.memory = bytearray(0x10000)
+
+    def _read(self, address: int, length: int) -> bytes:
+        """Read from memory."""
+        if address + length > len(self.memory):
+            raise ValueError("Read beyond the end of memory.")
+
+        return bytes(self.memory[address : address + length])
+
+    def _write(self, address: int, data: bytes):
+        """Write to memory."""
+        self.memory[address : address + len(data)] = data
+
+
+def test_write_read():
+    """Test that reads observe previous writes."""
+    protocol = MemoryProtocol()
+
+    protocol.write(0x100, b"\x01\x02\x03\x04").result(timeout=1)
+    assert protocol.read(0x100, 4) == b"\x01\x02\x03\x04"
+
+
+def test_submit_ordering():
+    """Test that submitted operations execute in order and resolve their futures."""
+    protocol = MemoryProtocol()
+
+    futures = protocol.submit(
+        [
+            WriteOperation(0x10, b"\xaa\xbb"),
+            ReadOperation(0x10, 2),
+            WriteOperation(0x10, b"\xcc"),
+            ReadOperation(0x10, 2),
+        ]
+    )
+
+    assert [future.result(timeout=1) for future in futures] == [None, b"\xaa\xbb", None, b"\xcc\xbb"]
+
+
+def test_failed_operation():
+    """Test that errors are delivered through the future, and the handler thread keeps running."""
+    protocol = MemoryProtocol()
+
+    with pytest.raises(ValueError):
+        protocol.read(0xFFFF, 2)
+
+    assert protocol.read(0, 1) == b"\x00"
+
+
+def test_concurrent_callers():
+    """Test that concurrent threads each read back what they wrote."""
+    protocol = MemoryProtocol()
+    errors = []
+
+    def worker(index: int):
+        """Write and read back a separate memory area."""
+        address = index * 0x100
+
+        for value in range(100):
+            data = bytes([index, value]) * 4
+            protocol.write(address, data)
+
+            if protocol.read(address, len(data)) != data:
+                errors.append((index, value))
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+
+
+def test_transaction():
+    """Test that operations within a transaction are submitted as a single batch, when the context is left."""
+    protocol = MemoryProtocol()
+    batches = []
+
+    def transfer(operations):
+        """Record the batch, then transfer it."""
+        batches.append(len(operations))
+        return [protocol._transfer_single(operation) for operation in operations]
+
+    protocol._transfer = transfer
+
+    with protocol.transaction():
+        protocol.write(0x20, b"\x01\x02")
+
+        with protocol.transaction():
+            protocol.write(0x22, b"\x03")
+
+        future = protocol.read_async(0x20, 3)
+
+        with pytest.raises(RuntimeError):
+            protocol.read(0x20, 3)
+
+    assert future.result(timeout=1) == b"\x01\x02\x03"
+    assert batches == [3]
+
+
+def test_transaction_discarded():
+    """Test that a transaction, which is left with an exception, is not submitted."""
+    protocol = MemoryProtocol()
+
+    with pytest.raises(KeyError):
+        with protocol.transaction():
+            protocol.write(0x30, b"\xff")
+            raise KeyError
+
+    assert protocol.read(0x30, 1) == b"\x00"
+
+
+def test_write_coalescing():
+    """Test that queued coalescing writes to contiguous addresses are merged, but not across other operations."""
+    protocol = MemoryProtocol(memory_map=MemoryMap([MemoryRegion("memory", 0x0000, 0x00FF, 4)]))
+    batches = []
+    release = threading.Event()
+
+    def transfer(operations):
+        """Block until released, then record and transfer the batch."""
+        release.wait(timeout=1)
+        batches.append([(operation.address, len(getattr(operation, "data", b""))) for operation in operations])
+        return [protocol._transfer_single(operation) for operation in operations]
+
+    protocol._transfer = transfer
+
+    # Occupies the handler thread, while the following operations are queued.
+    protocol.write(0x80, b"\x00" * 4)
+
+    futures = [
+        protocol.write(0x10, b"\x01" * 8, coalesce=True),
+        protocol.write(0x12, b"\x02" * 4, coalesce=True),
+        protocol.write(0x13, b"\x03" * 4, coalesce=True),
+        protocol.read_async(0x10, 16),
+        protocol.write(0x14, b"\x04" * 4, coalesce=True),
+        protocol.write(0x15, b"\x05" * 4),
+    ]
+
+    release.set()
+
+    assert futures[3].result(timeout=1) == b"\x01" * 8 + b"\x02" * 4 + b"\x03" * 4
+
+    for future in futures:
+        future.result(timeout=1)
+
+    assert batches == [[(0x80, 4)], [(0x10, 16)], [(0x10, 0)], [(0x14, 4)], [(0x15, 4)]]
+
+
+def test_priority_lanes():
+    """Test that queued batches are served by priority, and in order within each priority."""
+    protocol = MemoryProtocol()
+    batches = []
+    release = threading.Event()
+
+    def transfer(operations):
+        """Block until released, then record and transfer the batch."""
+        release.wait(timeout=1)
+        batches.append(operations[0].address)
+        return [protocol._transfer_single(operation) for operation in operations]
+
+    protocol._transfer = transfer
+
+    # Occupies the handler thread, while the following operations are queued.
+    protocol.write(0x00, b"\x00")
+
+    with protocol.priority(Priority.BULK):
+        protocol.write(0x01, b"\x01")
+
+    protocol.submit([WriteOperation(0x02, b"\x02")], priority=Priority.POLLING)
+    protocol.write(0x03, b"\x03")
+    future = protocol.write(0x04, b"\x04")
+
+    release.set()
+    future.result(timeout=1)
+    protocol.read(0x00, 1)
+
+    assert batches == [0x00, 0x03, 0x04, 0x02, 0x01, 0x00]
+
+
+def test_preemption():
+    """Test that interactive operations are executed between the chunks of a long bulk transfer."""
+
+    class ChunkingProtocol(MemoryProtocol):
+        """Writes in chunks of 16 bytes, and allows preemption between them."""
+
+        def _write(self, address: int, data: bytes):
+            """Write to memory in chunks."""
+            for offset in range(0, len(data), 16):
+                writes.append(address + offset)
+                super()._write(address + offset, data[offset : offset + 16])
+
+                if not interactive:
+                    # Queue an interactive write, while the bulk write is in progress.
+                    interactive.append(protocol.write(0x1000, b"\xff"))
+
+                self._preempt()
+
+    writes = []
+    interactive = []
+    protocol = ChunkingProtocol()
+
+    with protocol.priority(Priority.BULK):
+        protocol.write(0x0000, b"\x01" * 64).result(timeout=1)
+
+    interactive[0].result(timeout=1)
+
+    assert writes == [0x0000, 0x1000, 0x0010, 0x0020, 0x0030]
+
+
+def test_metrics():
+    """Test that executed operations are counted."""
+    protocol = MemoryProtocol()
+
+    protocol.write(0x40, b"\x00" * 8)
+    protocol.read(0x40, 4)
+
+    with protocol.transaction():
+        protocol.write(0x40, b"\x00" * 2)
+        protocol.write(0x50, b"\x00" * 2)
+
+    protocol.read(0x40, 4)
+
+    snapshot = protocol.metrics.snapshot()
+
+    assert snapshot.counters["writes"] == 3
+    assert snapshot.counters["bytes_written"] == 12
+    assert snapshot.counters["transactions"] == 1
+    assert snapshot.latencies["read"].count == 2
+    assert snapshot.latencies["queue_wait"].count == 4
+
+
+def test_verify_writes():
+    """Test that corrupted chunks of a verified write are rewritten, and persistent corruption fails the write."""
+
+    class CorruptingProtocol(MemoryProtocol):
+        """Corrupts the byte at a certain address, for a number of writes."""
+
+        corruptions = 0
+
+        def _write(self, address: int, data: bytes):
+            """Write to memory, then corrupt it."""
+            super()._write(address, data)
+            writes.append((address, len(data)))
+
+            if address <= 0x0500 < address + len(data) and self.corruptions:
+                self.memory[0x0500] ^= 0xFF
+                self.corruptions -= 1
+
+    writes = []
+    protocol = CorruptingProtocol(memory_map=MemoryMap([MemoryRegion("memory", 0x0000, 0x0FFF, 1)]))
+    protocol.verify_writes = True
+
+    protocol.corruptions = 2
+    protocol.write(0x0000, bytes(range(256)) * 12).result(timeout=1)
+
+    assert writes == [(0x0000, 3072), (0x0400, 1024), (0x0400, 1024)]
+    assert protocol.read(0x0500, 1) == b"\x00"
+
+    protocol.corruptions = BaseProtocol.VERIFY_RETRIES + 1
+
+    with pytest.raises(OSError):
+        protocol.write(0x0000, bytes(range(256)) * 12).result(timeout=1)
+
+    assert protocol.metrics.snapshot().counters["verify_failures"] == 1
@@ -0,0 +1,55 @@
+"""Tests for the hardware.gpio_events module."""
+import queue
+
+from gpiozero import Device
+from gpiozero.pins.mock import MockFactory
+
+from sigmadsp.hardware.dsp import InputPin
+from sigmadsp.hardware.gpio_events import GpioEventBus, PinEvent
+
+
+def test_edges():
+    """Test that pin edges are dispatched to subscribers, apart from repeated states."""
+    Device.pin_factory = MockFactory()
+
+    pin = InputPin("fault", 5, False, None, None, on_active="mute")
+    bus = GpioEventBus()
+    events: "queue.Queue[PinEvent]" = queue.Queue()
+
+    bus.attach(pin)
+    bus.subscribe("fault", events.put)
+
+    pin.control.pin.drive_high()
+    pin.control.pin.drive_low()
+    bus.edge("fault", False)
+
+    assert events.get(timeout=1).active
+    assert not events.get(timeout=1).active
+    assert events.empty()
+
+
+def test_debouncing():
+    """Test that bouncing edges are suppressed, and the state settles after the bounce time."""
+    Device.pin_factory = MockFactory()
+
+    pin = InputPin("clip", 6, False, None, 0.05)
+    bus = GpioEventBus()
+    events: "queue.Queue[PinEvent]" = queue.Queue()
+
+    assert pin.control.pin.bounce == 0.05
+
+    bus.attach(pin)
+    bus.subscribe("clip", events.put)
+
+    # Edges are only debounced by the bus.
+    assert pin.control.pin.bounce is None
+
+    for _ in range(3):
+        bus.edge("clip", True)
+        bus.edge("clip", False)
+
+    assert events.get(timeout=1).active
+
+    # The pin is still inactive after the bounce time, which is reported.
+    assert not events.get(timeout=1).active
+    assert events.empty()
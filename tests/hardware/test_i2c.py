@@ -0,0 +1,104 @@
+"""Tests for the hardware.i2c module."""
+import ctypes
+from typing import Dict, List, Tuple
+
+import pytest
+from smbus2.smbus2 import I2C_M_RD, i2c_msg
+
+from sigmadsp.hardware.adau1701 import Adau1701
+from sigmadsp.hardware.i2c import I2C
+from sigmadsp.hardware.memory import MemoryMap
+
+
+class FakeSMBus:
+    """Stands in for smbus2.SMBus, with a word-addressed memory behind I2C_RDWR."""
+
+    def __init__(self, memory_map: MemoryMap):
+        """Create an empty memory."""
+        self.memory_map = memory_map
+        self.memory: Dict[int, bytes] = {}
+
+        # The messages of each I2C_RDWR call, as (flags, register address, length)
+        self.calls: List[List[Tuple[int, int, int]]] = []
+
+    def i2c_rdwr(self, *messages: i2c_msg):
+        """Execute messages, where each starts at the register address of the last written message."""
+        call = []
+        address = 0
+
+        for message in messages:
+            if message.flags & I2C_M_RD:
+                data = bytearray()
+                word_address = address
+
+                while len(data) < message.len:
+                    data += self.memory.get(word_address, bytes(self.memory_map.word_length(word_address)))
+                    word_address += 1
+
+                ctypes.memmove(message.buf, bytes(data[: message.len]), message.len)
+                call.append((message.flags, address, message.len))
+
+            else:
+                content = bytes(message)
+                address = int.from_bytes(content[: I2C.ADDRESS_LENGTH], "big")
+                word_address = address
+                offset = I2C.ADDRESS_LENGTH
+
+                while offset < len(content):
+                    word_length = self.memory_map.word_length(word_address)
+                    self.memory[word_address] = content[offset : offset + word_length]
+                    offset += word_length
+                    word_address += 1
+
+                call.append((message.flags, address, message.len))
+
+        self.calls.append(call)
+
+
+class FakeI2C(I2C):
+    """An I2C handler on a fake bus."""
+
+    def _initialize(self, bus: int = 1, device: int = 0x38):
+        """Set up the fake bus instead of hardware."""
+        self.bus = FakeSMBus(self.memory_map)
+        self.i2c_addr = device
+
+
+def test_max_transfer_bytes():
+    """Test that message sizes beyond the limit of i2c-dev are rejected."""
+    with pytest.raises(ValueError):
+        FakeI2C(max_transfer_bytes=I2C.MAX_TRANSFER_BYTES + 1)
+
+
+def test_chunk_boundaries():
+    """Test that transfers are split at word boundaries, with the register address advancing per chunk."""
+    i2c = FakeI2C(max_transfer_bytes=64, memory_map=Adau1701.MEMORY_MAP)
+    program = bytes(index % 251 for index in range(500))
+
+    i2c.write(0x0400, program).result(timeout=1)
+
+    # 12 words of program memory (5 bytes) fit into 62 bytes.
+    (call,) = i2c.bus.calls
+    assert [address for _, address, _ in call] == [0x0400 + 12 * index for index in range(9)]
+    assert [length for _, _, length in call] == 8 * [2 + 60] + [2 + 20]
+
+    assert i2c.read(0x0400, len(program)) == program
+
+
+def test_message_limit():
+    """Test that transfers with many chunks use several ioctls, without splitting the messages of a chunk."""
+    i2c = FakeI2C(max_transfer_bytes=10, memory_map=Adau1701.MEMORY_MAP)
+    parameters = bytes(index % 253 for index in range(800))
+
+    # 2 words of parameter memory (4 bytes) fit into 8 bytes.
+    i2c.write(0x0000, parameters).result(timeout=1)
+
+    assert [len(call) for call in i2c.bus.calls] == [42, 42, 16]
+    assert i2c.bus.calls[1][0][1] == 2 * 42
+
+    i2c.bus.calls.clear()
+
+    # Reads take two messages per chunk, the register address and the data.
+    assert i2c.read(0x0000, len(parameters)) == parameters
+    assert [len(call) for call in i2c.bus.calls] == [42, 42, 42, 42, 32]
+    assert i2c.bus.calls[0][:2] == [(0, 0x0000, 2), (I2C_M_RD, 0x0000, 8)]
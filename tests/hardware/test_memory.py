@@ -0,0 +1,33 @@
+"""Tests for the hardware.memory module."""
+import pytest
+
+from sigmadsp.hardware.adau1701 import Adau1701
+from sigmadsp.hardware.memory import MemoryMap, MemoryRegion
+
+
+def test_word_length():
+    """Test the lookup of word lengths, including unmapped addresses."""
+    memory_map = Adau1701.MEMORY_MAP
+
+    assert memory_map.word_length(0x0010) == 4
+    assert memory_map.word_length(0x0400) == 5
+    assert memory_map.word_length(0x081C) == 2
+    assert memory_map.word_length(0x2000) == MemoryMap.DEFAULT_WORD_LENGTH
+
+
+@pytest.mark.parametrize("address,max_bytes,expected", [(0x0000, 4094, (4092, 1023)), (0x0400, 4094, (4090, 818))])
+def test_chunk_size(address: int, max_bytes: int, expected: tuple):
+    """Test that chunks consist of whole words.
+
+    Args:
+        address (int): The start address of the chunk.
+        max_bytes (int): The maximum number of bytes per transfer.
+        expected (tuple): The expected chunk size in bytes and words.
+    """
+    assert Adau1701.MEMORY_MAP.chunk_size(address, max_bytes) == expected
+
+
+def test_overlap():
+    """Test that overlapping regions are rejected."""
+    with pytest.raises(ValueError):
+        MemoryMap([MemoryRegion("a", 0x0000, 0x00FF, 4), MemoryRegion("b", 0x00F0, 0x01FF, 4)])
@@ -0,0 +1,42 @@
+"""Tests for the hardware.metrics module."""
+import time
+
+from sigmadsp.hardware.metrics import BusMetrics, LatencyHistogram
+
+
+def test_bucket_bounds():
+    """Test that every value falls into a bucket, whose lower bound is within the guaranteed relative error."""
+    for value_us in range(100000):
+        lower_bound = LatencyHistogram.bucket_value(LatencyHistogram.bucket_index(value_us))
+
+        assert lower_bound <= value_us
+        assert value_us - lower_bound <= value_us / LatencyHistogram.SUB_BUCKETS
+
+
+def test_percentiles():
+    """Test the summary of a histogram."""
+    histogram = LatencyHistogram()
+
+    for value_us in range(1, 101):
+        histogram.record(value_us * 1e-6)
+
+    summary = histogram.summary()
+
+    assert summary.count == 100
+    assert summary.mean_us == 50.5
+    assert summary.p50_us == 50
+    assert summary.p99_us == 96
+    assert summary.max_us == 100
+
+
+def test_utilization(monkeypatch):
+    """Test that busy time within the utilization window is counted, and older busy time is not."""
+    metrics = BusMetrics()
+
+    metrics.busy(0.0, 1.0)
+    metrics.busy(1000.0, 1000.5)
+    metrics.busy(1005.25, 1005.75)
+
+    monkeypatch.setattr(time, "monotonic", lambda: 1010.5)
+
+    assert metrics.utilization() == 1.0 / BusMetrics.UTILIZATION_WINDOW_S
@@ -0,0 +1,89 @@
+"""Tests for the hardware.polling module."""
+import sched
+import struct
+import threading
+import time
+from typing import Dict, List
+
+from sigmadsp.hardware.adau14xx import Adau14xx
+from sigmadsp.hardware.base_protocol import Priority
+from sigmadsp.hardware.polling import MeterPoller, group_ranges
+from sigmadsp.hardware.ramp import RampEngine
+from sigmadsp.helper.conversion import float_to_frac_8_24
+from sigmadsp.helper.parser import Cell
+
+
+def test_group_ranges():
+    """Test that addresses are grouped into the fewest ranges, bridging small gaps."""
+    assert group_ranges([5, 3, 4, 10, 4]) == [(3, 3), (10, 1)]
+    assert group_ranges([5, 3, 4, 10], max_gap_words=4) == [(3, 8)]
+    assert not group_ranges([])
+
+
+def test_meter_poller():
+    """Test that meter cells are read in a single transfer, and published to subscribers."""
+    dsp = Adau14xx({"dsp": {"type": "adau14xx", "protocol": "sim", "bus_number": 0, "device_address": 0}})
+    scheduler = sched.scheduler(time.time, time.sleep)
+    cells = [Cell(f"meter_{index}", 0x0200 + 2 * index, "SingleBandLevelRead", None) for index in range(4)]
+
+    for index, cell in enumerate(cells):
+        # Meter values may be negative, e.g. in dB.
+        dsp.write(cell.parameter_address, struct.pack(">i", float_to_frac_8_24(-0.25 * index)))
+
+    poller = MeterPoller(dsp, scheduler, cells, rate_hz=100, max_gap_words=1)
+    reads = dsp.protocol_handler.metrics.snapshot().counters["reads"]
+
+    assert poller.poll() == {cell: -0.25 * index for index, cell in enumerate(cells)}
+    assert dsp.protocol_handler.metrics.snapshot().counters["reads"] == reads + 1
+
+    received: List[Dict[Cell, float]] = []
+
+    def subscriber(values: Dict[Cell, float]):
+        received.append(values)
+
+        if len(received) == 3:
+            poller.unsubscribe(subscriber)
+
+    poller.subscribe(subscriber)
+
+    # Runs until the subscriber leaves, which stops polling.
+    scheduler.run()
+
+    assert len(received) == 3
+    assert received[-1][cells[3]] == -0.75
+
+
+def test_meter_poller_does_not_block_scheduler():
+    """Test that pending polls do not stall ramps on the same scheduler, while other bus traffic is in flight."""
+    dsp = Adau14xx(
+        {"dsp": {"type": "adau14xx", "protocol": "sim", "bus_number": 0, "device_address": 0, "sim_byte_time_us": 100}}
+    )
+    scheduler = sched.scheduler(time.time, time.sleep)
+    poller = MeterPoller(dsp, scheduler, [Cell("meter", 0x0200, "SingleBandLevelRead", None)], rate_hz=100)
+    engine = RampEngine(dsp, scheduler, tick_s=0.005)
+
+    # Takes about 0.5 s on the simulated bus, which delays all polling reads.
+    with dsp.priority(Priority.SIGMASTUDIO):
+        write = dsp.write(0x1000, bytes(5000))
+
+    received: List[Dict[Cell, float]] = []
+    poller.subscribe(received.append)
+    engine.ramp({0x0100: 0.5}, 0.05)
+
+    thread = threading.Thread(target=scheduler.run, daemon=True)
+    thread.start()
+
+    deadline = time.time() + 0.3
+
+    while engine.active() and time.time() < deadline:
+        time.sleep(0.005)
+
+    assert not engine.active()
+    assert not write.done()
+
+    write.result()
+    poller.unsubscribe(received.append)
+    thread.join(timeout=1)
+
+    assert not thread.is_alive()
+    assert dsp.get_parameter_value(0x0100, "float") == 0.5
@@ -0,0 +1,64 @@
+"""Tests for the hardware.ramp module."""
+import sched
+import time
+
+import pytest
+
+from sigmadsp.hardware.adau14xx import Adau14xx
+from sigmadsp.hardware.ramp import Curve, Ramp, RampEngine
+
+
+def test_ramp_curves():
+    """Test the values of ramps with different curves, at start, half-way and end."""
+    linear = Ramp(0.0, 1.0, 0.0, 2.0, Curve.LINEAR)
+    s_curve = Ramp(0.0, 1.0, 0.0, 2.0, Curve.S_CURVE)
+    db_linear = Ramp(1.0, 0.01, 0.0, 2.0, Curve.DB_LINEAR)
+
+    assert linear.value(0.0) == 0.0
+    assert linear.value(1.0) == 0.5
+    assert linear.value(0.5) == 0.25
+    assert linear.value(3.0) == 1.0
+
+    assert s_curve.value(1.0) == 0.5
+    assert s_curve.value(0.5) == pytest.approx(0.15625)
+
+    # Half-way between 0 dB and -40 dB is -20 dB.
+    assert db_linear.value(1.0) == pytest.approx(0.1)
+    assert db_linear.value(2.0) == 0.01
+
+    # Ramps without duration reach their target immediately.
+    assert Ramp(0.0, 1.0, 0.0, 0.0, Curve.LINEAR).value(0.0) == 1.0
+
+
+def test_ramp_engine():
+    """Test that the ramp engine drives parameters of a simulated DSP to their targets."""
+    dsp = Adau14xx({"dsp": {"type": "adau14xx", "protocol": "sim", "bus_number": 0, "device_address": 0}})
+    scheduler = sched.scheduler(time.time, time.sleep)
+    engine = RampEngine(dsp, scheduler, tick_s=0.005)
+
+    dsp.set_parameter_value(1.0, 0x0100)
+    engine.ramp({0x0100: 0.25, 0x0101: 0.5}, 0.05, Curve.S_CURVE)
+
+    assert engine.active() == {0x0100: 0.25, 0x0101: 0.5}
+
+    # Runs until the last tick, which does not reschedule.
+    scheduler.run()
+
+    assert not engine.active()
+    assert dsp.get_parameter_value(0x0100, "float") == 0.25
+    assert dsp.get_parameter_value(0x0101, "float") == 0.5
+
+
+def test_ramp_engine_contiguous_safeloads():
+    """Test that each run of contiguous parameters is sent with a single multi-word safeload per tick."""
+    dsp = Adau14xx({"dsp": {"type": "adau14xx", "protocol": "sim", "bus_number": 0, "device_address": 0}})
+    scheduler = sched.scheduler(time.time, time.sleep)
+    engine = RampEngine(dsp, scheduler)
+    targets = {0x0100: 0.25, 0x0101: 0.5, 0x0102: 0.75, 0x0200: 1.0}
+
+    # Ramps without duration finish with the first tick.
+    engine.ramp(targets, 0.0)
+    scheduler.run()
+
+    assert {address: dsp.get_parameter_value(address, "float") for address in targets} == targets
+    assert dsp.protocol_handler.metrics.snapshot().latencies["safeload"].count == 2
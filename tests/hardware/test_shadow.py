@@ -0,0 +1,37 @@
+"""Tests for the hardware.shadow module."""
+from sigmadsp.hardware.memory import MemoryRegion
+from sigmadsp.hardware.shadow import ParameterShadow
+
+
+def test_store_load():
+    """Test that stored words are loaded, and ranges with unknown words are not."""
+    shadow = ParameterShadow([MemoryRegion("parameters", 0x0000, 0x00FF, 4)])
+
+    shadow.store(0x10, b"\x01\x02\x03\x04\x05\x06\x07\x08")
+
+    assert shadow.load(0x10, 8) == b"\x01\x02\x03\x04\x05\x06\x07\x08"
+    assert shadow.load(0x11, 4) == b"\x05\x06\x07\x08"
+    assert shadow.load(0x11, 8) is None
+
+    # Partial words and ranges beyond the region are not shadowed.
+    shadow.store(0x20, b"\x01\x02")
+    shadow.store(0xFF, b"\x00" * 8)
+
+    assert shadow.load(0x20, 2) is None
+    assert shadow.load(0xFF, 4) is None
+
+
+def test_invalidate():
+    """Test that invalidation forgets a range, or all words."""
+    shadow = ParameterShadow([MemoryRegion("parameters", 0x0000, 0x00FF, 4)])
+
+    shadow.store(0x10, b"\x00" * 12)
+    shadow.invalidate(0x11, 4)
+
+    assert shadow.load(0x10, 4) == b"\x00" * 4
+    assert shadow.load(0x11, 4) is None
+    assert shadow.load(0x12, 4) == b"\x00" * 4
+
+    shadow.invalidate()
+
+    assert shadow.load(0x10, 4) is None
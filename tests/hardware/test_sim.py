@@ -0,0 +1,228 @@
+"""Tests for the hardware.sim module, together with the DSP classes that use it."""
+from typing import Dict
+
+import pytest
+from gpiozero import Device
+from gpiozero.pins.mock import MockFactory
+
+from sigmadsp.hardware.adau14xx import Adau14xx
+from sigmadsp.hardware.adau1701 import Adau1701
+from sigmadsp.hardware.base_protocol import BaseProtocol
+from sigmadsp.hardware.dsp import ConfigurationError, HandlerKey, Pin
+from sigmadsp.hardware.sim import Simulator
+from sigmadsp.hardware.snapshot import Snapshot, SnapshotError
+from sigmadsp.helper.export import ExportedWrite
+
+
+def simulated_config(dsp_type: str) -> dict:
+    """Build a configuration for a simulated DSP."""
+    return {"dsp": {"type": dsp_type, "protocol": "sim", "bus_number": 0, "device_address": 0}}
+
+
+def test_adau14xx_safeload():
+    """Test that ADAU14xx software safeload writes to the target address."""
+    dsp = Adau14xx(simulated_config("adau14xx"))
+
+    assert isinstance(dsp.protocol_handler, Simulator)
+
+    # The soft reset on startup leaves the DSP running.
+    assert dsp.read(Adau14xx.RESET_REGISTER, Adau14xx.RESET_REGISTER_LENGTH) == b"\x00\x01"
+    assert dsp.protocol_handler.reset_count == 1
+
+    dsp.set_parameter_value(0.5, 0x0100)
+
+    assert dsp.get_parameter_value(0x0100, "float") == 0.5
+
+
+def test_adau1701_safeload():
+    """Test that ADAU1701 hardware safeload writes to the target address, and clears the IST bit."""
+    dsp = Adau1701(simulated_config("adau1701"))
+
+    dsp.set_parameter_value(0.25, 0x0010)
+
+    assert dsp.get_parameter_value(0x0010, "float") == 0.25
+    assert dsp.read(Adau1701.CONTROL_REGISTER, Adau1701.CONTROL_REGISTER_LENGTH) == b"\x00\x00"
+
+
+def test_unmapped_address():
+    """Test that accesses to unmapped addresses fail."""
+    simulator = Simulator(memory_map=Adau14xx.MEMORY_MAP)
+
+    with pytest.raises(OSError):
+        simulator.read(0x5000, 4)
+
+    with pytest.raises(ValueError):
+        simulator.write(0x0000, b"\x00\x00").result(timeout=1)
+
+
+def test_adau14xx_multi_word_safeload():
+    """Test that safeloads with more words than safeload registers are split, and arrive completely."""
+    dsp = Adau14xx(simulated_config("adau14xx"))
+    data = bytes(range(48))
+
+    # Within a single batch, only the bus holds between the safeloads let the DSP apply each of them.
+    with dsp.transaction():
+        dsp.safeload(0x0200, data)
+
+    assert dsp.read(0x0200, len(data)) == data
+
+
+def test_adau14xx_safeload_frame_boundary():
+    """Test that safeloads are applied at frame boundaries, such that a safeload without hold overwrites the last."""
+    dsp = Adau14xx(simulated_config("adau14xx"))
+    protocol_handler = dsp.protocol_handler
+
+    def raw_safeload(address: int, value: int, hold_s: float):
+        protocol_handler.write(Adau14xx.SAFELOAD_DATA_REGISTERS[0], value.to_bytes(4, "big"))
+        protocol_handler.write(Adau14xx.SAFELOAD_ADDRESS_REGISTER, address.to_bytes(4, "big"))
+        protocol_handler.write(Adau14xx.SAFELOAD_COUNT_REGISTER, (1).to_bytes(4, "big"), hold_s=hold_s)
+
+    with dsp.transaction():
+        raw_safeload(0x0300, 1, hold_s=0)
+        raw_safeload(0x0301, 2, hold_s=0)
+
+    assert dsp.read(0x0300, 8) == bytes(4) + (2).to_bytes(4, "big")
+
+    with dsp.transaction():
+        raw_safeload(0x0302, 3, hold_s=dsp.frame_s)
+        raw_safeload(0x0303, 4, hold_s=dsp.frame_s)
+
+    assert dsp.read(0x0302, 8) == (3).to_bytes(4, "big") + (4).to_bytes(4, "big")
+
+
+def test_adau1701_control_register_shadow():
+    """Test that ADAU1701 safeloads read the control register only once, and arrive completely."""
+    dsp = Adau1701(simulated_config("adau1701"))
+    data = bytes(range(1, 49))
+
+    dsp.safeload(0x0100, data)
+    dsp.safeload(0x0100 + len(data) // 4, data)
+
+    assert dsp.read(0x0100, 2 * len(data)) == 2 * data
+    assert dsp.protocol_handler.metrics.snapshot().counters["reads"] == 2
+
+
+def test_parameter_shadow_overlapping_writes():
+    """Test that completing writes do not put older values back into the parameter shadow."""
+    config = simulated_config("adau14xx")
+    config["dsp"].update({"parameter_shadow": True, "sim_byte_time_us": 5000})
+    dsp = Adau14xx(config)
+
+    first = dsp.write(0x0100, dsp.encode_parameter_values([0.5]))
+    second = dsp.write(0x0100, dsp.encode_parameter_values([0.25]))
+
+    # The first write completes, while the second one is still in flight.
+    first.result(timeout=1)
+    assert not second.done()
+    assert dsp.get_parameter_value(0x0100, "float", cached=True) == 0.25
+
+    second.result(timeout=1)
+    assert dsp.get_parameter_value(0x0100, "float", cached=True) == 0.25
+
+
+def test_adau14xx_deploy():
+    """Test that deployments only rewrite memory regions that changed."""
+    dsp = Adau14xx(simulated_config("adau14xx"))
+    program = ExportedWrite(0xC000, bytes(range(1, 41)))
+    parameters = ExportedWrite(0x0000, bytes(range(41, 81)))
+    start_core = ExportedWrite(0xF402, b"\x00\x01")
+
+    assert dsp.deploy([program, parameters, start_core]) == ["program memory", "data memory 0"]
+    assert dsp.read(0xC000, 40) == program.data
+
+    # Changes to parameters, e.g. by volume control, are undone by the next deployment.
+    dsp.write(0x0000, b"\x00\x00\x00\x00")
+
+    assert dsp.deploy([program, parameters, start_core]) == ["data memory 0"]
+    assert dsp.read(0x0000, 40) == parameters.data
+    assert dsp.deploy([program, parameters, start_core]) == []
+
+    # Without a reset pin, the DSP is soft-reset, which keeps the memories.
+    dsp.hard_reset()
+
+    assert dsp.deploy([program, parameters, start_core]) == []
+    assert dsp.deploy([program, parameters, start_core], force=True) == ["program memory", "data memory 0"]
+
+
+def test_adau1701_snapshot_restore():
+    """Test that a snapshot restores memories and registers on another DSP, and survives serialization."""
+    dsp = Adau1701(simulated_config("adau1701"))
+    dsp.write(0x0400, bytes(range(1, 51)))
+    dsp.write(0x0000, bytes(range(51, 91)))
+    dsp.write(Adau1701.CONTROL_REGISTER, b"\x00\x1c")
+
+    snapshot = Snapshot.from_bytes(dsp.snapshot().to_bytes())
+
+    restored_dsp = Adau1701(simulated_config("adau1701"))
+    restored_dsp.restore(snapshot)
+
+    assert restored_dsp.read(0x0400, 50) == bytes(range(1, 51))
+    assert restored_dsp.read(0x0000, 40) == bytes(range(51, 91))
+    assert restored_dsp.read(Adau1701.CONTROL_REGISTER, 2) == b"\x00\x1c"
+
+    with pytest.raises(SnapshotError):
+        Adau14xx(simulated_config("adau14xx")).restore(snapshot)
+
+
+def test_adau14xx_snapshot_restore():
+    """Test that a snapshot restores the clock setup before the memories, on a DSP that was just powered on."""
+    dsp = Adau14xx(simulated_config("adau14xx"))
+    dsp.write(0xF000, b"\x00\x60\x00\x02\x00\x01")
+    dsp.write(0xF050, b"\x1f\xff\x00\x0f")
+    dsp.write(0xC000, bytes(range(1, 41)))
+    dsp.write(0x0000, bytes(range(41, 81)))
+    dsp.write(0xF200, b"\x00\x02")
+    dsp.write(0xF402, b"\x00\x01")
+
+    snapshot = dsp.snapshot()
+    simulator = dsp.protocol_handler
+
+    assert isinstance(simulator, Simulator)
+
+    # Memories are inaccessible without a locked PLL.
+    simulator.power_cycle()
+
+    with pytest.raises(OSError):
+        dsp.read(0xC000, 4)
+
+    dsp.restore(snapshot)
+
+    assert dsp.read(0xC000, 40) == bytes(range(1, 41))
+    assert dsp.read(0x0000, 40) == bytes(range(41, 81))
+    assert dsp.read(0xF000, 8) == b"\x00\x60\x00\x02\x00\x01\x00\x01"
+    assert dsp.read(0xF050, 4) == b"\x1f\xff\x00\x0f"
+    assert dsp.read(0xF200, 2) == b"\x00\x02"
+
+    # The core is started again, neither hibernating nor killed.
+    assert dsp.read(0xF400, 8) == b"\x00\x00\x00\x00\x00\x01\x00\x00"
+
+    # Snapshots without the clock and power setup cannot be restored.
+    snapshot.blocks = [(address, data) for address, data in snapshot.blocks if address != 0xF050]
+
+    with pytest.raises(SnapshotError):
+        dsp.restore(snapshot)
+
+
+def test_shared_handlers_and_pins():
+    """Test that DSPs share protocol handlers on the same bus and device, and pins with the same number."""
+    Device.pin_factory = MockFactory()
+
+    shared_handlers: Dict[HandlerKey, BaseProtocol] = {}
+    shared_pins: Dict[int, Pin] = {}
+
+    def config(device_address: int, reset_active_high: bool = True) -> dict:
+        reset = {"mode": "output", "number": 17, "initial_state": False, "active_high": reset_active_high}
+        return {
+            "dsp": {**simulated_config("adau14xx")["dsp"], "device_address": device_address, "pins": {"reset": reset}}
+        }
+
+    first = Adau14xx(config(0), shared_handlers, shared_pins)
+    second = Adau14xx(config(0), shared_handlers, shared_pins)
+    third = Adau14xx(config(1), shared_handlers, shared_pins)
+
+    assert first.protocol_handler is second.protocol_handler
+    assert first.protocol_handler is not third.protocol_handler
+    assert first.get_pin_by_name("reset") is third.get_pin_by_name("reset")
+
+    with pytest.raises(ConfigurationError):
+        Adau14xx(config(2, reset_active_high=False), shared_handlers, shared_pins)
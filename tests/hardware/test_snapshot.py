@@ -0,0 +1,27 @@
+"""Tests for the hardware.snapshot module."""
+import pytest
+
+from sigmadsp.hardware.snapshot import Snapshot, SnapshotError
+
+
+def test_serialization():
+    """Test that snapshots are restored from their serialization, which is compact."""
+    snapshot = Snapshot("adau14xx", [(0xC000, bytes(8192)), (0xF401, b"\x00\x01\x00\x01")])
+    content = snapshot.to_bytes()
+
+    assert len(content) < 200
+    assert Snapshot.from_bytes(content) == snapshot
+
+
+def test_corruption():
+    """Test that corrupted snapshots are rejected."""
+    content = bytearray(Snapshot("adau1701", [(0x0000, bytes(range(40)))]).to_bytes())
+
+    with pytest.raises(SnapshotError):
+        Snapshot.from_bytes(bytes(content[:-4]))
+
+    # A flipped checksum bit
+    content[5] ^= 0x01
+
+    with pytest.raises(SnapshotError):
+        Snapshot.from_bytes(bytes(content))
@@ -0,0 +1,79 @@
+"""Tests for the hardware.spi module."""
+from typing import Dict, List, Set
+
+from sigmadsp.hardware.base_protocol import WriteOperation
+from sigmadsp.hardware.spi import SPI
+
+
+class FakeSpiDev:
+    """Stands in for spidev.SpiDev, only the speed setting is needed."""
+
+    max_speed_hz = 0
+
+    def fileno(self) -> int:
+        """Get a file descriptor, which is never used."""
+        return -1
+
+
+class MarginalSPI(SPI):
+    """An SPI handler, whose read-back is corrupted above a certain clock speed."""
+
+    # The fastest clock speed, at which data is transferred correctly.
+    LIMIT_HZ = 8000000
+
+    def _initialize(self, bus: int = 0, device: int = 0):
+        """Set up memory instead of hardware."""
+        self.spi = FakeSpiDev()
+        self.spi.max_speed_hz = self._initial_speed_hz
+        self.memory: Dict[int, bytes] = {0x6000: b"\x12\x34\x56\x78"}
+        self.read_speeds_hz: Set[int] = set()
+
+    def _transfer(self, operations):
+        """Transfer operations one by one, without SPI messages."""
+        return [self._transfer_single(operation) for operation in operations]
+
+    def _read(self, address: int, length: int) -> bytes:
+        """Read from memory, with a bit error at excessive speed."""
+        data = bytearray(self.memory[address][:length])
+        self.read_speeds_hz.add(self.speed_hz)
+
+        if self.speed_hz > MarginalSPI.LIMIT_HZ:
+            data[-1] ^= 0x01
+
+        return bytes(data)
+
+    def _write(self, address: int, data: bytes):
+        """Write to memory."""
+        self.memory[address] = bytes(data)
+
+
+def test_speed_limit():
+    """Test that excessive speeds are limited."""
+    assert MarginalSPI(speed_hz=50000000).speed_hz == SPI.MAX_SPEED_HZ
+
+
+def test_calibrate_speed():
+    """Test that calibration selects the fastest reliable speed and restores the scratch register."""
+    spi = MarginalSPI(speed_hz=2000000)
+
+    assert spi.calibrate_speed(0x6000, 4) == MarginalSPI.LIMIT_HZ
+    assert spi.speed_hz == MarginalSPI.LIMIT_HZ
+    assert spi.memory[0x6000] == b"\x12\x34\x56\x78"
+
+    # Speeds beyond the first failing one are never tried.
+    assert max(spi.read_speeds_hz) == 12000000
+
+
+def test_write_hold(monkeypatch):
+    """Test that writes with a hold time delay the next transfer of the same SPI message."""
+    spi = MarginalSPI(speed_hz=2000000)
+    delays: List[List[int]] = []
+
+    def ioctl(_fd, _request, transfers):
+        delays.append([transfer.delay_usecs for transfer in transfers])
+
+    monkeypatch.setattr("sigmadsp.hardware.spi.fcntl.ioctl", ioctl)
+
+    SPI._transfer(spi, [WriteOperation(0x6000, bytes(4), hold_s=20.5e-6), WriteOperation(0x6001, bytes(4))])
+
+    assert delays == [[21, 0]]
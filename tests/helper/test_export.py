@@ -0,0 +1,37 @@
+"""Tests the export module."""
+import pytest
+
+from sigmadsp.helper.export import ExportedWrite, ExportError, load_export, parse_export
+
+TX_BUFFER = """0xF4, 0x03, 0x00, 0x01,
+0x00, 0x10, 0x01, 0x02, 0x03, 0x04,
+0x05, 0x06, 0x07, 0x08,
+"""
+NUM_BYTES = """4,
+10,
+"""
+
+
+def test_parse_export():
+    """Test that an exported buffer is split into writes with addresses."""
+    assert parse_export(TX_BUFFER, NUM_BYTES) == [
+        ExportedWrite(0xF403, b"\x00\x01"),
+        ExportedWrite(0x0010, bytes(range(1, 9))),
+    ]
+
+    with pytest.raises(ExportError):
+        parse_export(TX_BUFFER, "4,\n")
+
+    # Intel HEX images are rejected.
+    with pytest.raises(ExportError):
+        parse_export(":020000040000FA\n:10000000081C0058000000000000000000000000AE\n", NUM_BYTES)
+
+
+def test_load_export(tmp_path):
+    """Test that exported files are read."""
+    tx_buffer_path = tmp_path / "TxBuffer_IC_1.dat"
+    num_bytes_path = tmp_path / "NumBytes_IC_1.dat"
+    tx_buffer_path.write_text(TX_BUFFER, encoding="utf8")
+    num_bytes_path.write_text(NUM_BYTES, encoding="utf8")
+
+    assert len(load_export(str(tx_buffer_path), str(num_bytes_path))) == 2
@@ -1,7 +1,7 @@
 """Tests the parser module."""
 import os
 
-from sigmadsp.helper.parser import Parser
+from sigmadsp.helper.parser import Cell, Parser
 
 TEST_FILE_PATH = os.path.join(os.path.dirname(__file__), "test_parameter_file.params")
 
@@ -40,3 +40,12 @@ def test_parser():
     assert not volume_cell.is_safety_hash
     assert volume_cell.is_volume_cell
     assert volume_cell.name_tokens == ["main"]
+
+
+def test_meter_cell():
+    """Test the detection of meter cells by their name prefix."""
+    meter_cell = Cell("meter_main_left", 300, "SingleBandLevelRead1", None)
+
+    assert meter_cell.is_meter_cell
+    assert not meter_cell.is_volume_cell
+    assert meter_cell.name_tokens == ["main", "left"]